@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Connect model signal handlers
+        from . import signals  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
@@ -0,0 +1,162 @@
+"""Batch create/update/delete of expenses or income in one request.
+
+The request body holds up to ``MAX_BATCH_OPERATIONS`` operations::
+
+    {
+        "create": [{"category_id": 1, "amount": "10.00", "date": "..."}],
+        "update": [{"id": 7, "amount": "12.00"}],
+        "delete": [8, 9]
+    }
+
+Creates and partial updates are validated together by the viewset's
+serializer with ``many=True`` (see ``TransactionListSerializer``) and
+every operation is checked before anything is written. If any item is
+invalid the response is ``400`` with an error object per submitted item
+(``{}`` for valid ones) and nothing is saved; otherwise all operations
+are applied in one transaction and the saved rows are returned.
+"""
+
+# pylint: disable=no-member
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework import status
+
+from .models import deferred_bookkeeping
+
+MAX_BATCH_OPERATIONS = 1000
+BATCH_SECTIONS = ("create", "update", "delete")
+
+
+class TransactionBatch:
+    """Validate and apply one batch request for a transaction viewset."""
+
+    def __init__(self, serializer_class, queryset, context):
+        self.serializer_class = serializer_class
+        self.queryset = queryset
+        self.context = context
+        self.pk_field = queryset.model._meta.pk
+
+    def run(self, payload, user):
+        """Return ``(response data, status code)`` for ``payload``."""
+        operations, errors = self.parse(payload)
+        if errors:
+            return errors, status.HTTP_400_BAD_REQUEST
+
+        ids = [pk for pk in operations["delete"] if pk is not None]
+        ids += [item["id"] for item in operations["update"] if isinstance(item, dict)]
+        existing = self.queryset.in_bulk([pk for pk in ids if pk is not None])
+
+        creator = self.serializer_class(
+            data=operations["create"], many=True, context=self.context
+        )
+        updater, update_errors = self.build_updater(operations["update"], existing)
+        delete_errors = [
+            {} if pk in existing else {"id": ["Not found."]}
+            for pk in operations["delete"]
+        ]
+
+        errors = {}
+        if not creator.is_valid():
+            errors["create"] = creator.errors
+        if updater is not None and not updater.is_valid():
+            valid = iter(updater.errors)
+            update_errors = [error or next(valid) for error in update_errors]
+        if any(update_errors):
+            errors["update"] = update_errors
+        if any(delete_errors):
+            errors["delete"] = delete_errors
+        if errors:
+            return errors, status.HTTP_400_BAD_REQUEST
+
+        with transaction.atomic(), deferred_bookkeeping():
+            created = creator.save(user=user) if operations["create"] else []
+            updated = updater.save() if updater is not None else []
+            if operations["delete"]:
+                self.queryset.filter(pk__in=operations["delete"]).delete()
+
+        data = {
+            "created": self.serializer_class(
+                created, many=True, context=self.context
+            ).data,
+            "updated": self.serializer_class(
+                updated, many=True, context=self.context
+            ).data,
+            "deleted": operations["delete"],
+        }
+        return data, status.HTTP_200_OK
+
+    def parse(self, payload):
+        """Split the payload into its sections, coercing ids."""
+        if not isinstance(payload, dict):
+            return None, {"non_field_errors": ["Expected an object of operations."]}
+        errors = {}
+        operations = {}
+        for section in BATCH_SECTIONS:
+            items = payload.get(section, [])
+            if not isinstance(items, list):
+                errors[section] = ["Expected a list."]
+                continue
+            operations[section] = items
+        unknown = set(payload) - set(BATCH_SECTIONS)
+        if unknown:
+            errors["non_field_errors"] = [
+                f"Unknown operations: {', '.join(sorted(unknown))}."
+            ]
+        if errors:
+            return None, errors
+
+        total = sum(len(items) for items in operations.values())
+        if total > MAX_BATCH_OPERATIONS:
+            message = f"At most {MAX_BATCH_OPERATIONS} operations per request."
+            return None, {"non_field_errors": [message]}
+
+        operations["delete"] = [self.coerce_pk(pk) for pk in operations["delete"]]
+        operations["update"] = [
+            {**item, "id": self.coerce_pk(item.get("id"))}
+            if isinstance(item, dict)
+            else item
+            for item in operations["update"]
+        ]
+        return operations, {}
+
+    def build_updater(self, items, existing):
+        """Return the update serializer (or None) and per-item id errors.
+
+        Items with a missing, unknown or repeated ``id`` get an error
+        straight away; the rest are validated by the returned serializer,
+        whose errors fill the remaining (empty) slots in order.
+        """
+        errors, valid_items, seen = [], [], set()
+        for item in items:
+            if not isinstance(item, dict):
+                errors.append({"non_field_errors": ["Expected an object."]})
+            elif item["id"] is None:
+                errors.append({"id": ["A valid id is required."]})
+            elif item["id"] not in existing:
+                errors.append({"id": ["Not found."]})
+            elif item["id"] in seen:
+                errors.append({"id": ["Duplicate id in this batch."]})
+            else:
+                seen.add(item["id"])
+                valid_items.append(item)
+                errors.append({})
+        if not valid_items:
+            return None, errors
+        updater = self.serializer_class(
+            [existing[item["id"]] for item in valid_items],
+            data=valid_items,
+            many=True,
+            partial=True,
+            context=self.context,
+        )
+        return updater, errors
+
+    def coerce_pk(self, value):
+        """Return ``value`` as a primary key, or None when it is not one."""
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return self.pk_field.to_python(value)
+        except DjangoValidationError:
+            return None
@@ -0,0 +1,61 @@
+"""Per-user response caching helpers.
+
+The dashboard payload is cached per user and dropped whenever one of the
+records it summarises changes (see ``api.signals``). Code that writes
+rows without sending model signals (``bulk_create``, ``QuerySet.update``)
+must call ``invalidate_dashboard`` itself.
+
+Each payload is stored with the data version it was built at (see
+``api.conditional``) and only served for that version, so a changed
+ETag never comes with an older body, even for changes that do not
+invalidate the cache (such as a category rename).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+DEFAULT_DASHBOARD_CACHE_TIMEOUT = 300
+
+
+def dashboard_cache_key(user_id):
+    """Cache key of the dashboard payload for ``user_id``."""
+    return f"dashboard:{user_id}"
+
+
+def get_cached_dashboard(user_id, version):
+    """Return the dashboard payload cached at ``version``, or None."""
+    cached = cache.get(dashboard_cache_key(user_id))
+    if cached is None or cached[0] != version:
+        return None
+    return cached[1]
+
+
+def set_cached_dashboard(user_id, version, data):
+    """Store the dashboard payload for ``user_id`` built at ``version``."""
+    timeout = getattr(
+        settings, "DASHBOARD_CACHE_TIMEOUT", DEFAULT_DASHBOARD_CACHE_TIMEOUT
+    )
+    cache.set(dashboard_cache_key(user_id), (version, data), timeout)
+
+
+def invalidate_dashboard(user_id):
+    """Drop the cached dashboard for ``user_id``.
+
+    The key is deleted straight away and again once the surrounding
+    transaction commits, so a request that rebuilt the payload from
+    pre-commit data in the meantime cannot leave it stale.
+    """
+    key = dashboard_cache_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def invalidate_dashboards(user_ids):
+    """Drop the cached dashboards of every user in ``user_ids``, as
+    ``invalidate_dashboard`` does for one user."""
+    keys = [dashboard_cache_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,136 @@
+"""Conditional GET support (strong ETags answered with ``304``).
+
+A response's ETag is derived from a cheap change version rather than
+from the rendered body: the user's ``DataVersion`` counter of each model
+the response depends on and, for payloads that nest categories, the
+newest ``updated_at`` and row count of the global category table. Each
+counter is a unique-index lookup, all in one query, so a matching
+``If-None-Match`` is answered before anything is loaded or serialized,
+however much history the user has.
+
+Every write path bumps the owner's counter (see ``record_changes``):
+saves and deletes from signal handlers, the ``bulk_create``,
+``bulk_update``, ``QuerySet.update`` and raw SQL callers themselves.
+The bump runs in the write's transaction, so every commit makes a new
+version visible, whatever order concurrent writers stamped their
+``updated_at`` in. Writes made in autocommit mode bump right after
+their row lands; a request in between gets the new body under the old
+tag, which only costs one extra full response. The request path, query
+string and ``Accept`` header are hashed into the tag as well, so each
+page, filter and format validates separately.
+
+Categories are global and edited by admins, so they keep the
+``updated_at`` version; a category edit committed after a newer-stamped
+one can still be missed until the next category change.
+"""
+
+# pylint: disable=no-member
+
+import hashlib
+
+from django.contrib.auth.models import User
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import Category, DataVersion
+
+
+def data_version(user, models):
+    """Return the change version of ``user``'s rows in ``models``.
+
+    ``Category`` may be listed; it is global, so its part of the version
+    is shared by all users.
+    """
+    annotations = {}
+    for model in models:
+        if model is Category:
+            continue
+        name = model._meta.model_name
+        annotations[name] = Subquery(
+            DataVersion.objects.filter(user=OuterRef("pk"), model=name).values(
+                "counter"
+            )[:1]
+        )
+    if Category in models:
+        categories = Category.objects.order_by().values(
+            newest=Max("updated_at"), rows=Count("pk")
+        )
+        annotations["category"] = Subquery(categories.values("newest")[:1])
+        annotations["categories"] = Subquery(categories.values("rows")[:1])
+    row = User.objects.filter(pk=user.pk).values(**annotations).get()
+    return "|".join(f"{key}={row[key]}" for key in sorted(row))
+
+
+def make_etag(request, version, key=""):
+    """Return the strong ETag of ``request``'s response at ``version``.
+
+    ``key`` distinguishes responses that depend on more than the data,
+    such as the current date.
+    """
+    parts = (
+        str(request.user.pk),
+        version,
+        key,
+        request.get_full_path(),
+        request.META.get("HTTP_ACCEPT", ""),
+    )
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def conditional_get(request, models, respond, key="", version=None):
+    """Answer ``request`` with ``304`` when its ETag still matches.
+
+    ``respond`` builds the full response and is only called on a miss.
+    ``key`` is folded into the ETag (see ``make_etag``). Pass ``version``
+    when the caller already read ``data_version`` for ``models``.
+    """
+    if version is None:
+        version = data_version(request.user, models)
+    etag = make_etag(request, version, key)
+    # Weak comparison: compression turns the tag into W/"..." on the way out
+    tags = [
+        tag.removeprefix("W/")
+        for tag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+    ]
+    if etag in tags:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = respond()
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response["ETag"] = etag
+        # Let browsers keep the body but revalidate it on every use
+        response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+class ConditionalGetMixin:
+    """Serve ``list`` and ``retrieve`` through ``conditional_get``.
+
+    ``version_models`` lists the models whose rows appear in (or are
+    nested inside) the viewset's responses.
+    """
+
+    version_models = ()
+
+    def get_version_models(self):
+        """Models versioning this request's response."""
+        return self.version_models
+
+    def list(self, request, *args, **kwargs):
+        return conditional_get(
+            request,
+            self.get_version_models(),
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return conditional_get(
+            request,
+            self.get_version_models(),
+            lambda: super(ConditionalGetMixin, self).retrieve(
+                request, *args, **kwargs
+            ),
+        )
@@ -0,0 +1,245 @@
+"""Query-parameter filtering and sorting for the transaction lists.
+
+``TransactionFilterBackend`` turns the list query string into SQL so that
+the browser only downloads the rows it displays:
+
+- ``category``: category id
+- ``date_from`` / ``date_to``: inclusive ``YYYY-MM-DD`` bounds
+- ``amount_min`` / ``amount_max``: inclusive amount bounds
+- ``q``: case-insensitive substring match on the note
+- ``sort``: ``date`` (default) or ``amount``
+- ``order``: ``desc`` (default) or ``asc``
+
+The primary key is always the final sort key so keyset pagination has a
+unique position for every row.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import connection
+from django.db.models import F
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+SORT_FIELDS = {
+    "date": "date",
+    "amount": "amount",
+}
+SORT_ORDERS = ("asc", "desc")
+# ``sort`` values of ``/clients/?stats=true``
+CLIENT_STATS_SORT_FIELDS = (
+    "name",
+    "income_total",
+    "expense_total",
+    "net",
+    "project_count",
+    "last_activity",
+)
+# ``sort`` values of ``/projects/?pnl=true``
+PROJECT_PNL_SORT_FIELDS = (
+    "date_created",
+    "name",
+    "income_total",
+    "expense_total",
+    "net",
+    "margin",
+)
+
+
+def _parse_date_param(params, name, errors):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        errors[name] = "Enter a valid date in YYYY-MM-DD format."
+    return parsed
+
+
+def _parse_decimal_param(params, name, errors):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        parsed = Decimal(value)
+    except InvalidOperation:
+        errors[name] = "Enter a valid number."
+        return None
+    if not parsed.is_finite():
+        errors[name] = "Enter a valid number."
+        return None
+    return parsed
+
+
+def _parse_int_param(params, name, errors):
+    value = params.get(name)
+    if value in (None, "", "all"):
+        return None
+    try:
+        parsed = int(value)
+    except ValueError:
+        errors[name] = "Enter a valid id."
+        return None
+    # Out-of-range ids would make the database driver raise, not miss
+    low, high = connection.ops.integer_field_range("BigAutoField")
+    if not low <= parsed <= high:
+        errors[name] = "Enter a valid id."
+        return None
+    return parsed
+
+
+def parse_transaction_filters(params):
+    """Validate the filter query parameters.
+
+    Returns a dict of cleaned values (``None`` for anything not supplied)
+    or raises ``ValidationError`` listing every invalid parameter.
+    """
+    errors = {}
+    cleaned = {
+        "category": _parse_int_param(params, "category", errors),
+        "date_from": _parse_date_param(params, "date_from", errors),
+        "date_to": _parse_date_param(params, "date_to", errors),
+        "amount_min": _parse_decimal_param(params, "amount_min", errors),
+        "amount_max": _parse_decimal_param(params, "amount_max", errors),
+        "q": (params.get("q") or "").strip() or None,
+        "sort": params.get("sort") or "date",
+        "order": params.get("order") or "desc",
+    }
+    if cleaned["sort"] not in SORT_FIELDS:
+        errors["sort"] = f"Must be one of: {', '.join(SORT_FIELDS)}."
+    if cleaned["order"] not in SORT_ORDERS:
+        errors["order"] = f"Must be one of: {', '.join(SORT_ORDERS)}."
+    if errors:
+        raise ValidationError(errors)
+    return cleaned
+
+
+def apply_transaction_filters(queryset, cleaned):
+    """Apply cleaned filter values (no ordering) to ``queryset``."""
+    if cleaned["category"] is not None:
+        queryset = queryset.filter(category_id=cleaned["category"])
+    if cleaned["date_from"] is not None:
+        queryset = queryset.filter(date__gte=cleaned["date_from"])
+    if cleaned["date_to"] is not None:
+        queryset = queryset.filter(date__lte=cleaned["date_to"])
+    if cleaned["amount_min"] is not None:
+        queryset = queryset.filter(amount__gte=cleaned["amount_min"])
+    if cleaned["amount_max"] is not None:
+        queryset = queryset.filter(amount__lte=cleaned["amount_max"])
+    if cleaned["q"]:
+        queryset = queryset.filter(note__icontains=cleaned["q"])
+    return queryset
+
+
+def transaction_ordering(cleaned):
+    """Return the ``order_by`` fields for cleaned sort values."""
+    prefix = "-" if cleaned["order"] == "desc" else ""
+    field = SORT_FIELDS[cleaned["sort"]]
+    return [f"{prefix}{field}", f"{prefix}id"]
+
+
+def filter_transactions(queryset, params):
+    """Apply the transaction filters and ordering to ``queryset``."""
+    cleaned = parse_transaction_filters(params)
+    queryset = apply_transaction_filters(queryset, cleaned)
+    return queryset.order_by(*transaction_ordering(cleaned))
+
+
+def filter_budgets(queryset, params):
+    """Apply the budget list filters to ``queryset``.
+
+    ``category`` is a category id and ``covering`` a ``YYYY-MM-DD`` date
+    the budget period must include; together they answer "which budgets
+    would an expense in this category on this day count against".
+    """
+    errors = {}
+    category = _parse_int_param(params, "category", errors)
+    covering = _parse_date_param(params, "covering", errors)
+    if errors:
+        raise ValidationError(errors)
+    if category is not None:
+        queryset = queryset.filter(category_id=category)
+    if covering is not None:
+        queryset = queryset.filter(start_date__lte=covering, end_date__gte=covering)
+    return queryset
+
+
+class BudgetFilterBackend(BaseFilterBackend):
+    """Filter backend applying ``filter_budgets`` to the budget list."""
+
+    def filter_queryset(self, request, queryset, view):
+        if getattr(view, "detail", False):
+            return queryset
+        return filter_budgets(queryset, request.query_params)
+
+
+class TransactionFilterBackend(BaseFilterBackend):
+    """Filter backend applying ``filter_transactions`` to collection
+    requests (list, export); detail routes are left unfiltered."""
+
+    def filter_queryset(self, request, queryset, view):
+        if getattr(view, "detail", False):
+            return queryset
+        return filter_transactions(queryset, request.query_params)
+
+
+def _parse_sort_param(params, sort_fields, default_sort, default_order, errors):
+    """Return nulls-last ``order_by`` expressions for ``sort``/``order``.
+
+    The primary key breaks ties, in the same direction.
+    """
+    sort = params.get("sort") or default_sort
+    order = params.get("order") or default_order
+    if sort not in sort_fields:
+        errors["sort"] = f"Must be one of: {', '.join(sort_fields)}."
+    if order not in SORT_ORDERS:
+        errors["order"] = f"Must be one of: {', '.join(SORT_ORDERS)}."
+    if "sort" in errors or "order" in errors:
+        return None
+    if order == "desc":
+        return [F(sort).desc(nulls_last=True), F("id").desc()]
+    return [F(sort).asc(nulls_last=True), F("id").asc()]
+
+
+def client_stats_ordering(params):
+    """Return the ``order_by`` expressions for the client stats list.
+
+    ``sort`` is one of ``CLIENT_STATS_SORT_FIELDS`` (default ``name``) and
+    ``order`` is ``asc`` (default) or ``desc``. Clients with no activity
+    sort last either way.
+    """
+    errors = {}
+    ordering = _parse_sort_param(
+        params, CLIENT_STATS_SORT_FIELDS, "name", "asc", errors
+    )
+    if errors:
+        raise ValidationError(errors)
+    return ordering
+
+
+def filter_project_pnl(queryset, params):
+    """Filter and order a P&L-annotated project queryset.
+
+    ``margin_min`` / ``margin_max`` are inclusive bounds on ``margin``
+    (a percentage); projects without income have no margin and are
+    excluded by either bound. ``sort`` is one of
+    ``PROJECT_PNL_SORT_FIELDS`` (default ``date_created``) and ``order``
+    defaults to ``desc``; missing margins sort last.
+    """
+    errors = {}
+    margin_min = _parse_decimal_param(params, "margin_min", errors)
+    margin_max = _parse_decimal_param(params, "margin_max", errors)
+    ordering = _parse_sort_param(
+        params, PROJECT_PNL_SORT_FIELDS, "date_created", "desc", errors
+    )
+    if errors:
+        raise ValidationError(errors)
+    if margin_min is not None:
+        queryset = queryset.filter(margin__gte=margin_min)
+    if margin_max is not None:
+        queryset = queryset.filter(margin__lte=margin_max)
+    return queryset.order_by(*ordering)
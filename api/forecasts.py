@@ -0,0 +1,126 @@
+"""Burn-rate forecasts for active budgets.
+
+A budget is active on ``as_of`` when its period covers that day. Its
+spend so far is projected to the end of the period at its average daily
+rate since ``start_date``, and it is at risk when the projection exceeds
+the amount. The daily spend of every active budget comes from one
+grouped query, however many users and budgets are involved, and each
+budget's figures are read from a ``RangeSums`` of its user and category
+in a single pass, so the forecast also serves a nightly run over all
+users.
+"""
+
+# pylint: disable=no-member
+
+from decimal import ROUND_CEILING
+from datetime import timedelta
+
+from django.db.models import Exists, OuterRef, Sum
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .filters import _parse_date_param
+from .models import Budget, Expense, RangeSums
+
+
+def parse_forecast_params(params):
+    """Validate ``as_of`` (default today) and ``at_risk``.
+
+    Raises ``ValidationError`` listing every invalid parameter.
+    """
+    errors = {}
+    cleaned = {
+        "as_of": _parse_date_param(params, "as_of", errors),
+        "at_risk": params.get("at_risk") or "false",
+    }
+    if cleaned["at_risk"] not in ("1", "true", "0", "false"):
+        errors["at_risk"] = "Must be one of: true, false."
+    if errors:
+        raise ValidationError(errors)
+    cleaned["as_of"] = cleaned["as_of"] or timezone.localdate()
+    cleaned["at_risk"] = cleaned["at_risk"] in ("1", "true")
+    return cleaned
+
+
+def active_budgets(as_of, user=None):
+    """Budgets whose period covers ``as_of`` (only ``user``'s if given)."""
+    budgets = Budget.objects.filter(start_date__lte=as_of, end_date__gte=as_of)
+    if user is not None:
+        budgets = budgets.filter(user=user)
+    return budgets
+
+
+def daily_spend(budgets, as_of, since):
+    """Return ``{(user_id, category_id): {day: total}}`` of the expenses
+    dated ``since`` to ``as_of`` that count against a budget in the
+    ``budgets`` queryset, in one query."""
+    covering = budgets.filter(
+        user=OuterRef("user"),
+        category=OuterRef("category"),
+        start_date__lte=OuterRef("date"),
+        end_date__gte=OuterRef("date"),
+    )
+    rows = (
+        Expense.objects.filter(
+            Exists(covering),
+            date__gte=since,
+            date__lte=as_of,
+        )
+        .values_list("user", "category", "date")
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+    series = {}
+    for user_id, category_id, day, total in rows:
+        series.setdefault((user_id, category_id), {})[day] = total
+    return series
+
+
+def forecast(budgets, as_of):
+    """Forecast each budget of the ``budgets`` queryset (all active on
+    ``as_of``, see ``active_budgets``) to its end date.
+
+    Returns one dict per budget with the spend so far, the daily burn
+    rate, the projected spend and remaining amount at ``end_date``, the
+    day the amount runs out (already, or at the current rate before
+    ``end_date``) and whether the budget is at risk of overspending.
+    """
+    rows = list(budgets)
+    if not rows:
+        return []
+    since = min(budget.start_date for budget in rows)
+    empty = RangeSums({})
+    sums = {
+        key: RangeSums(per_day)
+        for key, per_day in daily_spend(budgets, as_of, since).items()
+    }
+    results = []
+    for budget in rows:
+        series = sums.get((budget.user_id, budget.category_id), empty)
+        spent = series.total(budget.start_date, as_of)
+        elapsed = (as_of - budget.start_date).days + 1
+        days_left = (budget.end_date - as_of).days
+        rate = spent / elapsed
+        projected = spent + rate * days_left
+        left = budget.amount - spent
+        if left <= 0:
+            runs_out_on = series.first_reaching(budget.start_date, budget.amount)
+        elif rate > 0:
+            days = int((left / rate).to_integral_value(ROUND_CEILING))
+            runs_out_on = as_of + timedelta(days=days)
+            if runs_out_on > budget.end_date:
+                runs_out_on = None
+        else:
+            runs_out_on = None
+        results.append(
+            {
+                "budget": budget,
+                "spent": spent,
+                "daily_rate": rate,
+                "projected_spend": projected,
+                "projected_remaining": budget.amount - projected,
+                "runs_out_on": runs_out_on,
+                "at_risk": projected > budget.amount,
+            }
+        )
+    return results
@@ -0,0 +1,263 @@
+"""Bulk CSV import of expenses and income.
+
+``TransactionImporter`` reads a CSV stream in batches. Each batch is
+validated with a single ``ImportRowSerializer``, its category,
+project and client names are resolved with one query per relation for
+the names not seen in earlier batches, and the valid rows are written
+with ``bulk_create``. Rollups and budgets are updated once, after the
+last batch. The whole import runs in one transaction and is
+all-or-nothing: if any row fails, nothing is saved and every error is
+reported by row number.
+
+Expected columns (header names are case-insensitive): ``date``,
+``amount``, ``category`` and optionally ``project``, ``client`` (name or
+email) and ``note``.
+"""
+
+# pylint: disable=no-member
+
+import csv
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from .caching import invalidate_dashboard
+from .models import Category, Client, Expense, Income, Project, record_changes
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 500
+REQUIRED_COLUMNS = ("date", "amount", "category")
+OPTIONAL_COLUMNS = ("project", "client", "note")
+COLUMNS = REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+IMPORT_MODELS = {"expense": Expense, "income": Income}
+
+
+class ImportRowSerializer(serializers.Serializer):
+    """Field-level validation for one CSV row."""
+
+    # pylint: disable=abstract-method
+
+    date = serializers.DateField()
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    category = serializers.CharField(max_length=100)
+    project = serializers.CharField(
+        max_length=150, required=False, allow_blank=True, default=""
+    )
+    client = serializers.CharField(
+        max_length=254, required=False, allow_blank=True, default=""
+    )
+    note = serializers.CharField(
+        max_length=250, required=False, allow_blank=True, default=""
+    )
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import: rows saved and per-row errors."""
+
+    created: int = 0
+    rows: int = 0
+    errors: list = field(default_factory=list)
+    error_count: int = 0
+
+    @property
+    def ok(self):
+        """True when every row was valid (and therefore saved)."""
+        return self.error_count == 0
+
+    def add_error(self, row, errors):
+        """Record the errors of CSV row number ``row``."""
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "errors": errors})
+
+    def as_dict(self):
+        """Return the result as a JSON-serialisable dict."""
+        return {
+            "created": self.created,
+            "rows": self.rows,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+
+class TransactionImporter:
+    """Import a CSV stream of expenses or income for one user."""
+
+    def __init__(self, user, kind, batch_size=IMPORT_BATCH_SIZE):
+        if kind not in IMPORT_MODELS:
+            raise ValueError(f"kind must be one of {', '.join(IMPORT_MODELS)}")
+        self.user = user
+        self.model = IMPORT_MODELS[kind]
+        self.batch_size = batch_size
+        self.fields = list(ImportRowSerializer().fields.items())
+        self.categories = None
+        self.projects = {}
+        self.clients = {}
+
+    def run(self, lines):
+        """Import rows from an iterable of CSV text lines.
+
+        Use ``codecs.iterdecode(uploaded_file, "utf-8-sig")`` for uploads
+        and ``open(path, newline="", encoding="utf-8-sig")`` for files.
+        """
+        reader = csv.DictReader(lines)
+        result = ImportResult()
+
+        headers = [(name or "").strip().lower() for name in reader.fieldnames or []]
+        missing = [name for name in REQUIRED_COLUMNS if name not in headers]
+        if missing:
+            message = f"Missing columns: {', '.join(missing)}."
+            result.add_error(1, {"header": [message]})
+            return result
+        reader.fieldnames = headers
+
+        deltas = []
+        with transaction.atomic():
+            row_number = 1  # the header is row 1
+            while True:
+                batch = list(islice(reader, self.batch_size))
+                if not batch:
+                    break
+                numbers = range(row_number + 1, row_number + 1 + len(batch))
+                row_number += len(batch)
+                result.rows += len(batch)
+                instances = self.build_batch(batch, numbers, result)
+                if result.ok:
+                    deltas.extend(self.save_batch(instances))
+                    result.created += len(instances)
+
+            if not result.ok:
+                result.created = 0
+                transaction.set_rollback(True)
+            elif result.created:
+                # Totals are updated once for the whole file rather than
+                # per batch, so each rollup row and budget is written once.
+                self.model.apply_deltas(deltas)
+                record_changes(self.model, [self.user.pk])
+                invalidate_dashboard(self.user.pk)
+        return result
+
+    def build_batch(self, batch, numbers, result):
+        """Validate a batch and return unsaved model instances.
+
+        Rows are checked with the bound fields of one
+        ``ImportRowSerializer`` so per-row serializer set-up is not
+        repeated, and the names in the valid rows are resolved together
+        before building instances.
+        """
+        validated = []
+        for number, row in zip(numbers, batch):
+            data, errors = {}, {}
+            for name, row_field in self.fields:
+                try:
+                    data[name] = row_field.run_validation(
+                        (row.get(name) or "").strip()
+                    )
+                except serializers.ValidationError as exc:
+                    errors[name] = exc.detail
+            if errors:
+                result.add_error(number, errors)
+            else:
+                validated.append((number, data))
+
+        self.resolve_names([data for _, data in validated])
+
+        instances = []
+        for number, data in validated:
+            instance, errors = self.build_instance(data)
+            if errors:
+                result.add_error(number, errors)
+            else:
+                instances.append(instance)
+        return instances
+
+    def build_instance(self, data):
+        """Return ``(instance, errors)`` for one validated row."""
+        errors = {}
+        category = self.categories.get(data["category"].lower())
+        if category is None:
+            errors["category"] = [f"Unknown category '{data['category']}'."]
+        project = self.lookup(self.projects, data["project"], "project", errors)
+        client = self.lookup(self.clients, data["client"], "client", errors)
+        if errors:
+            return None, errors
+        return (
+            self.model(
+                user=self.user,
+                category=category,
+                project=project,
+                client=client,
+                amount=data["amount"],
+                date=data["date"],
+                note=data["note"] or None,
+            ),
+            {},
+        )
+
+    @staticmethod
+    def lookup(cache, value, label, errors):
+        """Return the single object cached under ``value`` (or None)."""
+        if not value:
+            return None
+        matches = cache.get(value.lower(), [])
+        if not matches:
+            errors[label] = [f"Unknown {label} '{value}'."]
+            return None
+        if len(matches) > 1:
+            errors[label] = [f"'{value}' matches more than one {label}."]
+            return None
+        return matches[0]
+
+    def resolve_names(self, rows):
+        """Load categories, projects and clients not resolved yet.
+
+        Categories are a small global table and are loaded once; projects
+        and clients cost one query each per batch that mentions new names.
+        """
+        if self.categories is None:
+            category_type = self.model.rollup_kind
+            self.categories = {
+                category.name.lower(): category
+                for category in Category.objects.filter(category_type=category_type)
+            }
+
+        new_projects = {
+            row["project"].lower() for row in rows if row.get("project")
+        } - self.projects.keys()
+        if new_projects:
+            for key in new_projects:
+                self.projects[key] = []
+            for project in Project.objects.annotate(key=Lower("name")).filter(
+                user=self.user, key__in=new_projects
+            ):
+                self.projects[project.key].append(project)
+
+        new_clients = {
+            row["client"].lower() for row in rows if row.get("client")
+        } - self.clients.keys()
+        if new_clients:
+            for key in new_clients:
+                self.clients[key] = []
+            matches = Client.objects.annotate(
+                name_key=Lower("name"), email_key=Lower("email")
+            ).filter(
+                Q(name_key__in=new_clients) | Q(email_key__in=new_clients),
+                user=self.user,
+            )
+            for client in matches:
+                for key in {client.name.lower(), client.email.lower()} & new_clients:
+                    if client not in self.clients[key]:
+                        self.clients[key].append(client)
+
+    def save_batch(self, instances):
+        """Insert a batch and return the totals deltas it implies."""
+        self.model.objects.bulk_create(instances)
+        return [
+            (self.user.pk, instance.category_id, instance.date, instance.amount, 1)
+            for instance in instances
+        ]
@@ -0,0 +1,289 @@
+"""The merged expense/income ledger behind ``/ledger/``.
+
+Each page is one SQL statement: the filtered expense and income rows
+past the cursor are read as two index-ordered, ``LIMIT``-ed selects,
+and those are joined with ``UNION ALL`` under a ``kind`` discriminator
+and cut to the page. Rows are ordered by ``(date, kind, id)``. ``kind``
+is ``EXPENSE`` or ``INCOME`` (as in the ledger export) and breaks date
+ties, since ids repeat across the two tables.
+
+``balance`` is the running sum of income minus expenses over the
+filtered rows, in date order. Within a page, a window function
+(cumulative ``SUM`` over ``(date, kind, id)``) computes it in the same
+statement. The page is then seeded with the balance just before its
+oldest row. That opening balance comes from the monthly rollups for
+whole months plus the rows of the remaining partial months, in one
+query. Amount and note filters cannot use the rollups, so the whole
+prefix is summed from rows in that case. No request walks the full
+history.
+"""
+
+# pylint: disable=no-member
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import CharField, DecimalField, F, Q, Subquery, Sum, Value
+
+from .filters import apply_transaction_filters
+from .models import Expense, Income, MonthlyRollup, month_start
+
+# (model, kind) in ascending ``kind`` order
+LEDGER_SIDES = ((Expense, Expense.rollup_kind), (Income, Income.rollup_kind))
+LEDGER_KINDS = tuple(kind for _, kind in LEDGER_SIDES)
+LEDGER_SIGNS = {Expense.rollup_kind: -1, Income.rollup_kind: 1}
+LEDGER_FIELDS = (
+    "kind",
+    "id",
+    "date",
+    "amount",
+    "note",
+    "category_id",
+    "project_id",
+    "client_id",
+)
+
+
+DATE_FIELD = Expense._meta.get_field("date")
+CENTS = Decimal("0.01")
+
+
+def to_cents(value):
+    """Return a money value read by raw SQL as a ``Decimal`` in cents.
+
+    SQLite hands back floats for decimal columns; going through ``str``
+    keeps the shortest repr, so e.g. 0.1 + 0.2 still rounds to 0.30.
+    """
+    return Decimal(str(value)).quantize(CENTS)
+
+
+def run_query(sql, params):
+    """Run raw SQL and return the rows as dicts."""
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, values)) for values in cursor.fetchall()]
+
+
+def next_month_start(day):
+    """Return the first day of the month after ``day``'s."""
+    return (month_start(day) + timedelta(days=32)).replace(day=1)
+
+
+class Ledger:
+    """The filtered ledger of ``user``, ordered by date.
+
+    ``cleaned`` holds parsed transaction filters; see
+    ``api.filters.parse_transaction_filters``.
+    """
+
+    def __init__(self, user, cleaned):
+        self.user = user
+        self.cleaned = cleaned
+        self.descending = cleaned["order"] == "desc"
+        prefix = "-" if self.descending else ""
+        self.ordering = [f"{prefix}date", f"{prefix}kind", f"{prefix}id"]
+
+    def filtered(self, model):
+        """``model`` rows of the user matching the filters (unordered)."""
+        return apply_transaction_filters(
+            model.objects.filter(user=self.user), self.cleaned
+        )
+
+    @staticmethod
+    def seek(kind, position, descending):
+        """Rows of ``kind`` past ``position`` when walking the ledger.
+
+        ``kind`` is fixed within a side, so the ``(date, kind, id)`` tuple
+        comparison reduces to a date range (plus an id bound when the
+        side's kind equals the cursor's).
+        """
+        day, cursor_kind, pk = position
+        past, past_or_equal = ("lt", "lte") if descending else ("gt", "gte")
+        if kind == cursor_kind:
+            return Q(**{f"date__{past_or_equal}": day}) & (
+                Q(**{f"date__{past}": day}) | Q(date=day, **{f"id__{past}": pk})
+            )
+        if (kind < cursor_kind) == descending:
+            return Q(**{f"date__{past_or_equal}": day})
+        return Q(**{f"date__{past}": day})
+
+    def fetch(self, position, descending, limit):
+        """Return up to ``limit`` rows past ``position`` as dicts.
+
+        Each row also carries ``page_balance``: the running signed total
+        over the fetched rows in date order, computed by a window
+        function. ``add_balances`` rebases it onto the opening balance.
+        """
+        qn = connection.ops.quote_name
+        direction = "DESC" if descending else "ASC"
+        order_by = ("-date", "-id") if descending else ("date", "id")
+        parts, params = [], []
+        for model, kind in LEDGER_SIDES:
+            queryset = self.filtered(model)
+            if position is not None:
+                queryset = queryset.filter(self.seek(kind, position, descending))
+            queryset = (
+                queryset.order_by(*order_by)
+                .annotate(kind=Value(kind, output_field=CharField()))
+                .values(*LEDGER_FIELDS, category_name=F("category__name"))[:limit]
+            )
+            sql, side_params = queryset.query.get_compiler(queryset.db).as_sql()
+            parts.append(f"SELECT * FROM ({sql}) {qn(kind.lower() + '_page')}")
+            params.extend(side_params)
+
+        key = [qn(column) for column in ("date", "kind", "id")]
+        page = (
+            " UNION ALL ".join(parts)
+            + " ORDER BY "
+            + ", ".join(f"{column} {direction}" for column in key)
+            + " LIMIT %s"
+        )
+        amount = qn("amount")
+        sql = (
+            f"SELECT {qn('page')}.*, SUM(CASE WHEN {key[1]} = %s "
+            f"THEN {amount} ELSE -{amount} END) "
+            f"OVER (ORDER BY {', '.join(key)} ROWS UNBOUNDED PRECEDING) "
+            f"AS {qn('page_balance')} FROM ({page}) {qn('page')} "
+            f"ORDER BY " + ", ".join(f"{column} {direction}" for column in key)
+        )
+        rows = run_query(sql, [Income.rollup_kind, *params, limit])
+        for row in rows:
+            row["date"] = DATE_FIELD.to_python(row["date"])
+            row["amount"] = to_cents(row["amount"])
+            row["page_balance"] = to_cents(row["page_balance"])
+        return rows
+
+    def balance_before(self, position):
+        """Signed total of the ledger rows before ``position``."""
+        day = position[0]
+        before = {
+            kind: self.filtered(model).filter(self.seek(kind, position, True))
+            for model, kind in LEDGER_SIDES
+        }
+        sums = {}
+        cleaned = self.cleaned
+        uses_rollups = (
+            cleaned["amount_min"] is None
+            and cleaned["amount_max"] is None
+            and not cleaned["q"]
+        )
+        if uses_rollups:
+            # Whole months from full_from up to the cursor's month come
+            # from the rollups; rows cover the partial months at each end.
+            current = month_start(day)
+            full_from = cleaned["date_from"]
+            if full_from is not None and full_from.day != 1:
+                full_from = next_month_start(full_from)
+            if full_from is None or full_from < current:
+                rollups = MonthlyRollup.objects.filter(
+                    user=self.user, month__lt=current
+                )
+                if full_from is not None:
+                    rollups = rollups.filter(month__gte=full_from)
+                if cleaned["category"] is not None:
+                    rollups = rollups.filter(category_id=cleaned["category"])
+                rows_outside = Q(date__gte=current)
+                if full_from is not None:
+                    rows_outside |= Q(date__lt=full_from)
+                for kind in LEDGER_KINDS:
+                    sums[f"{kind}_months"] = rollups.filter(kind=kind)
+                    before[kind] = before[kind].filter(rows_outside)
+
+        def total(queryset, field):
+            return Subquery(
+                queryset.order_by()
+                .values("user")
+                .annotate(value=Sum(field))
+                .values("value")
+            )
+
+        annotations = {kind: total(rows, "amount") for kind, rows in before.items()}
+        annotations.update(
+            {name: total(rollups, "total") for name, rollups in sums.items()}
+        )
+        row = User.objects.filter(pk=self.user.pk).values(**annotations).get()
+        return sum(
+            (
+                LEDGER_SIGNS[name.split("_")[0]] * Decimal(value)
+                for name, value in row.items()
+                if value is not None
+            ),
+            Decimal("0"),
+        )
+
+    def add_balances(self, rows):
+        """Set ``balance`` on ``rows`` (a page in display order).
+
+        The window's ``page_balance`` may include a look-ahead row the
+        paginator dropped, so it is rebased on the page's oldest row.
+        """
+        if not rows:
+            return rows
+        oldest = rows[-1] if self.descending else rows[0]
+        opening = self.balance_before((oldest["date"], oldest["kind"], oldest["id"]))
+        offset = opening - (
+            oldest["page_balance"] - LEDGER_SIGNS[oldest["kind"]] * oldest["amount"]
+        )
+        for row in rows:
+            row["balance"] = row.pop("page_balance") + offset
+        return rows
+
+    def daily_balances(self):
+        """Return ``(opening, days)`` for the filtered date window.
+
+        ``opening`` is the balance before ``date_from`` (every earlier
+        matching row counts, via ``balance_before``). ``days`` lists each
+        date with activity, oldest first, with its income, expenses and
+        closing ``balance``. The totals are grouped per day and
+        accumulated by a window function in one query.
+        """
+        cleaned = self.cleaned
+        opening = Decimal("0")
+        if cleaned["date_from"] is not None:
+            history = Ledger(self.user, {**cleaned, "date_from": None, "date_to": None})
+            opening = history.balance_before(
+                (cleaned["date_from"], LEDGER_KINDS[0], 0)
+            )
+
+        qn = connection.ops.quote_name
+        money = DecimalField(max_digits=16, decimal_places=2)
+        zero = Value(Decimal("0"), output_field=money)
+        parts, params = [], []
+        for model, kind in LEDGER_SIDES:
+            total = Sum("amount", output_field=money)
+            queryset = (
+                self.filtered(model)
+                .order_by()
+                .values("date")
+                .annotate(
+                    income=total if kind == Income.rollup_kind else zero,
+                    expenses=total if kind == Expense.rollup_kind else zero,
+                )
+            )
+            sql, side_params = queryset.query.get_compiler(queryset.db).as_sql()
+            parts.append(f"SELECT * FROM ({sql}) {qn(kind.lower() + '_days')}")
+            params.extend(side_params)
+
+        date, income, expenses = (qn(name) for name in ("date", "income", "expenses"))
+        sql = (
+            f"SELECT {date}, SUM({income}) AS {income}, "
+            f"SUM({expenses}) AS {expenses}, "
+            f"SUM(SUM({income}) - SUM({expenses})) "
+            f"OVER (ORDER BY {date} ROWS UNBOUNDED PRECEDING) AS {qn('net')} "
+            f"FROM ({' UNION ALL '.join(parts)}) {qn('days')} "
+            f"GROUP BY {date} ORDER BY {date}"
+        )
+        days = []
+        for row in run_query(sql, params):
+            days.append(
+                {
+                    "date": DATE_FIELD.to_python(row["date"]),
+                    "income": to_cents(row["income"]),
+                    "expenses": to_cents(row["expenses"]),
+                    "balance": opening + to_cents(row["net"]),
+                }
+            )
+        return opening, days
@@ -0,0 +1,61 @@
+"""List the active budgets of every user that are likely to overspend."""
+
+# pylint: disable=no-member
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api.forecasts import active_budgets, forecast
+
+
+class Command(BaseCommand):
+    """Forecast all active budgets at once, e.g. from a nightly job."""
+
+    help = (
+        "Project every active budget's spend to its end date and list the "
+        "budgets at risk of overspending."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only forecast budgets of this user id (repeatable).",
+        )
+        parser.add_argument(
+            "--date",
+            help="Forecast as of YYYY-MM-DD instead of today.",
+        )
+
+    def handle(self, *args, **options):
+        as_of = options["date"]
+        if as_of:
+            try:
+                as_of = date.fromisoformat(as_of)
+            except ValueError as exc:
+                raise CommandError("--date must be a YYYY-MM-DD date.") from exc
+        else:
+            as_of = timezone.localdate()
+        budgets = active_budgets(as_of).select_related("category")
+        if options["users"] is not None:
+            budgets = budgets.filter(user_id__in=options["users"])
+        rows = forecast(budgets.order_by("user_id", "end_date", "pk"), as_of)
+
+        at_risk = [row for row in rows if row["at_risk"]]
+        for row in at_risk:
+            budget = row["budget"]
+            self.stdout.write(
+                f"user {budget.user_id}, budget {budget.pk} "
+                f"({budget.category.name}): projected "
+                f"{row['projected_spend']:.2f} of {budget.amount}, "
+                f"runs out {row['runs_out_on']}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Forecast {len(rows)} active budgets; {len(at_risk)} at risk."
+            )
+        )
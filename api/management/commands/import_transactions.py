@@ -0,0 +1,63 @@
+"""Import expenses or income for a user from a CSV file."""
+
+# pylint: disable=no-member
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from api.imports import IMPORT_MODELS, TransactionImporter
+
+
+class Command(BaseCommand):
+    """Bulk-import a CSV of transactions."""
+
+    help = (
+        "Import a CSV (date, amount, category[, project, client, note]) of "
+        "expenses or income for one user. Nothing is saved if any row fails."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the CSV file.")
+        parser.add_argument(
+            "--user", required=True, help="Username that will own the rows."
+        )
+        parser.add_argument(
+            "--kind",
+            required=True,
+            choices=sorted(IMPORT_MODELS),
+            help="Whether the rows are expenses or income.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows validated and inserted per batch (default 1000).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist as exc:
+            raise CommandError(f"Unknown user '{options['user']}'.") from exc
+
+        importer = TransactionImporter(
+            user, options["kind"], batch_size=options["batch_size"]
+        )
+        try:
+            with open(options["path"], newline="", encoding="utf-8-sig") as handle:
+                result = importer.run(handle)
+        except OSError as exc:
+            raise CommandError(f"Cannot read {options['path']}: {exc}") from exc
+        except UnicodeDecodeError as exc:
+            raise CommandError("The file must be UTF-8 encoded CSV.") from exc
+
+        if not result.ok:
+            for error in result.errors:
+                self.stderr.write(f"Row {error['row']}: {error['errors']}")
+            raise CommandError(
+                f"{result.error_count} of {result.rows} rows are invalid; "
+                "nothing was imported."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {result.created} {options['kind']} rows.")
+        )
@@ -0,0 +1,51 @@
+"""Create the expenses and income due from recurring rules."""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.recurring import RECURRING_BATCH_SIZE, materialize_recurring
+
+
+class Command(BaseCommand):
+    """Materialize due recurring occurrences for every user in one pass."""
+
+    help = (
+        "Create the expense and income rows of every recurring rule due on "
+        "or before today (or --date). Safe to rerun."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only materialize rules of this user id (repeatable).",
+        )
+        parser.add_argument(
+            "--date",
+            help="Materialize occurrences due up to YYYY-MM-DD instead of today.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RECURRING_BATCH_SIZE,
+            help=f"Rules read per batch (default {RECURRING_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        until = options["date"]
+        if until:
+            try:
+                until = date.fromisoformat(until)
+            except ValueError as exc:
+                raise CommandError("--date must be a YYYY-MM-DD date.") from exc
+        created = materialize_recurring(
+            until=until,
+            user_ids=options["users"],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} recurring transactions.")
+        )
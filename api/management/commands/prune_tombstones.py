@@ -0,0 +1,32 @@
+"""Delete tombstones older than the delta sync token lifetime."""
+
+# pylint: disable=no-member
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.models import Tombstone
+from api.sync import tombstone_retention
+
+
+def prune_tombstones(now=None):
+    """Delete tombstones no unexpired sync token can still ask for.
+
+    Returns the number of tombstones deleted.
+    """
+    cutoff = (now or timezone.now()) - tombstone_retention()
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
+
+
+class Command(BaseCommand):
+    """Prune the deleted-row log used by /sync/."""
+
+    help = (
+        "Delete tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS. Clients "
+        "holding older sync tokens are told to resync from scratch."
+    )
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} tombstones."))
@@ -0,0 +1,72 @@
+"""Rebuild the MonthlyRollup table from the Expense and Income rows."""
+
+# pylint: disable=no-member
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+from api.caching import invalidate_dashboards
+from api.models import Expense, Income, MonthlyRollup
+
+
+def rebuild_monthly_rollups(user_ids=None, batch_size=1000):
+    """Replace the rollups (optionally only for ``user_ids``).
+
+    One grouped query per transaction kind produces every rollup row,
+    which are then written with ``bulk_create``. The dashboard totals are
+    read from the rollups, so the affected users' cached dashboards are
+    dropped. Returns the number of rollup rows written.
+    """
+    written = 0
+    with transaction.atomic():
+        existing = MonthlyRollup.objects.all()
+        if user_ids is not None:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+
+        for model in (Expense, Income):
+            source = model.objects.all()
+            if user_ids is not None:
+                source = source.filter(user_id__in=user_ids)
+            grouped = (
+                source.annotate(month=TruncMonth("date"))
+                .order_by()
+                .values("user_id", "category_id", "month")
+                .annotate(total=Sum("amount"), count=Count("id"))
+            )
+            batch = []
+            for row in grouped.iterator():
+                batch.append(MonthlyRollup(kind=model.rollup_kind, **row))
+                if len(batch) >= batch_size:
+                    MonthlyRollup.objects.bulk_create(batch)
+                    written += len(batch)
+                    batch = []
+            MonthlyRollup.objects.bulk_create(batch)
+            written += len(batch)
+
+        if user_ids is None:
+            user_ids = User.objects.values_list("pk", flat=True)
+        invalidate_dashboards(user_ids)
+    return written
+
+
+class Command(BaseCommand):
+    """Recompute monthly rollups from scratch."""
+
+    help = "Rebuild the per-user, per-category monthly rollup table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only rebuild rollups for this user id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_monthly_rollups(user_ids=options["users"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} rollup rows."))
@@ -0,0 +1,148 @@
+"""Recompute stored budget progress for many budgets at once."""
+
+# pylint: disable=no-member
+
+from datetime import date
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from api.caching import invalidate_dashboards
+from api.models import Budget, Expense, record_changes
+
+CENTS = Decimal("0.01")
+
+
+def recompute_budgets(user_ids=None, since=None, batch_size=1000):
+    """Refresh ``remaining_amount``/``percentage`` of the selected budgets.
+
+    Spend for every selected budget comes from one query (a correlated
+    sum answered by the ``(user, category, date, amount)`` index) and the
+    results are written back in batches with one parameterised UPDATE run
+    through ``executemany``. ``QuerySet.bulk_update`` would build a CASE
+    expression per row, which dominates the run time at this scale.
+    Budgets whose stored progress is already right are left alone, so
+    their ``updated_at`` (and delta sync) is not disturbed. The raw
+    UPDATE sends no signals, so the owners' cached dashboards are dropped
+    here. Returns the number of budgets updated.
+    """
+    spent = (
+        Expense.objects.filter(
+            user=OuterRef("user"),
+            category=OuterRef("category"),
+            date__gte=OuterRef("start_date"),
+            date__lte=OuterRef("end_date"),
+        )
+        .order_by()
+        .values("user")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    budgets = Budget.objects.all()
+    if user_ids is not None:
+        budgets = budgets.filter(user_id__in=user_ids)
+    if since is not None:
+        budgets = budgets.filter(end_date__gte=since)
+    rows = budgets.order_by("pk").values_list(
+        "pk",
+        "user_id",
+        "amount",
+        "remaining_amount",
+        "percentage",
+        Coalesce(
+            Subquery(spent),
+            Value(0),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        ),
+    )
+
+    meta = Budget._meta
+    remaining_field = meta.get_field("remaining_amount")
+    percentage_field = meta.get_field("percentage")
+    quote = connection.ops.quote_name
+    updated_field = meta.get_field("updated_at")
+    sql = (
+        f"UPDATE {quote(meta.db_table)} "
+        f"SET {quote(remaining_field.column)} = %s, "
+        f"{quote(percentage_field.column)} = %s, "
+        f"{quote(updated_field.column)} = %s "
+        f"WHERE {quote(meta.pk.column)} = %s"
+    )
+    now = updated_field.get_db_prep_save(timezone.now(), connection)
+
+    updated = 0
+    users = set()
+    with transaction.atomic(), connection.cursor() as cursor:
+        batch = []
+        for pk, user_id, amount, old_remaining, old_percentage, total_spent in rows:
+            remaining, percentage = Budget(amount=amount).progress(total_spent)
+            if (remaining, percentage.quantize(CENTS)) == (
+                old_remaining,
+                old_percentage,
+            ):
+                continue
+            users.add(user_id)
+            batch.append(
+                (
+                    remaining_field.get_db_prep_save(remaining, connection),
+                    percentage_field.get_db_prep_save(percentage, connection),
+                    now,
+                    pk,
+                )
+            )
+            if len(batch) >= batch_size:
+                cursor.executemany(sql, batch)
+                updated += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+            updated += len(batch)
+        record_changes(Budget, users)
+        invalidate_dashboards(users)
+    return updated
+
+
+class Command(BaseCommand):
+    """Bulk-refresh stored budget progress."""
+
+    help = (
+        "Recompute remaining amount and percentage for budgets using one "
+        "grouped query and batched updates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="Only recompute budgets of this user id (repeatable).",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only recompute budgets ending on or after YYYY-MM-DD.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Budgets written per UPDATE batch (default 1000).",
+        )
+
+    def handle(self, *args, **options):
+        since = options["since"]
+        if since:
+            try:
+                since = date.fromisoformat(since)
+            except ValueError as exc:
+                raise CommandError("--since must be a YYYY-MM-DD date.") from exc
+        updated = recompute_budgets(
+            user_ids=options["users"],
+            since=since,
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Recomputed {updated} budgets."))
@@ -0,0 +1,24 @@
+"""HTTP middleware for the api app."""
+
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+
+DEFAULT_COMPRESSION_MIN_SIZE = 1024
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """``GZipMiddleware`` with a configurable size threshold.
+
+    Bodies smaller than ``RESPONSE_COMPRESSION_MIN_SIZE`` bytes are sent
+    as-is: below roughly a kilobyte the CPU cost outweighs the saving.
+    Streaming responses (CSV/NDJSON exports) are always compressed.
+    Django's BREACH mitigation (random padding) is kept.
+    """
+
+    def process_response(self, request, response):
+        min_size = getattr(
+            settings, "RESPONSE_COMPRESSION_MIN_SIZE", DEFAULT_COMPRESSION_MIN_SIZE
+        )
+        if not response.streaming and len(response.content) < min_size:
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.8 on 2026-10-17 22:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_rollups(apps, schema_editor):
+    MonthlyRollup = apps.get_model('api', 'MonthlyRollup')
+    for model_name, kind in (('Expense', 'EXPENSE'), ('Income', 'INCOME')):
+        model = apps.get_model('api', model_name)
+        grouped = (
+            model.objects.annotate(month=TruncMonth('date'))
+            .order_by()
+            .values('user_id', 'category_id', 'month')
+            .annotate(total=Sum('amount'), count=Count('id'))
+        )
+        MonthlyRollup.objects.bulk_create(
+            (MonthlyRollup(kind=kind, **row) for row in grouped.iterator()),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_transaction_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('EXPENSE', 'Expense'), ('INCOME', 'Income')], max_length=7)),
+                ('month', models.DateField(help_text='First day of the month')),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to='api.category')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'category', 'kind', 'month'), name='unique_rollup_per_user_category_kind_month')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
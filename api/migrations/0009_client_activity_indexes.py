@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 23:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_category_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['client', 'date', 'amount'], name='expense_client_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['client', 'date', 'amount'], name='income_client_date_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 23:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_client_activity_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['project', 'amount'], name='expense_project_amount_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='income',
+            index=models.Index(fields=['project', 'amount'], name='income_project_amount_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 23:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_project_pnl_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(fields=['user', 'category', 'start_date', 'end_date'], name='budget_user_cat_period_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.8 on 2026-10-17 23:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils.dateparse import parse_date
+
+
+def parse_dates(value):
+    """The valid ``YYYY-MM-DD`` entries of a free-text ``dates`` value."""
+    days = set()
+    for part in (value or '').split(','):
+        try:
+            day = parse_date(part.strip())
+        except ValueError:
+            day = None
+        if day is not None:
+            days.add(day)
+    return sorted(days)
+
+
+def copy_dates_to_checkpoints(apps, schema_editor):
+    Budget = apps.get_model('api', 'Budget')
+    BudgetCheckpoint = apps.get_model('api', 'BudgetCheckpoint')
+    budgets = Budget.objects.exclude(dates='').values_list(
+        'id', 'dates', 'start_date', 'end_date'
+    )
+    # Dates outside the budget period were never valid checkpoints
+    BudgetCheckpoint.objects.bulk_create(
+        (
+            BudgetCheckpoint(budget_id=budget_id, date=day)
+            for budget_id, dates, start_date, end_date in budgets.iterator()
+            for day in parse_dates(dates)
+            if start_date <= day <= end_date
+        ),
+        batch_size=1000,
+    )
+
+
+def copy_checkpoints_to_dates(apps, schema_editor):
+    Budget = apps.get_model('api', 'Budget')
+    BudgetCheckpoint = apps.get_model('api', 'BudgetCheckpoint')
+    per_budget = {}
+    for budget_id, day in BudgetCheckpoint.objects.order_by('date').values_list(
+        'budget_id', 'date'
+    ):
+        per_budget.setdefault(budget_id, []).append(day.isoformat())
+    for budget_id, days in per_budget.items():
+        Budget.objects.filter(pk=budget_id).update(dates=', '.join(days))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_budget_period_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('budget', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='checkpoints', to='api.budget')),
+            ],
+            options={
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('budget', 'date'), name='unique_checkpoint_per_budget')],
+            },
+        ),
+        migrations.RunPython(copy_dates_to_checkpoints, copy_checkpoints_to_dates),
+        migrations.RemoveField(
+            model_name='budget',
+            name='dates',
+        ),
+    ]
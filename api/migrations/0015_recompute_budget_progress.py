@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+CENTS = Decimal('0.01')
+MAX_PERCENTAGE = Decimal('999.99')
+
+
+def recompute_budget_progress(apps, schema_editor):
+    """Refresh stored budget progress, which expense writes now update by
+    delta: before, it was only computed when the budget itself was saved,
+    so budgets whose expenses changed since then are stale."""
+    Budget = apps.get_model('api', 'Budget')
+    Expense = apps.get_model('api', 'Expense')
+    spent = (
+        Expense.objects.filter(
+            user=OuterRef('user'),
+            category=OuterRef('category'),
+            date__gte=OuterRef('start_date'),
+            date__lte=OuterRef('end_date'),
+        )
+        .order_by()
+        .values('user')
+        .annotate(total=Sum('amount'))
+        .values('total')
+    )
+    budgets = Budget.objects.annotate(
+        spent=Coalesce(
+            Subquery(spent),
+            Value(0),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        )
+    ).order_by('pk')
+
+    now = timezone.now()
+    changed = []
+    for budget in budgets.iterator(chunk_size=1000):
+        remaining = budget.amount - budget.spent
+        percentage = Decimal('0')
+        if budget.amount:
+            percentage = min(budget.spent / budget.amount * 100, MAX_PERCENTAGE)
+        percentage = percentage.quantize(CENTS)
+        if (remaining, percentage) == (budget.remaining_amount, budget.percentage):
+            continue
+        budget.remaining_amount = remaining
+        budget.percentage = percentage
+        # Lets delta sync clients pick up the corrected values
+        budget.updated_at = now
+        changed.append(budget)
+    Budget.objects.bulk_update(
+        changed, ['remaining_amount', 'percentage', 'updated_at'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_data_versions'),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_budget_progress, migrations.RunPython.noop),
+    ]
@@ -1,15 +1,23 @@
 """Django ORM models for transactions: Category, Expense, Income,
-Budget, and Goal.
+RecurringRule, Budget, and Goal.
 
 Mirrors the CLI/SQLite schema to ease migration.
 """
 
 # pylint: disable=no-member
 
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
 from decimal import Decimal
+from itertools import accumulate
 from django.contrib.auth.models import User
-from django.db import models
-from django.db.models import Sum
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from phonenumber_field.modelfields import PhoneNumberField
 
 # ----------------------Client Model----------------------
@@ -23,6 +31,7 @@ class Client(models.Model):
         max_length=254,
     )
     phone_number = PhoneNumberField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         """Meta class for the Client model."""
@@ -36,6 +45,9 @@ class Client(models.Model):
                 name="unique_email_name",
             )
         ]
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="client_user_updated_idx")
+        ]
 
     def __str__(self):
        return f"{self.name} ({self.email})"
@@ -62,6 +74,7 @@ class Project(models.Model):
     name = models.CharField(max_length=150)
     date_created = models.DateField()
     note = models.CharField(max_length=250, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
        return f"{self.name} - {self.client.name if self.client else 'No Client'} ({self.date_created})"
@@ -84,6 +97,11 @@ class Project(models.Model):
         verbose_name = "project"
         verbose_name_plural = "projects"
         ordering = ["-date_created"]
+        indexes = [
+            models.Index(
+                fields=["user", "updated_at"], name="project_user_updated_idx"
+            )
+        ]
 
 
 # ----------------------Category Models----------------------
@@ -105,6 +123,8 @@ class Category(models.Model):
         choices=CategoryType.choices,
         default=CategoryType.EXPENSE,
     )
+    # Part of the conditional GET version of payloads nesting categories
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name}"
@@ -122,12 +142,114 @@ class Category(models.Model):
         ]
 
 
+# ----------------------Derived Totals Maintenance----------------------
+
+# Pending ``{flush: [items]}`` while inside ``deferred_bookkeeping()``
+_deferred_writes = ContextVar("deferred_writes", default=None)
+
+
+def defer_or_apply(flush, items):
+    """Call ``flush(items)`` now, or queue the items for one ``flush``
+    call when the enclosing ``deferred_bookkeeping()`` block exits."""
+    buffer = _deferred_writes.get()
+    if buffer is None:
+        flush(items)
+    else:
+        buffer.setdefault(flush, []).extend(items)
+
+
+@contextmanager
+def deferred_bookkeeping():
+    """Collect the bookkeeping writes (totals deltas, tombstones) recorded
+    in the block and flush each kind once when it exits.
+
+    Batch writes that go through ``Model.save()`` or ``QuerySet.delete()``
+    would otherwise update rollups, budgets and the tombstone log once per
+    row. Use it inside ``transaction.atomic()`` so the writes land in the
+    same transaction; nothing is flushed if the block raises.
+    """
+    if _deferred_writes.get() is not None:
+        yield
+        return
+    buffer = {}
+    token = _deferred_writes.set(buffer)
+    try:
+        yield
+    finally:
+        _deferred_writes.reset(token)
+    for flush, items in buffer.items():
+        flush(items)
+
+
+class TransactionTotalsMixin:
+    """Keep derived totals (monthly rollups, budget progress) in step with
+    saves of a transaction model.
+
+    The previous row (if any) is read, the row is written and the
+    ``(user_id, category_id, date, amount, count)`` deltas are applied
+    inside one database transaction. Deletes are handled by a
+    ``post_delete`` handler in ``api.signals`` because that also covers
+    ``QuerySet.delete()`` and cascades, which never call
+    ``Model.delete()``. ``bulk_create``/``QuerySet.update`` bypass both,
+    so callers using them must call ``apply_deltas`` themselves.
+    """
+
+    rollup_kind = None
+
+    @classmethod
+    def apply_deltas(cls, deltas):
+        """Propagate transaction deltas to every derived total."""
+        MonthlyRollup.apply_deltas(cls.rollup_kind, deltas)
+
+    @classmethod
+    def record_deltas(cls, deltas):
+        """Apply deltas now, or once per block in ``deferred_bookkeeping()``."""
+        defer_or_apply(cls.apply_deltas, deltas)
+
+    def rollup_key(self):
+        """Return ``(user_id, category_id, date, amount)`` as stored."""
+        meta = self._meta
+        return (
+            self.user_id,
+            self.category_id,
+            meta.get_field("date").to_python(self.date),
+            meta.get_field("amount").to_python(self.amount),
+        )
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = None
+            if self.pk is not None:
+                previous = (
+                    type(self)
+                    .objects.filter(pk=self.pk)
+                    .values_list("user_id", "category_id", "date", "amount")
+                    .first()
+                )
+            super().save(*args, **kwargs)
+            current = self.rollup_key()
+            deltas = []
+            if previous is not None:
+                user_id, category_id, day, amount = previous
+                deltas.append((user_id, category_id, day, -amount, -1))
+            user_id, category_id, day, amount = current
+            deltas.append((user_id, category_id, day, amount, 1))
+            self.record_deltas(deltas)
+
+
 # ----------------------Expense Model----------------------
 
 
-class Expense(models.Model):
+class Expense(TransactionTotalsMixin, models.Model):
     """Expense record with amount, date, note and category ID."""
 
+    rollup_kind = "EXPENSE"
+
+    @classmethod
+    def apply_deltas(cls, deltas):
+        super().apply_deltas(deltas)
+        Budget.apply_spend_deltas(deltas)
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="expenses")
     category = models.ForeignKey(
         Category, on_delete=models.CASCADE, related_name="expenses"
@@ -149,17 +271,66 @@ class Expense(models.Model):
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     date = models.DateField()
     note = models.CharField(max_length=250, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Rule and scheduled date of a materialized recurring occurrence
+    recurring_rule = models.ForeignKey(
+        "RecurringRule",
+        on_delete=models.SET_NULL,
+        related_name="expenses",
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    occurrence = models.DateField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return f"{self.date} - {self.category.name} - ${self.amount}"
 
+    class Meta:
+        """Meta class for the Expense model."""
+
+        indexes = [
+            # Per-user lists ordered newest first (also the keyset order)
+            models.Index(
+                fields=["user", "-date", "-id"], name="expense_user_date_idx"
+            ),
+            # Category/date-range sums (budgets, filters, dashboard totals);
+            # amount is a key column so the aggregates never touch the table
+            models.Index(
+                fields=["user", "category", "date", "amount"],
+                name="expense_user_cat_date_idx",
+            ),
+            # Delta sync: rows changed since a token
+            models.Index(
+                fields=["user", "updated_at"], name="expense_user_updated_idx"
+            ),
+            # Per-client totals and last activity (``/clients/?stats=true``)
+            models.Index(
+                fields=["client", "date", "amount"], name="expense_client_date_idx"
+            ),
+            # Per-project totals and counts (``/projects/?pnl=true``)
+            models.Index(
+                fields=["project", "amount"], name="expense_project_amount_idx"
+            ),
+        ]
+        constraints = [
+            # Makes materializing recurring rules idempotent
+            models.UniqueConstraint(
+                fields=["recurring_rule", "occurrence"],
+                condition=Q(recurring_rule__isnull=False),
+                name="unique_expense_occurrence",
+            )
+        ]
+
 
 # ----------------------Income Model----------------------
 
 
-class Income(models.Model):
+class Income(TransactionTotalsMixin, models.Model):
     """Income record with amount, date, note and category ID."""
 
+    rollup_kind = "INCOME"
+
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="incomes")
     category = models.ForeignKey(
         Category, on_delete=models.CASCADE, related_name="incomes"
@@ -181,13 +352,378 @@ class Income(models.Model):
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     date = models.DateField()
     note = models.CharField(max_length=250, blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Rule and scheduled date of a materialized recurring occurrence
+    recurring_rule = models.ForeignKey(
+        "RecurringRule",
+        on_delete=models.SET_NULL,
+        related_name="incomes",
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    occurrence = models.DateField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return f"{self.date} - {self.category.name} - ${self.amount}"
 
+    class Meta:
+        """Meta class for the Income model."""
+
+        indexes = [
+            # Per-user lists ordered newest first (also the keyset order)
+            models.Index(
+                fields=["user", "-date", "-id"], name="income_user_date_idx"
+            ),
+            # Category/date-range sums (budgets, filters, dashboard totals);
+            # amount is a key column so the aggregates never touch the table
+            models.Index(
+                fields=["user", "category", "date", "amount"],
+                name="income_user_cat_date_idx",
+            ),
+            # Delta sync: rows changed since a token
+            models.Index(
+                fields=["user", "updated_at"], name="income_user_updated_idx"
+            ),
+            # Per-client totals and last activity (``/clients/?stats=true``)
+            models.Index(
+                fields=["client", "date", "amount"], name="income_client_date_idx"
+            ),
+            # Per-project totals and counts (``/projects/?pnl=true``)
+            models.Index(
+                fields=["project", "amount"], name="income_project_amount_idx"
+            ),
+        ]
+        constraints = [
+            # Makes materializing recurring rules idempotent
+            models.UniqueConstraint(
+                fields=["recurring_rule", "occurrence"],
+                condition=Q(recurring_rule__isnull=False),
+                name="unique_income_occurrence",
+            )
+        ]
+
+
+# ----------------------Recurring Rule Model----------------------
+
+
+def add_months(day, months):
+    """Return ``day`` moved by ``months``, clamped to the month's end."""
+    index = day.month - 1 + months
+    year, month = day.year + index // 12, index % 12 + 1
+    return day.replace(
+        year=year, month=month, day=min(day.day, monthrange(year, month)[1])
+    )
+
+
+class RecurringRule(models.Model):
+    """Repeating expense or income, scheduled like an iCalendar RRULE.
+
+    Occurrence ``n`` falls ``n * interval`` days, weeks, months or years
+    after ``start_date`` (month and year steps past the end of a shorter
+    month land on its last day). The schedule stops after ``count``
+    occurrences (COUNT) or ``end_date`` (UNTIL), whichever comes first.
+    ``next_index``/``next_date`` point at the first occurrence not
+    materialized yet; ``next_date`` is ``None`` once the schedule is
+    exhausted.
+    """
+
+    class Frequency(models.TextChoices):
+        """How often the rule repeats (RRULE ``FREQ``)."""
+
+        DAILY = "DAILY", "Daily"
+        WEEKLY = "WEEKLY", "Weekly"
+        MONTHLY = "MONTHLY", "Monthly"
+        YEARLY = "YEARLY", "Yearly"
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="recurring_rules"
+    )
+    kind = models.CharField(max_length=7, choices=Category.CategoryType.choices)
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="recurring_rules"
+    )
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.SET_NULL,
+        related_name="recurring_rules",
+        null=True,
+        blank=True,
+    )
+    client = models.ForeignKey(
+        Client,
+        on_delete=models.SET_NULL,
+        related_name="recurring_rules",
+        null=True,
+        blank=True,
+    )
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    note = models.CharField(max_length=250, blank=True, null=True)
+    frequency = models.CharField(max_length=7, choices=Frequency.choices)
+    interval = models.PositiveSmallIntegerField(default=1)
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+    count = models.PositiveIntegerField(null=True, blank=True)
+    next_index = models.PositiveIntegerField(default=0, editable=False)
+    next_date = models.DateField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return (
+            f"{self.get_frequency_display()} {self.category.name} "
+            f"${self.amount} from {self.start_date}"
+        )
+
+    class Meta:
+        """Meta class for the RecurringRule model."""
+
+        indexes = [
+            models.Index(
+                fields=["user", "updated_at"], name="recurring_user_updated_idx"
+            ),
+            # Rules due for materialization
+            models.Index(fields=["next_date"], name="recurring_next_date_idx"),
+        ]
+
+    @property
+    def transaction_model(self):
+        """``Expense`` or ``Income``, whichever the rule creates."""
+        return Expense if self.kind == Category.CategoryType.EXPENSE else Income
+
+    def occurrence_date(self, index):
+        """Date of occurrence ``index`` (0 is ``start_date``), or ``None``
+        when the schedule ends before it."""
+        if self.count is not None and index >= self.count:
+            return None
+        step = index * self.interval
+        if self.frequency == self.Frequency.DAILY:
+            day = self.start_date + timedelta(days=step)
+        elif self.frequency == self.Frequency.WEEKLY:
+            day = self.start_date + timedelta(weeks=step)
+        elif self.frequency == self.Frequency.MONTHLY:
+            day = add_months(self.start_date, step)
+        else:
+            day = add_months(self.start_date, 12 * step)
+        if self.end_date is not None and day > self.end_date:
+            return None
+        return day
+
+    def advance(self, until):
+        """Return the dates of the occurrences due by ``until`` and move
+        ``next_index``/``next_date`` past them (without saving)."""
+        days = []
+        while self.next_date is not None and self.next_date <= until:
+            days.append(self.next_date)
+            self.next_index += 1
+            self.next_date = self.occurrence_date(self.next_index)
+        return days
+
+    def build_occurrence(self, day):
+        """Return the unsaved expense or income of the occurrence on ``day``."""
+        return self.transaction_model(
+            user_id=self.user_id,
+            category_id=self.category_id,
+            project_id=self.project_id,
+            client_id=self.client_id,
+            amount=self.amount,
+            date=day,
+            note=self.note,
+            recurring_rule=self,
+            occurrence=day,
+        )
+
+    def save(self, *args, **kwargs):
+        # Schedule edits apply from the first occurrence not materialized
+        self.next_date = self.occurrence_date(self.next_index)
+        super().save(*args, **kwargs)
+
+
+# ----------------------Monthly Rollup Model----------------------
+
+
+# Above this many touched rollup rows, deltas are applied set-wise
+BULK_ROLLUP_THRESHOLD = 20
+
+
+def month_start(day):
+    """Return the first day of ``day``'s month."""
+    return day.replace(day=1)
+
+
+class MonthlyRollup(models.Model):
+    """Running sum and count of a user's transactions per category, kind
+    and month.
+
+    Maintained incrementally on every Expense/Income write (see
+    ``TransactionTotalsMixin``) and rebuildable from scratch with the
+    ``rebuild_rollups`` management command.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="rollups")
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="rollups"
+    )
+    kind = models.CharField(max_length=7, choices=Category.CategoryType.choices)
+    month = models.DateField(help_text="First day of the month")
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.kind} {self.category_id} {self.month:%Y-%m} (${self.total})"
+
+    class Meta:
+        """Meta class for the MonthlyRollup model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "category", "kind", "month"],
+                name="unique_rollup_per_user_category_kind_month",
+            )
+        ]
+
+    @classmethod
+    def apply_deltas(cls, kind, deltas):
+        """Add ``(user_id, category_id, date, amount, count)`` deltas.
+
+        Deltas are merged per rollup row first, so writing many
+        transactions costs one statement per touched month and category.
+        Large sets (bulk imports) go through ``_apply_bulk`` instead.
+        """
+        merged = {}
+        for user_id, category_id, day, amount, count in deltas:
+            key = (user_id, category_id, month_start(day))
+            total, rows = merged.get(key, (Decimal("0"), 0))
+            merged[key] = (total + amount, rows + count)
+        merged = {
+            key: change for key, change in merged.items() if change != (0, 0)
+        }
+
+        with transaction.atomic():
+            if len(merged) > BULK_ROLLUP_THRESHOLD:
+                merged = cls._apply_bulk(kind, merged)
+            for (user_id, category_id, month), (total, rows) in merged.items():
+                lookup = {
+                    "user_id": user_id,
+                    "category_id": category_id,
+                    "kind": kind,
+                    "month": month,
+                }
+                changes = {"total": F("total") + total, "count": F("count") + rows}
+                if cls.objects.filter(**lookup).update(**changes):
+                    continue
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(total=total, count=rows, **lookup)
+                except IntegrityError:
+                    # Created concurrently since the update above
+                    cls.objects.filter(**lookup).update(**changes)
+
+    @classmethod
+    def _apply_bulk(cls, kind, merged):
+        """Apply merged deltas set-wise and return any left to retry.
+
+        Existing rows are found with one query and incremented with one
+        parameterised UPDATE run through ``executemany``; missing rows are
+        inserted with ``bulk_create``. If another writer created one of
+        them first, the missing rows are handed back for the per-row path.
+        """
+        # The filter is per column, so it can also match rows for other
+        # combinations of these users, categories and months
+        existing = {
+            (user_id, category_id, month): pk
+            for pk, user_id, category_id, month in cls.objects.filter(
+                kind=kind,
+                user_id__in={key[0] for key in merged},
+                category_id__in={key[1] for key in merged},
+                month__in={key[2] for key in merged},
+            ).values_list("pk", "user_id", "category_id", "month")
+            if (user_id, category_id, month) in merged
+        }
+
+        total_field = cls._meta.get_field("total")
+        qn = connection.ops.quote_name
+        total, count = qn("total"), qn("count")
+        sql = (
+            f"UPDATE {qn(cls._meta.db_table)} "
+            f"SET {total} = {total} + %s, {count} = {count} + %s "
+            f"WHERE {qn('id')} = %s"
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                sql,
+                [
+                    (
+                        total_field.get_db_prep_save(merged[key][0], connection),
+                        merged[key][1],
+                        pk,
+                    )
+                    for key, pk in existing.items()
+                ],
+            )
+
+        missing = {
+            key: change for key, change in merged.items() if key not in existing
+        }
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create(
+                    cls(
+                        user_id=user_id,
+                        category_id=category_id,
+                        kind=kind,
+                        month=month,
+                        total=total,
+                        count=rows,
+                    )
+                    for (user_id, category_id, month), (total, rows) in missing.items()
+                )
+        except IntegrityError:
+            return missing
+        return {}
+
 
 # ----------------------Budget Model----------------------
 
+# Users per budget lookup in ``Budget.apply_spend_deltas``
+BUDGET_LOOKUP_CHUNK = 500
+
+# Largest value the ``percentage`` column holds (max_digits=5)
+MAX_BUDGET_PERCENTAGE = Decimal("999.99")
+
+
+class RangeSums:
+    """Totals of ``{day: amount}`` over closed date ranges.
+
+    The days are sorted once with a running total, so the sum over any
+    ``[start, end]`` is two binary searches: O(log n) per range instead
+    of a pass over every day.
+    """
+
+    def __init__(self, amounts):
+        self.days = sorted(amounts)
+        self.running = [
+            Decimal("0"),
+            *accumulate(amounts[day] for day in self.days),
+        ]
+
+    def total(self, start, end):
+        """Sum of the amounts dated within ``[start, end]``."""
+        return (
+            self.running[bisect_right(self.days, end)]
+            - self.running[bisect_left(self.days, start)]
+        )
+
+    def first_reaching(self, start, target):
+        """First day on which the total since ``start`` reaches
+        ``target``, or ``None`` if it never does.
+
+        The amounts must not be negative, so the running total only
+        grows and can be binary searched as well.
+        """
+        first = bisect_left(self.days, start)
+        index = bisect_left(self.running, self.running[first] + target, lo=first + 1)
+        return self.days[index - 1] if index < len(self.running) else None
+
 
 class Budget(models.Model):
     """Budget for a category with start/end dates, amount and
@@ -201,11 +737,6 @@ class Budget(models.Model):
     end_date = models.DateField()
     amount = models.DecimalField(max_digits=10, decimal_places=2)
     note = models.CharField(max_length=250, blank=True, null=True)
-    dates = models.CharField(
-        max_length=255,
-        blank=True,
-        help_text=("Comma-separated list of YYYY-MM-DD checkpoints " "(start,end,...)"),
-    )
     remaining_amount = models.DecimalField(
         max_digits=10, decimal_places=2, editable=False
     )
@@ -215,6 +746,7 @@ class Budget(models.Model):
         help_text="Store as a whole number (e.g., 82.50 for 82.5%)",
         editable=False,
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return (
@@ -231,6 +763,71 @@ class Budget(models.Model):
                 name="unique_budget_date_range_per_category",
             )
         ]
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="budget_user_updated_idx"),
+            # Budgets of a user and category overlapping a date range
+            # (progress updates, ``/budgets/?covering=``)
+            models.Index(
+                fields=["user", "category", "start_date", "end_date"],
+                name="budget_user_cat_period_idx",
+            ),
+        ]
+
+    @property
+    def checkpoint_dates(self):
+        """Sorted checkpoint dates, including any not saved yet.
+
+        Reads ``checkpoints`` through its prefetch cache when the budget
+        was loaded with ``prefetch_related("checkpoints")``.
+        """
+        pending = getattr(self, "_pending_checkpoints", None)
+        if pending is not None:
+            return pending
+        if self.pk is None:
+            return []
+        return [checkpoint.date for checkpoint in self.checkpoints.all()]
+
+    @checkpoint_dates.setter
+    def checkpoint_dates(self, days):
+        """Replace the checkpoints; they are written by ``save()``."""
+        self._pending_checkpoints = sorted(set(days))
+
+    @property
+    def dates(self):
+        """Checkpoints in the legacy comma-separated ``YYYY-MM-DD`` form."""
+        return ", ".join(day.isoformat() for day in self.checkpoint_dates)
+
+    @dates.setter
+    def dates(self, value):
+        self.checkpoint_dates = parse_checkpoints(value)
+
+    def checkpoint_spend(self):
+        """Return ``[(day, spent)]``: spend from ``start_date`` to each
+        checkpoint.
+
+        One query: a single pass over the expenses up to the last
+        checkpoint, with one conditional ``SUM`` per checkpoint.
+        """
+        days = self.checkpoint_dates
+        if not days:
+            return []
+        totals = Expense.objects.filter(
+            user_id=self.user_id,
+            category_id=self.category_id,
+            date__gte=self.start_date,
+            # Checkpoints are kept within the period, but never count
+            # spend from outside it
+            date__lte=min(days[-1], self.end_date),
+        ).aggregate(
+            **{
+                f"spent_{index}": Sum("amount", filter=Q(date__lte=day))
+                for index, day in enumerate(days)
+            }
+        )
+        return [
+            (day, totals[f"spent_{index}"] or Decimal("0"))
+            for index, day in enumerate(days)
+        ]
 
     def compute_remaining_and_percentage(self):
         """Compute remaining amount and percentage spent."""
@@ -239,17 +836,145 @@ class Budget(models.Model):
             category=self.category,
             date__range=(self.start_date, self.end_date),
         ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
+        return self.progress(total_spent)
+
+    def progress(self, total_spent):
+        """Return ``(remaining, percentage)`` for ``total_spent``.
+
+        The percentage is capped at ``MAX_BUDGET_PERCENTAGE`` so a large
+        overspend still fits the column.
+        """
         remaining = self.amount - total_spent
         percentage = (
             Decimal("0") if self.amount == 0 else (total_spent / self.amount) * 100
         )
-        return remaining, percentage
+        return remaining, min(percentage, MAX_BUDGET_PERCENTAGE)
 
     def save(self, *args, **kwargs):
         remaining, percentage = self.compute_remaining_and_percentage()
         self.remaining_amount = remaining
         self.percentage = percentage
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            pending = getattr(self, "_pending_checkpoints", None)
+            if pending is not None:
+                self.checkpoints.exclude(date__in=pending).delete()
+                BudgetCheckpoint.objects.bulk_create(
+                    [BudgetCheckpoint(budget=self, date=day) for day in pending],
+                    ignore_conflicts=True,
+                )
+                self._pending_checkpoints = None
+                # Drop a stale prefetch of the old checkpoints
+                getattr(self, "_prefetched_objects_cache", {}).pop(
+                    "checkpoints", None
+                )
+
+    @classmethod
+    def _covering_budgets(cls, merged):
+        """Yield the budgets (locked) that may cover ``{(user_id,
+        category_id): {day: amount}}``.
+
+        Budgets are read by user, category and the overall date span,
+        ``BUDGET_LOOKUP_CHUNK`` users at a time, and the pairs are matched
+        here: an ``OR`` of one condition per pair is slow to build for bulk
+        writes, and SQLite rejects one with a thousand or more terms.
+        """
+        users = sorted({user_id for user_id, _ in merged})
+        categories = {category_id for _, category_id in merged}
+        days = [day for per_day in merged.values() for day in per_day]
+        for first in range(0, len(users), BUDGET_LOOKUP_CHUNK):
+            budgets = cls.objects.select_for_update().filter(
+                user_id__in=users[first : first + BUDGET_LOOKUP_CHUNK],
+                category_id__in=categories,
+                start_date__lte=max(days),
+                end_date__gte=min(days),
+            )
+            for budget in budgets:
+                if (budget.user_id, budget.category_id) in merged:
+                    yield budget
+
+    @classmethod
+    def apply_spend_deltas(cls, deltas):
+        """Apply expense ``(user_id, category_id, date, amount, count)``
+        deltas to the stored progress of every budget covering them.
+
+        All affected budgets are locked and read in one query (per
+        ``BUDGET_LOOKUP_CHUNK`` users) and written back with one
+        ``bulk_update`` (which skips ``auto_now``, so
+        ``updated_at`` is set here), so budget lists never need a per-row
+        aggregate. Each budget's share of the deltas comes from a
+        ``RangeSums`` per user and category rather than by testing every
+        delta date against every budget.
+        """
+        merged = {}
+        for user_id, category_id, day, amount, _count in deltas:
+            per_day = merged.setdefault((user_id, category_id), {})
+            per_day[day] = per_day.get(day, Decimal("0")) + amount
+        if not merged:
+            return
+
+        now = timezone.now()
+        with transaction.atomic():
+            sums = {key: RangeSums(per_day) for key, per_day in merged.items()}
+            changed = []
+            for budget in cls._covering_budgets(merged):
+                spent = sums[(budget.user_id, budget.category_id)].total(
+                    budget.start_date, budget.end_date
+                )
+                if spent == 0:
+                    continue
+                total_spent = budget.amount - budget.remaining_amount + spent
+                budget.remaining_amount, budget.percentage = budget.progress(
+                    total_spent
+                )
+                budget.updated_at = now
+                changed.append(budget)
+            cls.objects.bulk_update(
+                changed, ["remaining_amount", "percentage", "updated_at"]
+            )
+            record_changes(cls, {budget.user_id for budget in changed})
+
+
+def parse_checkpoints(value):
+    """Parse comma-separated ``YYYY-MM-DD`` dates; blanks are skipped.
+
+    Raises ``ValueError`` naming the first entry that is not a date.
+    """
+    days = []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            day = parse_date(part)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValueError(f"{part!r} is not a YYYY-MM-DD date.")
+        days.append(day)
+    return days
+
+
+class BudgetCheckpoint(models.Model):
+    """A date within a budget at which its spend is reported."""
+
+    budget = models.ForeignKey(
+        Budget, on_delete=models.CASCADE, related_name="checkpoints"
+    )
+    date = models.DateField()
+
+    def __str__(self):
+        return f"{self.budget_id} @ {self.date}"
+
+    class Meta:
+        """Meta class for the BudgetCheckpoint model."""
+
+        ordering = ["date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["budget", "date"], name="unique_checkpoint_per_budget"
+            )
+        ]
 
 
 # ----------------------Goal Model----------------------
@@ -264,10 +989,135 @@ class Goal(models.Model):
     deadline = models.DateField()
     note = models.CharField(max_length=250, blank=True, null=True)
     status = models.CharField(max_length=30)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name} - ${self.target} ({self.status})"
 
+    class Meta:
+        """Meta class for the Goal model."""
+
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="goal_user_updated_idx")
+        ]
+
+
+# ----------------------Tombstone Model----------------------
+
+
+class Tombstone(models.Model):
+    """Record of a deleted row, so delta sync can tell clients to drop it.
+
+    Written by a ``post_delete`` handler in ``api.signals`` and pruned
+    with the ``prune_tombstones`` command once older than the sync token
+    lifetime.
+    """
+
+    # No FK constraint: deleting a user cascades to rows whose tombstones
+    # are written after the user's own tombstones have been collected.
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="tombstones",
+        db_constraint=False,
+    )
+    model = models.CharField(max_length=30, help_text="Model name, e.g. expense")
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} deleted {self.deleted_at}"
+
+    class Meta:
+        """Meta class for the Tombstone model."""
+
+        indexes = [
+            models.Index(
+                fields=["user", "deleted_at"], name="tombstone_user_deleted_idx"
+            )
+        ]
+
+
+# ----------------------Data Version Model----------------------
+
+# Users per counter UPDATE in ``DataVersion.bump``
+DATA_VERSION_CHUNK = 500
+
+
+class DataVersion(models.Model):
+    """Per-user, per-model change counter behind conditional GET ETags.
+
+    Every write to a synced model bumps its owner's counter inside the
+    write's transaction (see ``record_changes``), so each commit makes a
+    new value visible whatever order the transactions stamped their
+    ``updated_at`` in. Reading it is one unique-index lookup, however
+    many rows the user has.
+    """
+
+    # No FK constraint, as for ``Tombstone``: rows cascading from a
+    # deleted user bump counters after the user's own were collected.
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="data_versions",
+        db_constraint=False,
+    )
+    model = models.CharField(max_length=30, help_text="Model name, e.g. expense")
+    counter = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.model} version {self.counter} of user {self.user_id}"
+
+    class Meta:
+        """Meta class for the DataVersion model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "model"], name="unique_data_version_per_user_model"
+            )
+        ]
+
+    @classmethod
+    def bump(cls, keys):
+        """Increment the counters of ``(user_id, model_name)`` ``keys``,
+        creating the missing ones.
+
+        One UPDATE per model name (and user chunk); models and users are
+        taken in sorted order so concurrent writers lock counters in the
+        same order.
+        """
+        users_by_model = {}
+        for user_id, model in keys:
+            users_by_model.setdefault(model, set()).add(user_id)
+        for model, user_ids in sorted(users_by_model.items()):
+            user_ids = sorted(user_ids)
+            for start in range(0, len(user_ids), DATA_VERSION_CHUNK):
+                chunk = user_ids[start : start + DATA_VERSION_CHUNK]
+                rows = cls.objects.filter(model=model, user_id__in=chunk)
+                if rows.update(counter=F("counter") + 1) == len(chunk):
+                    continue
+                # First write of this model for some users: create their
+                # counters, then bump the chunk again. Counters only need
+                # to change, so bumping the others twice is harmless, and a
+                # counter created concurrently is still bumped here.
+                cls.objects.bulk_create(
+                    [cls(user_id=user_id, model=model) for user_id in chunk],
+                    ignore_conflicts=True,
+                )
+                rows.update(counter=F("counter") + 1)
+
+
+def record_changes(model, user_ids):
+    """Bump ``model``'s data version for ``user_ids``, now or once per
+    ``deferred_bookkeeping()`` block.
+
+    Saves and deletes do this from signal handlers (``api.signals``);
+    code writing with ``bulk_create``, ``bulk_update``, ``QuerySet.update``
+    or raw SQL must call it itself.
+    """
+    name = model._meta.model_name
+    defer_or_apply(DataVersion.bump, [(user_id, name) for user_id in user_ids])
+
 
 # ----------------------User Profile----------------------
 
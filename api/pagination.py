@@ -0,0 +1,266 @@
+"""Keyset (cursor) pagination for the transaction list endpoints.
+
+Pagination is opt-in: a list request is only paginated when it carries a
+``cursor`` or ``page_size`` query parameter, so existing clients that
+expect a plain list keep working.
+
+Pages are located with a seek predicate on the queryset ordering (for
+example ``date < d OR (date = d AND id < i)``) instead of OFFSET, so the
+cost of fetching a page does not depend on how deep into the history it
+is.
+"""
+
+# pylint: disable=no-member
+
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import DateField, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .ledger import LEDGER_KINDS
+
+
+def _resolve_field(model, path):
+    """Return the model field at the end of a ``__`` separated path."""
+    field = None
+    for part in path.split("__"):
+        field = model._meta.get_field(part)
+        if field.is_relation:
+            model = field.related_model
+    return field
+
+
+def _resolve_value(obj, path):
+    """Read a (possibly related) attribute at a ``__`` separated path."""
+    for part in path.split("__"):
+        obj = getattr(obj, part)
+    return obj
+
+
+class KeysetPagination(BasePagination):
+    """Seek-based pagination over the queryset's ``order_by`` fields.
+
+    The primary key is appended to the ordering as a tie-breaker so that
+    every row has a unique position. Cursors are opaque, URL-safe tokens
+    holding the ordering values of the boundary row and the direction of
+    travel.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 500
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.base_url = None
+        self.ordering = None
+        self.page = None
+        self.next_position = None
+        self.previous_position = None
+
+    def is_requested(self, request):
+        """Return True when the client opted into pagination."""
+        params = request.query_params
+        return (
+            self.cursor_query_param in params
+            or self.page_size_query_param in params
+        )
+
+    def get_page_size(self, request):
+        """Return the requested page size, clamped to the allowed range."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """Return the queryset ordering with a unique ``pk`` tie-breaker."""
+        ordering = [str(field) for field in queryset.query.order_by]
+        if not ordering:
+            ordering = list(queryset.model._meta.ordering or [])
+        pk_name = queryset.model._meta.pk.name
+        if not any(f.lstrip("-") in ("pk", pk_name) for f in ordering):
+            last_desc = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(f"-{pk_name}" if last_desc else pk_name)
+        return [
+            f.replace("pk", pk_name) if f.lstrip("-") == "pk" else f
+            for f in ordering
+        ]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        position, reverse = self.decode_cursor(
+            encoded, getattr(queryset, "model", None)
+        )
+
+        rows = self.fetch_rows(queryset, position, reverse, page_size + 1)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+        self.page = rows
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else position is not None
+        self.next_position = (
+            self._position(rows[-1]) if rows and has_next else None
+        )
+        self.previous_position = (
+            self._position(rows[0]) if rows and has_previous else None
+        )
+        return rows
+
+    def fetch_rows(self, queryset, position, reverse, limit):
+        """Return up to ``limit`` rows past ``position`` in travel order."""
+        order_by = self.ordering
+        if reverse:
+            order_by = [self._flip(field) for field in order_by]
+        queryset = queryset.order_by(*order_by)
+        if position is not None:
+            queryset = queryset.filter(self.seek_filter(order_by, position))
+        return list(queryset[:limit])
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    def seek_filter(self, ordering, position):
+        """Build ``(a, b, c) > (x, y, z)`` honouring per-field direction."""
+        clauses = []
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            clause = {
+                ordering[i].lstrip("-"): position[i] for i in range(index)
+            }
+            clause[f"{name}__{lookup}"] = position[index]
+            clauses.append(Q(**clause))
+        # The redundant bound on the leading column lets the planner turn
+        # the OR chain into an index range scan instead of a filtered walk.
+        leading = ordering[0]
+        bound = "lte" if leading.startswith("-") else "gte"
+        return Q(**{f"{leading.lstrip('-')}__{bound}": position[0]}) & reduce(
+            or_, clauses
+        )
+
+    def encode_cursor(self, position, reverse):
+        """Serialise a position into an opaque URL-safe token."""
+        payload = {"v": position, "r": int(reverse)}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, encoded, model):
+        """Return ``(position, reverse)`` for a cursor token."""
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            values = payload["v"]
+            reverse = bool(payload.get("r", 0))
+            if len(values) != len(self.ordering):
+                raise ValueError("cursor does not match ordering")
+            position = self.to_position(values, model)
+        except (
+            TypeError,
+            ValueError,
+            KeyError,
+            binascii.Error,
+            ValidationError,
+        ) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        return position, reverse
+
+    def to_position(self, values, model):
+        """Convert decoded cursor values back to ordering field values."""
+        return [
+            _resolve_field(model, field.lstrip("-")).to_python(value)
+            for field, value in zip(self.ordering, values)
+        ]
+
+    def _position(self, obj):
+        values = []
+        for field in self.ordering:
+            value = _resolve_value(obj, field.lstrip("-"))
+            values.append(value if isinstance(value, (int, str)) else str(value))
+        return values
+
+    def _link(self, position, reverse):
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        token = self.encode_cursor(position, reverse)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+
+class LedgerPagination(KeysetPagination):
+    """Keyset pagination over an ``api.ledger.Ledger`` (always on).
+
+    Positions are ``(date, kind, id)``; rows are dicts fetched by the
+    ledger's ``UNION ALL`` query.
+    """
+
+    def is_requested(self, request):
+        return True
+
+    def get_ordering(self, queryset):
+        return list(queryset.ordering)
+
+    def fetch_rows(self, queryset, position, reverse, limit):
+        return queryset.fetch(position, queryset.descending != reverse, limit)
+
+    def to_position(self, values, model):
+        day, kind, pk = values
+        if kind not in LEDGER_KINDS or isinstance(pk, bool):
+            raise ValueError("unknown ledger position")
+        return [DateField().to_python(day), kind, int(pk)]
+
+    def _position(self, obj):
+        return [obj["date"].isoformat(), obj["kind"], obj["id"]]
@@ -0,0 +1,131 @@
+"""Materialization of recurring expense and income rules.
+
+``materialize_recurring`` writes every occurrence due by a date as an
+expense or income row, for all users in one pass. Due rules are read in
+batches in primary key order. Each batch's occurrences are inserted
+with one ``bulk_create`` per model, and the rules' schedule pointers
+are advanced with one parameterised UPDATE run through ``executemany``.
+Rollups and budgets are updated once per batch. Every row carries its
+rule and scheduled date (unique together), and occurrences already
+present are skipped, so rerunning for the same date creates nothing.
+"""
+
+# pylint: disable=no-member
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .caching import invalidate_dashboard
+from .models import Expense, Income, RecurringRule, record_changes
+
+RECURRING_BATCH_SIZE = 1000
+
+
+def materialize_recurring(
+    until=None, user_ids=None, batch_size=RECURRING_BATCH_SIZE
+):
+    """Create the occurrences of all rules due on or before ``until``
+    (default today), optionally only for ``user_ids``.
+
+    Runs in one transaction and returns the number of rows created.
+    """
+    until = until or timezone.localdate()
+    rules = RecurringRule.objects.filter(next_date__lte=until)
+    if user_ids is not None:
+        rules = rules.filter(user_id__in=user_ids)
+    rules = rules.select_for_update().order_by("pk")
+
+    created = 0
+    with transaction.atomic():
+        last_pk = 0
+        while True:
+            batch = list(rules.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            created += materialize_batch(batch, until)
+    return created
+
+
+def materialize_batch(rules, until):
+    """Write the occurrences of ``rules`` due by ``until`` and advance the
+    rules. Returns the number of rows created."""
+    occurrences = {Expense: [], Income: []}
+    for rule in rules:
+        occurrences[rule.transaction_model].extend(
+            rule.build_occurrence(day) for day in rule.advance(until)
+        )
+
+    created = 0
+    for model, rows in occurrences.items():
+        rows = skip_existing(model, rows)
+        if not rows:
+            continue
+        model.objects.bulk_create(rows)
+        model.apply_deltas(
+            [(row.user_id, row.category_id, row.date, row.amount, 1) for row in rows]
+        )
+        record_changes(model, {row.user_id for row in rows})
+        created += len(rows)
+
+    save_schedules(rules)
+    user_ids = {rule.user_id for rule in rules}
+    record_changes(RecurringRule, user_ids)
+    for user_id in user_ids:
+        invalidate_dashboard(user_id)
+    return created
+
+
+def skip_existing(model, rows):
+    """Drop the ``rows`` whose occurrence already exists, e.g. because a
+    rule's start date was moved back after some were written."""
+    if not rows:
+        return rows
+    existing = set(
+        model.objects.filter(
+            recurring_rule__in={row.recurring_rule_id for row in rows},
+            occurrence__gte=min(row.occurrence for row in rows),
+        ).values_list("recurring_rule_id", "occurrence")
+    )
+    if not existing:
+        return rows
+    return [
+        row
+        for row in rows
+        if (row.recurring_rule_id, row.occurrence) not in existing
+    ]
+
+
+def save_schedules(rules):
+    """Write the advanced ``next_index``/``next_date`` of ``rules``.
+
+    ``QuerySet.bulk_update`` would build a CASE expression per row, which
+    dominates at this scale; ``updated_at`` is bumped here because the
+    raw UPDATE skips ``auto_now``.
+    """
+    meta = RecurringRule._meta
+    quote = connection.ops.quote_name
+    index_field = meta.get_field("next_index")
+    date_field = meta.get_field("next_date")
+    updated_field = meta.get_field("updated_at")
+    sql = (
+        f"UPDATE {quote(meta.db_table)} "
+        f"SET {quote(index_field.column)} = %s, "
+        f"{quote(date_field.column)} = %s, "
+        f"{quote(updated_field.column)} = %s "
+        f"WHERE {quote(meta.pk.column)} = %s"
+    )
+    now = updated_field.get_db_prep_save(timezone.now(), connection)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            sql,
+            [
+                (
+                    rule.next_index,
+                    date_field.get_db_prep_save(rule.next_date, connection),
+                    now,
+                    rule.pk,
+                )
+                for rule in rules
+            ],
+        )
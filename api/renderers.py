@@ -0,0 +1,71 @@
+"""Response renderers for the api app."""
+
+import csv
+import io
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .exports import CSVRenderer
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see README
+    orjson = None
+
+# Types orjson cannot encode itself (Decimal, lazy strings, querysets...)
+# are handed to DRF's encoder so the output matches ``JSONRenderer``.
+_drf_default = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` that encodes with orjson when it is installed.
+
+    The output matches the stock renderer's compact form: datetimes in
+    UTC end in ``Z``, decimals the serializers left as ``Decimal`` become
+    numbers and U+2028/U+2029 are escaped. Indented output (the browsable
+    API, ``; indent=`` in ``Accept``) and anything orjson rejects, such as
+    integers beyond 64 bits, falls back to the stock renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=_drf_default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same as JSONRenderer: keep the output safe to embed in <script>
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class PivotCSVRenderer(CSVRenderer):
+    """Renders the pivot report as a spreadsheet-ready CSV table.
+
+    One row per category with a column per period and a ``total``
+    column, followed by a ``Total`` row. Error payloads are rendered as
+    JSON, like the export renderers.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if "categories" not in data:
+            return super().render(data, accepted_media_type, renderer_context)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["category", *data["periods"], "total"])
+        for row in data["categories"]:
+            writer.writerow([row["name"], *row["values"], row["total"]])
+        writer.writerow(["Total", *data["totals"], data["total"]])
+        return buffer.getvalue().encode(self.charset)
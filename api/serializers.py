@@ -2,8 +2,195 @@
 
 # pylint: disable=no-member
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Expense, Category, Income, Budget, Goal, Project, Client
+from .caching import invalidate_dashboard
+from .models import (
+    Expense,
+    Category,
+    Income,
+    Budget,
+    Goal,
+    Project,
+    Client,
+    RecurringRule,
+    parse_checkpoints,
+    record_changes,
+)
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """``PrimaryKeyRelatedField`` that can resolve ids from a preloaded map.
+
+    ``TransactionListSerializer`` fills ``preloaded`` with one ``in_bulk``
+    query per relation before validating a list, so rows do not each
+    query for their related objects. Outside a list it behaves as usual.
+    """
+
+    preloaded = None
+
+    def to_internal_value(self, data):
+        if self.preloaded is None:
+            return super().to_internal_value(data)
+        pk = self.coerce_pk(data)
+        if pk is None:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if pk not in self.preloaded:
+            self.fail("does_not_exist", pk_value=data)
+        return self.preloaded[pk]
+
+    def coerce_pk(self, data):
+        """Return ``data`` as a primary key value, or None if it is not one."""
+        if isinstance(data, bool):
+            return None
+        try:
+            return self.get_queryset().model._meta.pk.to_python(data)
+        except DjangoValidationError:
+            return None
+
+
+class SparseFieldsMixin:
+    """Flat and sparse rendering for ``?expand=``/``?fields=`` requests.
+
+    When the context holds ``sparse`` (a ``(fields, expand)`` pair set by
+    ``SparseFieldsetMixin`` in the views), each relation in
+    ``expandable_fields`` is rendered as its ``<name>_id`` instead of a
+    nested object unless ``expand`` names it. Dotted paths such as
+    ``project.client`` expand inside an expanded relation. ``fields``,
+    when not None, limits the output to the named fields.
+    """
+
+    expandable_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        sparse = self.context.get("sparse")
+        if sparse is not None:
+            self.apply_sparse(*sparse)
+
+    @classmethod
+    def split_expand(cls, expand, prefix=""):
+        """Group ``expand`` paths by relation, rejecting unknown ones."""
+        nested = {}
+        for path in sorted(expand):
+            name, _, rest = path.partition(".")
+            field = cls._declared_fields.get(name)
+            if name not in cls.expandable_fields or (
+                rest and not isinstance(field, SparseFieldsMixin)
+            ):
+                raise serializers.ValidationError(
+                    {"expand": [f"Cannot expand '{prefix}{path}'."]}
+                )
+            nested.setdefault(name, set())
+            if rest:
+                nested[name].add(rest)
+        for name, paths in nested.items():
+            if paths:
+                cls._declared_fields[name].split_expand(paths, f"{prefix}{name}.")
+        return nested
+
+    def apply_sparse(self, fields, expand):
+        """Swap unexpanded relations for ids and drop unrequested fields."""
+        nested = self.split_expand(expand)
+        for name in self.expandable_fields:
+            if name not in nested:
+                # The write-only ``<name>_id`` field reads the raw foreign key
+                del self.fields[name]
+                self.fields[f"{name}_id"].write_only = False
+            elif isinstance(self.fields[name], SparseFieldsMixin):
+                self.fields[name].apply_sparse(None, nested[name])
+
+        if fields is not None:
+            readable = {
+                name for name, field in self.fields.items() if not field.write_only
+            }
+            unknown = fields - readable
+            if unknown:
+                raise serializers.ValidationError(
+                    {"fields": [f"Unknown fields: {', '.join(sorted(unknown))}."]}
+                )
+            ids = {f"{name}_id" for name in self.expandable_fields}
+            for name in readable - fields:
+                # Keep the id fields: subclasses configure their querysets
+                if name in ids:
+                    self.fields[name].write_only = True
+                else:
+                    del self.fields[name]
+
+
+class TransactionListSerializer(serializers.ListSerializer):
+    """Batch create/update of expenses or income.
+
+    Related ids are preloaded once per list, rows are written with
+    ``bulk_create``/``bulk_update`` and rollups and budgets are updated
+    once for the whole list. For updates, ``instance`` must be a list
+    aligned with the submitted items (each of which carries its ``id``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.instances_by_pk = {obj.pk: obj for obj in self.instance or []}
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            return super().to_internal_value(data)
+        relations = [
+            field
+            for field in self.child.fields.values()
+            if isinstance(field, PreloadedPrimaryKeyRelatedField)
+        ]
+        for field in relations:
+            pks = {
+                field.coerce_pk(item[field.field_name])
+                for item in data
+                if isinstance(item, dict) and item.get(field.field_name) is not None
+            }
+            pks.discard(None)
+            field.preloaded = field.get_queryset().in_bulk(pks) if pks else {}
+        try:
+            return super().to_internal_value(data)
+        finally:
+            for field in relations:
+                field.preloaded = None
+
+    def run_child_validation(self, data):
+        if self.instance is not None:
+            self.child.instance = self.instances_by_pk.get(data.get("id"))
+        return super().run_child_validation(data)
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        instances = model.objects.bulk_create(
+            [model(**attrs) for attrs in validated_data]
+        )
+        model.record_deltas([(*obj.rollup_key(), 1) for obj in instances])
+        user_ids = {obj.user_id for obj in instances}
+        record_changes(model, user_ids)
+        for user_id in user_ids:
+            invalidate_dashboard(user_id)
+        return instances
+
+    def update(self, instance, validated_data):
+        model = self.child.Meta.model
+        # bulk_update skips auto_now, so stamp the sync timestamp here
+        now = timezone.now()
+        deltas, fields = [], {"updated_at"}
+        for obj, attrs in zip(instance, validated_data):
+            user_id, category_id, day, amount = obj.rollup_key()
+            deltas.append((user_id, category_id, day, -amount, -1))
+            for name, value in attrs.items():
+                setattr(obj, name, value)
+            obj.updated_at = now
+            fields.update(attrs)
+            deltas.append((*obj.rollup_key(), 1))
+        model.objects.bulk_update(instance, sorted(fields))
+        model.record_deltas(deltas)
+        user_ids = {obj.user_id for obj in instance}
+        record_changes(model, user_ids)
+        for user_id in user_ids:
+            invalidate_dashboard(user_id)
+        return instance
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -19,7 +206,22 @@ class ClientSerializer(serializers.ModelSerializer):
         read_only_fields = ["user"]
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ClientStatsSerializer(ClientSerializer):
+    """``ClientSerializer`` plus the columns annotated in stats mode."""
+
+    income_total = serializers.DecimalField(
+        max_digits=14, decimal_places=2, read_only=True
+    )
+    expense_total = serializers.DecimalField(
+        max_digits=14, decimal_places=2, read_only=True
+    )
+    net = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    project_count = serializers.IntegerField(read_only=True)
+    last_activity = serializers.DateField(read_only=True)
+
+
+class ProjectSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = ("client",)
     client = ClientSerializer(read_only=True)
     client_id = serializers.PrimaryKeyRelatedField(
         queryset=Client.objects.none(),  # Placeholder - will be set in __init__
@@ -41,19 +243,37 @@ class ProjectSerializer(serializers.ModelSerializer):
         read_only_fields = ["user"]
 
 
-class ExpenseSerializer(serializers.ModelSerializer):
+class ProjectPnLSerializer(ProjectSerializer):
+    """``ProjectSerializer`` plus the columns annotated in P&L mode."""
+
+    expense_total = serializers.DecimalField(
+        max_digits=14, decimal_places=2, read_only=True
+    )
+    income_total = serializers.DecimalField(
+        max_digits=14, decimal_places=2, read_only=True
+    )
+    expense_count = serializers.IntegerField(read_only=True)
+    income_count = serializers.IntegerField(read_only=True)
+    net = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    margin = serializers.DecimalField(
+        max_digits=14, decimal_places=2, read_only=True, allow_null=True
+    )
+
+
+class ExpenseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = ("category", "project", "client")
     category = CategorySerializer(read_only=True)
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = PreloadedPrimaryKeyRelatedField(
         queryset=Category.objects.all(), source="category", write_only=True
     )
     project = ProjectSerializer(read_only=True)
-    project_id = serializers.PrimaryKeyRelatedField(
+    project_id = PreloadedPrimaryKeyRelatedField(
         queryset=Project.objects.none(),  # Placeholder - will be set in __init__
         source="project", write_only=True, required=False, allow_null=True
     )
     
     client = ClientSerializer(read_only=True)
-    client_id = serializers.PrimaryKeyRelatedField(
+    client_id = PreloadedPrimaryKeyRelatedField(
         queryset=Client.objects.none(),  # Placeholder - will be set in __init__
         source="client", write_only=True, required=False, allow_null=True
     )
@@ -63,28 +283,32 @@ class ExpenseSerializer(serializers.ModelSerializer):
         super().__init__(*args, **kwargs)
         request = self.context.get('request')
         if request and hasattr(request, 'user'):
-            self.fields['project_id'].queryset = Project.objects.filter(user=request.user)
+            self.fields['project_id'].queryset = Project.objects.filter(
+                user=request.user
+            ).select_related("client")
             self.fields['client_id'].queryset = Client.objects.filter(user=request.user)
 
     class Meta:
         model = Expense
         fields = "__all__"
         read_only_fields = ["user"]
+        list_serializer_class = TransactionListSerializer
 
 
-class IncomeSerializer(serializers.ModelSerializer):
+class IncomeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = ("category", "project", "client")
     category = CategorySerializer(read_only=True)
-    category_id = serializers.PrimaryKeyRelatedField(
+    category_id = PreloadedPrimaryKeyRelatedField(
         queryset=Category.objects.all(), source="category", write_only=True
     )
     project = ProjectSerializer(read_only=True)
-    project_id = serializers.PrimaryKeyRelatedField(
+    project_id = PreloadedPrimaryKeyRelatedField(
         queryset=Project.objects.none(),  # Placeholder - will be set in __init__
         source="project", write_only=True, required=False, allow_null=True
     )
     
     client = ClientSerializer(read_only=True)
-    client_id = serializers.PrimaryKeyRelatedField(
+    client_id = PreloadedPrimaryKeyRelatedField(
         queryset=Client.objects.none(),  # Placeholder - will be set in __init__
         source="client", write_only=True, required=False, allow_null=True
     )
@@ -94,25 +318,100 @@ class IncomeSerializer(serializers.ModelSerializer):
         super().__init__(*args, **kwargs)
         request = self.context.get('request')
         if request and hasattr(request, 'user'):
-            self.fields['project_id'].queryset = Project.objects.filter(user=request.user)
+            self.fields['project_id'].queryset = Project.objects.filter(
+                user=request.user
+            ).select_related("client")
             self.fields['client_id'].queryset = Client.objects.filter(user=request.user)
 
     class Meta:
         model = Income
         fields = "__all__"
         read_only_fields = ["user"]
+        list_serializer_class = TransactionListSerializer
 
 
-class BudgetSerializer(serializers.ModelSerializer):
+class RecurringRuleSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(), source="category", write_only=True
     )
     amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    interval = serializers.IntegerField(min_value=1, max_value=1000, default=1)
+    count = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request and hasattr(request, "user"):
+            self.fields["project"].queryset = Project.objects.filter(
+                user=request.user
+            )
+            self.fields["client"].queryset = Client.objects.filter(user=request.user)
+
+    class Meta:
+        model = RecurringRule
+        fields = "__all__"
+        read_only_fields = ["user"]
 
     # pylint: disable=arguments-renamed
     def validate(self, data):
-        """Validate that end_date is after start_date."""
+        """Validate that the category matches the kind and that end_date
+        is not before start_date."""
+
+        def value(name):
+            if name in data:
+                return data[name]
+            return getattr(self.instance, name, None)
+
+        kind, category = value("kind"), value("category")
+        if category is not None and category.category_type != kind:
+            raise serializers.ValidationError(
+                {"category_id": f"Choose a {kind.lower()} category."}
+            )
+        start_date, end_date = value("start_date"), value("end_date")
+        if start_date and end_date and end_date < start_date:
+            raise serializers.ValidationError(
+                {"end_date": "End date must not be before start date."}
+            )
+        return data
+
+
+class CheckpointDatesField(serializers.CharField):
+    """A budget's checkpoints as comma-separated ``YYYY-MM-DD`` dates."""
+
+    default_error_messages = {
+        "invalid": "Enter comma-separated dates in YYYY-MM-DD format."
+    }
+
+    def to_internal_value(self, data):
+        try:
+            return parse_checkpoints(super().to_internal_value(data))
+        except ValueError:
+            self.fail("invalid")
+
+    def to_representation(self, value):
+        return ", ".join(day.isoformat() for day in value)
+
+
+class BudgetSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = ("category",)
+    category = CategorySerializer(read_only=True)
+    category_id = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(), source="category", write_only=True
+    )
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    checkpoints = serializers.ListField(
+        child=serializers.DateField(), source="checkpoint_dates", required=False
+    )
+    # Legacy string form of ``checkpoints``
+    dates = CheckpointDatesField(
+        source="checkpoint_dates", required=False, allow_blank=True
+    )
+
+    # pylint: disable=arguments-renamed
+    def validate(self, data):
+        """Validate that end_date is after start_date and that every
+        checkpoint falls within the budget period."""
 
         start_date = data.get("start_date")
         end_date = data.get("end_date")
@@ -123,6 +422,20 @@ class BudgetSerializer(serializers.ModelSerializer):
                     {"end_date": "End date must be after start date."}
                 )
 
+        checkpoints = data.get("checkpoint_dates")
+        if checkpoints is None and self.instance is not None and (
+            "start_date" in data or "end_date" in data
+        ):
+            # A moved period must still hold the stored checkpoints
+            checkpoints = self.instance.checkpoint_dates
+        if checkpoints:
+            start_date = start_date or self.instance.start_date
+            end_date = end_date or self.instance.end_date
+            if not all(start_date <= day <= end_date for day in checkpoints):
+                raise serializers.ValidationError(
+                    {"checkpoints": "Checkpoints must fall within the budget period."}
+                )
+
         return data
 
     class Meta:
@@ -138,3 +451,107 @@ class GoalSerializer(serializers.ModelSerializer):
         model = Goal
         fields = "__all__"
         read_only_fields = ["user"]
+
+
+# pylint: disable=abstract-method
+class LedgerEntrySerializer(serializers.Serializer):
+    """One row of the merged ledger (see ``api.ledger``); relations are ids."""
+
+    kind = serializers.CharField()
+    id = serializers.IntegerField()
+    date = serializers.DateField()
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    balance = serializers.DecimalField(max_digits=16, decimal_places=2)
+    note = serializers.CharField(allow_null=True)
+    category_id = serializers.IntegerField()
+    category = serializers.CharField(source="category_name")
+    project_id = serializers.IntegerField(allow_null=True)
+    client_id = serializers.IntegerField(allow_null=True)
+
+
+class LedgerDaySerializer(serializers.Serializer):
+    """One day of the balance series: its totals and closing balance."""
+
+    date = serializers.DateField()
+    income = serializers.DecimalField(max_digits=16, decimal_places=2)
+    expenses = serializers.DecimalField(max_digits=16, decimal_places=2)
+    balance = serializers.DecimalField(max_digits=16, decimal_places=2)
+
+
+class LedgerBalanceSerializer(serializers.Serializer):
+    """Balance over a date window (see ``Ledger.daily_balances``)."""
+
+    opening_balance = serializers.DecimalField(max_digits=16, decimal_places=2)
+    closing_balance = serializers.DecimalField(max_digits=16, decimal_places=2)
+    days = LedgerDaySerializer(many=True)
+
+
+class ReportPeriodSerializer(serializers.Serializer):
+    """One period of the time-series report (see ``api.reports``)."""
+
+    period_start = serializers.DateField()
+    income = serializers.DecimalField(max_digits=16, decimal_places=2)
+    expenses = serializers.DecimalField(max_digits=16, decimal_places=2)
+    net = serializers.DecimalField(max_digits=16, decimal_places=2)
+
+
+class TimeSeriesReportSerializer(serializers.Serializer):
+    """Income vs expenses per period over a date range."""
+
+    period = serializers.CharField()
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    results = ReportPeriodSerializer(many=True)
+
+
+class PivotCategorySerializer(serializers.Serializer):
+    """One category row of the pivot report, aligned with its periods."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    values = serializers.ListField(
+        child=serializers.DecimalField(max_digits=16, decimal_places=2)
+    )
+    total = serializers.DecimalField(max_digits=16, decimal_places=2)
+
+
+class PivotReportSerializer(serializers.Serializer):
+    """Category x period totals of expenses or income (see ``api.reports``)."""
+
+    kind = serializers.CharField()
+    period = serializers.CharField()
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    periods = serializers.ListField(child=serializers.DateField())
+    categories = PivotCategorySerializer(many=True)
+    totals = serializers.ListField(
+        child=serializers.DecimalField(max_digits=16, decimal_places=2)
+    )
+    total = serializers.DecimalField(max_digits=16, decimal_places=2)
+
+
+class BudgetCheckpointSpendSerializer(serializers.Serializer):
+    """Spend of a budget from its start up to one checkpoint."""
+
+    date = serializers.DateField()
+    spent = serializers.DecimalField(max_digits=14, decimal_places=2)
+    remaining = serializers.DecimalField(max_digits=14, decimal_places=2)
+    percentage = serializers.DecimalField(max_digits=7, decimal_places=2)
+
+
+class BudgetForecastSerializer(serializers.Serializer):
+    """Burn-rate forecast of one active budget."""
+
+    id = serializers.IntegerField(source="budget.id")
+    category = CategorySerializer(source="budget.category")
+    start_date = serializers.DateField(source="budget.start_date")
+    end_date = serializers.DateField(source="budget.end_date")
+    amount = serializers.DecimalField(
+        source="budget.amount", max_digits=10, decimal_places=2
+    )
+    spent = serializers.DecimalField(max_digits=14, decimal_places=2)
+    daily_rate = serializers.DecimalField(max_digits=14, decimal_places=2)
+    projected_spend = serializers.DecimalField(max_digits=14, decimal_places=2)
+    projected_remaining = serializers.DecimalField(max_digits=14, decimal_places=2)
+    runs_out_on = serializers.DateField(allow_null=True)
+    at_risk = serializers.BooleanField()
@@ -0,0 +1,158 @@
+"""Model signal handlers for the api app.
+
+Imported from ``ApiConfig.ready`` so the handlers are connected once the
+app registry is ready.
+"""
+
+# pylint: disable=unused-argument
+
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.utils import timezone
+
+from .caching import invalidate_dashboard
+from .models import (
+    Budget,
+    Client,
+    Expense,
+    Goal,
+    Income,
+    Project,
+    RecurringRule,
+    Tombstone,
+    defer_or_apply,
+    record_changes,
+)
+
+# Models whose rows appear in (or are nested inside) the dashboard payload
+DASHBOARD_MODELS = (Expense, Income, Budget, Goal, Project, Client)
+
+
+def invalidate_dashboard_cache(sender, instance, **kwargs):
+    """Drop the owner's cached dashboard when a summarised row changes."""
+    invalidate_dashboard(instance.user_id)
+
+
+for _model in DASHBOARD_MODELS:
+    for _signal in (post_save, post_delete):
+        _signal.connect(
+            invalidate_dashboard_cache,
+            sender=_model,
+            dispatch_uid=f"dashboard-cache-{_model.__name__}-{id(_signal)}",
+        )
+
+
+def remove_from_totals(sender, instance, **kwargs):
+    """Subtract a deleted transaction from its rollup and budgets.
+
+    ``post_delete`` is sent inside the deletion's transaction, for
+    ``QuerySet.delete()`` and cascades as well as ``Model.delete()``.
+    """
+    user_id, category_id, day, amount = instance.rollup_key()
+    sender.record_deltas([(user_id, category_id, day, -amount, -1)])
+
+
+for _model in (Expense, Income):
+    post_delete.connect(
+        remove_from_totals,
+        sender=_model,
+        dispatch_uid=f"transaction-totals-{_model.__name__}",
+    )
+
+
+# Models served by the delta sync endpoint (all carry ``updated_at``)
+SYNC_MODELS = (Expense, Income, Budget, Goal, Project, Client, RecurringRule)
+
+
+def record_tombstone(sender, instance, **kwargs):
+    """Log a deleted synced row so delta sync can report it."""
+    tombstone = Tombstone(
+        user_id=instance.user_id,
+        model=sender._meta.model_name,
+        object_id=instance.pk,
+    )
+    defer_or_apply(Tombstone.objects.bulk_create, [tombstone])
+
+
+for _model in SYNC_MODELS:
+    post_delete.connect(
+        record_tombstone,
+        sender=_model,
+        dispatch_uid=f"sync-tombstone-{_model.__name__}",
+    )
+
+
+def bump_data_version(sender, instance, **kwargs):
+    """Bump the owner's data version of a saved or deleted synced row."""
+    record_changes(sender, [instance.user_id])
+
+
+for _model in SYNC_MODELS:
+    for _signal in (post_save, post_delete):
+        _signal.connect(
+            bump_data_version,
+            sender=_model,
+            dispatch_uid=f"data-version-{_model.__name__}-{id(_signal)}",
+        )
+
+
+# Rows whose serialized form nests a project or client, as
+# ``(model, Q matching rows that embed the instance)`` builders
+NESTED_REFERENCES = {
+    Client: lambda client: (
+        (Project, Q(client=client)),
+        (Expense, Q(client=client) | Q(project__client=client)),
+        (Income, Q(client=client) | Q(project__client=client)),
+    ),
+    Project: lambda project: (
+        (Expense, Q(project=project)),
+        (Income, Q(project=project)),
+    ),
+}
+
+
+def touch_nesting_rows(sender, instance, created=False, **kwargs):
+    """Bump ``updated_at`` on rows that embed a changed project/client.
+
+    Expense, income and project responses nest their project and client,
+    so editing one (or deleting it, which sets the links to NULL without
+    touching the rows' timestamps) changes how those rows serialize.
+    """
+    if created:
+        return
+    now = timezone.now()
+    for model, condition in NESTED_REFERENCES[sender](instance):
+        if model.objects.filter(condition, user_id=instance.user_id).update(
+            updated_at=now
+        ):
+            record_changes(model, [instance.user_id])
+
+
+for _model in NESTED_REFERENCES:
+    for _signal in (post_save, pre_delete):
+        _signal.connect(
+            touch_nesting_rows,
+            sender=_model,
+            dispatch_uid=f"sync-touch-{_model.__name__}-{id(_signal)}",
+        )
+
+
+def touch_occurrences(sender, instance, **kwargs):
+    """Bump ``updated_at`` on the rows materialized from a deleted rule.
+
+    Deleting the rule sets their ``recurring_rule`` to NULL without
+    touching their timestamps.
+    """
+    now = timezone.now()
+    for model in (Expense, Income):
+        if model.objects.filter(
+            recurring_rule=instance, user_id=instance.user_id
+        ).update(updated_at=now):
+            record_changes(model, [instance.user_id])
+
+
+pre_delete.connect(
+    touch_occurrences,
+    sender=RecurringRule,
+    dispatch_uid="sync-touch-RecurringRule",
+)
@@ -0,0 +1,208 @@
+"""Test cases for the batch create/update/delete transaction endpoints."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Client, Expense, Income, MonthlyRollup, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Batch Operation Tests----------------------
+
+
+class TransactionBatchTest(TestCase):
+    """
+    Test cases for POST /expenses/batch/ and /income/batch/.
+    Tests mixed operations, all-or-nothing errors, totals and query counts.
+    """
+
+    def setUp(self):
+        """Set up a user with categories, a client, a project and a budget."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.travel = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.venue = Client.objects.create(
+            user=self.user, name="The Venue", email="bookings@venue.example"
+        )
+        self.album = Project.objects.create(
+            user=self.user,
+            client=self.venue,
+            name="Debut Album",
+            date_created=date(2024, 1, 1),
+        )
+        self.budget = Budget.objects.create(
+            user=self.user,
+            category=self.studio,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("500.00"),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def add_expense(self, amount, day=date(2024, 1, 10), user=None):
+        return Expense.objects.create(
+            user=user or self.user,
+            category=self.studio,
+            amount=Decimal(amount),
+            date=day,
+        )
+
+    def create_item(self, amount, day="2024-01-15", **extra):
+        return {"category_id": self.studio.id, "amount": amount, "date": day, **extra}
+
+    def test_mixed_operations(self):
+        edited = self.add_expense("40.00")
+        removed = self.add_expense("60.00")
+
+        response = self.client.post(
+            "/expenses/batch/",
+            {
+                "create": [
+                    self.create_item(
+                        "25.00", project_id=self.album.id, client_id=self.venue.id
+                    )
+                ],
+                "update": [{"id": edited.id, "amount": "45.00"}],
+                "delete": [removed.id],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"][0]["amount"], "25.00")
+        self.assertEqual(
+            response.data["created"][0]["project"]["client"]["name"], "The Venue"
+        )
+        self.assertEqual(response.data["updated"][0]["amount"], "45.00")
+        self.assertEqual(response.data["deleted"], [removed.id])
+        self.assertEqual(
+            sorted(Expense.objects.values_list("amount", flat=True)),
+            [Decimal("25.00"), Decimal("45.00")],
+        )
+
+    def test_totals_follow_batch(self):
+        edited = self.add_expense("40.00")
+        removed = self.add_expense("60.00")
+
+        self.client.post(
+            "/expenses/batch/",
+            {
+                "create": [self.create_item("25.00"), self.create_item("5.00")],
+                "update": [{"id": edited.id, "category_id": self.travel.id}],
+                "delete": [removed.id],
+            },
+            format="json",
+        )
+
+        rollup = MonthlyRollup.objects.get(user=self.user, category=self.studio)
+        self.assertEqual((rollup.total, rollup.count), (Decimal("30.00"), 2))
+        rollup = MonthlyRollup.objects.get(user=self.user, category=self.travel)
+        self.assertEqual((rollup.total, rollup.count), (Decimal("40.00"), 1))
+        self.budget.refresh_from_db()
+        self.assertEqual(self.budget.remaining_amount, Decimal("470.00"))
+
+    def test_invalid_items_reject_the_whole_batch(self):
+        edited = self.add_expense("40.00")
+        foreign = self.add_expense("10.00", user=self.other_user)
+
+        response = self.client.post(
+            "/expenses/batch/",
+            {
+                "create": [self.create_item("25.00"), self.create_item("-1")],
+                "update": [
+                    {"id": edited.id, "amount": "45.00"},
+                    {"id": foreign.id, "amount": "1.00"},
+                    {"amount": "1.00"},
+                    {"id": edited.id, "category_id": 9999},
+                ],
+                "delete": [foreign.id],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["create"][0], {})
+        self.assertIn("amount", response.data["create"][1])
+        update_errors = response.data["update"]
+        self.assertEqual(update_errors[0], {})
+        self.assertEqual(update_errors[1], {"id": ["Not found."]})
+        self.assertIn("id", update_errors[2])
+        self.assertIn("id", update_errors[3])
+        self.assertEqual(response.data["delete"], [{"id": ["Not found."]}])
+        self.assertEqual(Expense.objects.filter(user=self.user).count(), 1)
+        edited.refresh_from_db()
+        self.assertEqual(edited.amount, Decimal("40.00"))
+
+    def test_relation_errors_per_item(self):
+        response = self.client.post(
+            "/income/batch/",
+            {
+                "create": [
+                    {"category_id": self.gigs.id, "amount": "5", "date": "2024-01-01"},
+                    {"category_id": "x", "amount": "5", "date": "2024-01-01"},
+                    {
+                        "category_id": self.gigs.id,
+                        "amount": "5",
+                        "date": "2024-01-01",
+                        "project_id": 9999,
+                    },
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["create"]
+        self.assertEqual(errors[0], {})
+        self.assertIn("category_id", errors[1])
+        self.assertIn("project_id", errors[2])
+        self.assertFalse(Income.objects.exists())
+
+    def test_malformed_payloads(self):
+        for payload in ([], {"create": {}}, {"upsert": []}):
+            response = self.client.post("/expenses/batch/", payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def queries_for(count, month):
+            existing = [
+                self.add_expense("10.00", date(2024, month, 1)) for _ in range(count)
+            ]
+            payload = {
+                "create": [
+                    self.create_item(
+                        "5.00",
+                        f"2024-{month:02d}-02",
+                        project_id=self.album.id,
+                        client_id=self.venue.id,
+                    )
+                    for _ in range(count)
+                ],
+                "update": [{"id": row.id, "amount": "11.00"} for row in existing[1:]],
+                "delete": [existing[0].id],
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post("/expenses/batch/", payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        self.assertEqual(queries_for(3, 2), queries_for(40, 3))
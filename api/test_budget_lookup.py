@@ -0,0 +1,168 @@
+"""Test cases for budget lookups by category and date."""
+
+import random
+from decimal import Decimal
+from datetime import date, timedelta
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Expense, RangeSums, deferred_bookkeeping
+from .test_indexes import explain
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Range Sums Tests----------------------
+
+
+class RangeSumsTest(SimpleTestCase):
+    """
+    Test cases for RangeSums.
+    Tests range totals against a brute-force sum and the first day a
+    total is reached.
+    """
+
+    def test_matches_brute_force(self):
+        rng = random.Random(22)
+        start = date(2024, 1, 1)
+        for _ in range(50):
+            amounts = {
+                start + timedelta(days=rng.randint(0, 120)): Decimal(
+                    rng.randint(-500, 500)
+                )
+                / 100
+                for _ in range(rng.randint(0, 40))
+            }
+            sums = RangeSums(amounts)
+            for _ in range(20):
+                first = start + timedelta(days=rng.randint(-10, 130))
+                last = first + timedelta(days=rng.randint(0, 40))
+                self.assertEqual(
+                    sums.total(first, last),
+                    sum(
+                        (v for day, v in amounts.items() if first <= day <= last),
+                        Decimal("0"),
+                    ),
+                )
+
+    def test_edges(self):
+        sums = RangeSums(
+            {date(2024, 1, 31): Decimal("5.00"), date(2024, 2, 1): Decimal("7.00")}
+        )
+
+        self.assertEqual(sums.total(date(2024, 1, 1), date(2024, 1, 31)), 5)
+        self.assertEqual(sums.total(date(2024, 2, 1), date(2024, 2, 29)), 7)
+        self.assertEqual(sums.total(date(2024, 3, 1), date(2024, 3, 31)), 0)
+        self.assertEqual(RangeSums({}).total(date(2024, 1, 1), date(2024, 12, 31)), 0)
+
+    def test_first_reaching(self):
+        sums = RangeSums(
+            {
+                date(2024, 1, 5): Decimal("5.00"),
+                date(2024, 1, 9): Decimal("0.00"),
+                date(2024, 1, 20): Decimal("7.00"),
+            }
+        )
+
+        self.assertEqual(sums.first_reaching(date(2024, 1, 1), 5), date(2024, 1, 5))
+        self.assertEqual(
+            sums.first_reaching(date(2024, 1, 1), Decimal("5.01")), date(2024, 1, 20)
+        )
+        self.assertEqual(sums.first_reaching(date(2024, 1, 6), 7), date(2024, 1, 20))
+        self.assertIsNone(sums.first_reaching(date(2024, 1, 6), 8))
+        self.assertIsNone(RangeSums({}).first_reaching(date(2024, 1, 1), 0))
+
+
+# ----------------------Budget Lookup Tests----------------------
+
+
+class BudgetLookupTest(TestCase):
+    """
+    Test cases for budget progress and the ?covering= budget filter.
+    Tests overlapping budgets, batched deltas and the period index.
+    """
+
+    def setUp(self):
+        """Set up overlapping monthly, quarterly and yearly budgets."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.travel = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.budgets = [
+            self.budget(self.studio, date(2024, 1, 1), date(2024, 1, 31)),
+            self.budget(self.studio, date(2024, 1, 1), date(2024, 3, 31)),
+            self.budget(self.studio, date(2024, 1, 1), date(2024, 12, 31)),
+            self.budget(self.studio, date(2024, 2, 1), date(2024, 2, 29)),
+            self.budget(self.travel, date(2024, 1, 1), date(2024, 12, 31)),
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def budget(self, category, start, end):
+        return Budget.objects.create(
+            user=self.user,
+            category=category,
+            start_date=start,
+            end_date=end,
+            amount=Decimal("1000.00"),
+        )
+
+    def test_batched_progress_matches_recompute(self):
+        start = date(2023, 12, 1)
+        with transaction.atomic(), deferred_bookkeeping():
+            for i in range(150):
+                Expense.objects.create(
+                    user=self.user,
+                    category=self.studio if i % 3 else self.travel,
+                    amount=Decimal(f"{i % 7 + 1}.50"),
+                    date=start + timedelta(days=i * 3),
+                )
+
+        for budget in self.budgets:
+            budget.refresh_from_db()
+            remaining, percentage = budget.compute_remaining_and_percentage()
+            self.assertEqual(budget.remaining_amount, remaining)
+            self.assertEqual(budget.percentage, round(percentage, 2))
+
+    def test_covering_filter(self):
+        def ids(query):
+            response = self.client.get(f"/budgets/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return {row["id"] for row in response.data}
+
+        self.assertEqual(
+            ids(f"covering=2024-02-10&category={self.studio.id}"),
+            {self.budgets[1].id, self.budgets[2].id, self.budgets[3].id},
+        )
+        self.assertEqual(
+            ids("covering=2024-01-31"),
+            {budget.id for budget in self.budgets if budget is not self.budgets[3]},
+        )
+        self.assertEqual(len(ids("")), 5)
+
+        response = self.client.get("/budgets/?covering=soon")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_progress_lookup_uses_the_period_index(self):
+        with CaptureQueriesContext(connection) as queries:
+            Expense.objects.create(
+                user=self.user,
+                category=self.studio,
+                amount=Decimal("10.00"),
+                date=date(2024, 2, 10),
+            )
+        lookup = next(
+            query["sql"]
+            for query in queries.captured_queries
+            if 'FROM "api_budget"' in query["sql"]
+        )
+
+        self.assertIn("budget_user_cat_period_idx", explain(lookup))
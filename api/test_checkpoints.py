@@ -0,0 +1,190 @@
+"""Test cases for budget checkpoints and their spend snapshots."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, BudgetCheckpoint, Category, Expense, parse_checkpoints
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Budget Checkpoint Tests----------------------
+
+
+class BudgetCheckpointTest(TestCase):
+    """
+    Test cases for budget checkpoints.
+    Tests the structured storage, the legacy ``dates`` string, validation
+    and the single-query spend snapshots.
+    """
+
+    def setUp(self):
+        """Set up a quarterly budget with spending across the period."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.other = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        for day, amount, category in (
+            (date(2023, 12, 31), "999.00", self.studio),
+            (date(2024, 1, 5), "100.00", self.studio),
+            (date(2024, 1, 31), "50.00", self.studio),
+            (date(2024, 2, 10), "200.00", self.studio),
+            (date(2024, 2, 10), "77.00", self.other),
+            (date(2024, 3, 20), "25.50", self.studio),
+        ):
+            Expense.objects.create(
+                user=self.user,
+                category=category,
+                amount=Decimal(amount),
+                date=day,
+            )
+        self.budget = Budget.objects.create(
+            user=self.user,
+            category=self.studio,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 3, 31),
+            amount=Decimal("500.00"),
+            dates="2024-02-29, 2024-01-31,2024-03-31, 2024-01-31",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def url(self, suffix=""):
+        return f"/budgets/{self.budget.id}/{suffix}"
+
+    def test_dates_are_stored_as_rows(self):
+        days = list(
+            BudgetCheckpoint.objects.filter(budget=self.budget).values_list(
+                "date", flat=True
+            )
+        )
+
+        self.assertEqual(
+            days, [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31)]
+        )
+        self.assertEqual(
+            Budget.objects.get(pk=self.budget.pk).dates,
+            "2024-01-31, 2024-02-29, 2024-03-31",
+        )
+
+    def test_parse_checkpoints(self):
+        self.assertEqual(parse_checkpoints(""), [])
+        self.assertEqual(
+            parse_checkpoints(" 2024-01-02, ,2024-01-01 "),
+            [date(2024, 1, 2), date(2024, 1, 1)],
+        )
+        for value in ("2024-13-01", "next week"):
+            with self.assertRaises(ValueError):
+                parse_checkpoints(value)
+
+    def test_snapshots_match_per_checkpoint_sums(self):
+        budget = Budget.objects.prefetch_related("checkpoints").get(
+            pk=self.budget.pk
+        )
+        with CaptureQueriesContext(connection) as queries:
+            snapshots = budget.checkpoint_spend()
+        # One pass over the expenses for every checkpoint
+        self.assertEqual(len(queries), 1)
+
+        for day, spent in snapshots:
+            expected = Expense.objects.filter(
+                user=self.user,
+                category=self.studio,
+                date__range=(self.budget.start_date, day),
+            ).aggregate(total=Sum("amount"))["total"]
+            self.assertEqual(spent, expected)
+        self.assertEqual(
+            [spent for _, spent in snapshots],
+            [Decimal("150.00"), Decimal("350.00"), Decimal("375.50")],
+        )
+
+    def test_checkpoints_endpoint(self):
+        response = self.client.get(self.url("checkpoints/"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data[1],
+            {
+                "date": "2024-02-29",
+                "spent": "350.00",
+                "remaining": "150.00",
+                "percentage": "70.00",
+            },
+        )
+        self.assertEqual(
+            self.client.get(
+                self.url("checkpoints/"), HTTP_IF_NONE_MATCH=response["ETag"]
+            ).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+    def test_budget_responses_include_checkpoints(self):
+        data = self.client.get(self.url()).data
+
+        self.assertEqual(
+            data["checkpoints"], ["2024-01-31", "2024-02-29", "2024-03-31"]
+        )
+        self.assertEqual(data["dates"], "2024-01-31, 2024-02-29, 2024-03-31")
+
+    def test_update_replaces_checkpoints(self):
+        response = self.client.patch(
+            self.url(), {"checkpoints": ["2024-03-15", "2024-01-15"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["checkpoints"], ["2024-01-15", "2024-03-15"])
+
+        response = self.client.patch(self.url(), {"dates": ""}, format="json")
+        self.assertEqual(response.data["checkpoints"], [])
+        self.assertFalse(BudgetCheckpoint.objects.exists())
+
+    def test_invalid_checkpoints(self):
+        for payload in (
+            {"dates": "2024-02-30"},
+            {"checkpoints": ["2024-04-01"]},
+            {"start_date": "2024-02-01", "checkpoints": ["2024-01-31"]},
+        ):
+            response = self.client.patch(self.url(), payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.budget.checkpoints.count(), 3)
+
+    def test_moving_the_period_keeps_checkpoints_inside(self):
+        response = self.client.patch(
+            self.url(), {"end_date": "2024-01-31"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("checkpoints", response.data)
+
+        response = self.client.patch(
+            self.url(),
+            {"end_date": "2024-01-31", "checkpoints": ["2024-01-15"]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(
+            self.url(), {"start_date": "2023-12-01"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_snapshots_stop_at_the_period_end(self):
+        # A checkpoint left past the end, e.g. by an older version
+        BudgetCheckpoint.objects.create(budget=self.budget, date=date(2024, 4, 30))
+        Expense.objects.create(
+            user=self.user,
+            category=self.studio,
+            amount=Decimal("70.00"),
+            date=date(2024, 4, 10),
+        )
+
+        budget = Budget.objects.get(pk=self.budget.pk)
+        self.assertEqual(budget.checkpoint_spend()[-1][1], Decimal("375.50"))
@@ -0,0 +1,172 @@
+"""Test cases for the /clients/?stats=true annotated client list."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Client, Expense, Income, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Client Stats Tests----------------------
+
+
+class ClientStatsTest(TestCase):
+    """
+    Test cases for the client stats mode.
+    Tests the annotated columns against the model methods, sorting and
+    the single-query list.
+    """
+
+    def setUp(self):
+        """Set up three clients with different activity."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.venue = Client.objects.create(
+            user=self.user, name="The Venue", email="venue@example.com"
+        )
+        self.label = Client.objects.create(
+            user=self.user, name="Label", email="label@example.com"
+        )
+        self.quiet = Client.objects.create(
+            user=self.user, name="Quiet Client", email="quiet@example.com"
+        )
+        Client.objects.create(
+            user=other_user, name="Elsewhere", email="else@example.com"
+        )
+        for name in ("Tour", "Live Album"):
+            Project.objects.create(
+                user=self.user,
+                client=self.venue,
+                name=name,
+                date_created=date(2024, 1, 1),
+            )
+        for client, day, amount in (
+            (self.venue, date(2024, 2, 1), "500.00"),
+            (self.venue, date(2024, 4, 1), "250.00"),
+            (self.label, date(2024, 3, 1), "100.00"),
+        ):
+            Income.objects.create(
+                user=self.user,
+                category=self.gigs,
+                client=client,
+                amount=Decimal(amount),
+                date=day,
+            )
+        for client, day, amount in (
+            (self.venue, date(2024, 1, 15), "120.50"),
+            (self.label, date(2024, 5, 20), "300.00"),
+        ):
+            Expense.objects.create(
+                user=self.user,
+                category=self.studio,
+                client=client,
+                amount=Decimal(amount),
+                date=day,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_stats_match_the_model_methods(self):
+        rows = {row["id"]: row for row in self.get("/clients/?stats=true")}
+
+        self.assertEqual(set(rows), {self.venue.id, self.label.id, self.quiet.id})
+        for client in (self.venue, self.label, self.quiet):
+            row = rows[client.id]
+            self.assertEqual(row["income_total"], f"{client.total_income():.2f}")
+            self.assertEqual(row["expense_total"], f"{client.total_expenses():.2f}")
+            self.assertEqual(
+                Decimal(row["net"]), client.total_income() - client.total_expenses()
+            )
+            self.assertEqual(row["project_count"], client.number_of_projects())
+        self.assertEqual(rows[self.venue.id]["last_activity"], "2024-04-01")
+        self.assertEqual(rows[self.label.id]["last_activity"], "2024-05-20")
+        self.assertIsNone(rows[self.quiet.id]["last_activity"])
+
+    def test_detail_and_default_list(self):
+        row = self.get(f"/clients/{self.label.id}/?stats=1")
+        self.assertEqual(row["net"], "-200.00")
+
+        row = self.get("/clients/")[0]
+        self.assertNotIn("income_total", row)
+
+    def test_sorting(self):
+        def names(query):
+            return [row["name"] for row in self.get(f"/clients/?stats=true&{query}")]
+
+        self.assertEqual(names(""), ["Label", "Quiet Client", "The Venue"])
+        self.assertEqual(
+            names("sort=net&order=desc"), ["The Venue", "Quiet Client", "Label"]
+        )
+        # Ties fall back to the primary key, in the same direction
+        self.assertEqual(
+            names("sort=project_count&order=desc"),
+            ["The Venue", "Quiet Client", "Label"],
+        )
+        # Clients without activity sort last in both directions
+        self.assertEqual(
+            names("sort=last_activity"), ["The Venue", "Label", "Quiet Client"]
+        )
+        self.assertEqual(
+            names("sort=last_activity&order=desc"),
+            ["Label", "The Venue", "Quiet Client"],
+        )
+
+    def test_list_is_one_query(self):
+        for index in range(20):
+            client = Client.objects.create(
+                user=self.user, name=f"Client {index}", email=f"c{index}@example.com"
+            )
+            Income.objects.create(
+                user=self.user,
+                category=self.gigs,
+                client=client,
+                amount=Decimal("10.00"),
+                date=date(2024, 6, 1),
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.get("/clients/?stats=true&sort=income_total&order=desc")
+        # Version check and the annotated list
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(len(rows), 23)
+
+    def test_stats_etag_follows_transactions(self):
+        etag = self.client.get("/clients/?stats=true")["ETag"]
+        plain = self.client.get("/clients/")["ETag"]
+
+        Expense.objects.create(
+            user=self.user,
+            category=self.studio,
+            client=self.quiet,
+            amount=Decimal("5.00"),
+            date=date(2024, 7, 1),
+        )
+
+        self.assertNotEqual(self.client.get("/clients/?stats=true")["ETag"], etag)
+        self.assertEqual(self.client.get("/clients/")["ETag"], plain)
+
+    def test_invalid_sort(self):
+        for query in ("sort=email", "order=sideways"):
+            response = self.client.get(f"/clients/?stats=true&{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
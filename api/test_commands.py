@@ -0,0 +1,247 @@
+"""Test cases for the api management commands."""
+
+from decimal import Decimal
+from datetime import date
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.contrib.auth.models import User
+from .caching import dashboard_cache_key
+from .models import Budget, Category, Expense, RecurringRule
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------recompute_budgets Tests----------------------
+
+
+class RecomputeBudgetsCommandTest(TestCase):
+    """
+    Test cases for the recompute_budgets command.
+    Tests recomputation, the --user/--since filters and bad input.
+    """
+
+    def setUp(self):
+        """Set up budgets whose stored progress has been corrupted."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="otherpass123"
+        )
+        self.category = Category.objects.create(
+            name="Groceries", category_type=Category.CategoryType.EXPENSE
+        )
+        self.other_category = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.old = Budget.objects.create(
+            user=self.user,
+            category=self.category,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 1, 31),
+            amount=Decimal("100.00"),
+        )
+        self.current = Budget.objects.create(
+            user=self.user,
+            category=self.category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("200.00"),
+        )
+        self.others = Budget.objects.create(
+            user=self.other_user,
+            category=self.other_category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("400.00"),
+        )
+        for user, category, day, amount in (
+            (self.user, self.category, date(2023, 1, 10), "25.00"),
+            (self.user, self.category, date(2024, 1, 10), "50.00"),
+            (self.user, self.category, date(2024, 1, 20), "30.00"),
+            (self.user, self.category, date(2024, 2, 1), "999.00"),
+            (self.other_user, self.category, date(2024, 1, 5), "999.00"),
+            (self.other_user, self.other_category, date(2024, 1, 5), "100.00"),
+        ):
+            Expense.objects.create(
+                user=user, category=category, amount=Decimal(amount), date=day
+            )
+        # Simulate drift, e.g. from rows written with raw SQL
+        Budget.objects.update(remaining_amount=0, percentage=0)
+
+    def progress(self, budget):
+        budget.refresh_from_db()
+        return budget.remaining_amount, budget.percentage
+
+    def test_recomputes_all_budgets(self):
+        out = StringIO()
+        call_command("recompute_budgets", stdout=out)
+
+        self.assertEqual(
+            self.progress(self.old), (Decimal("75.00"), Decimal("25.00"))
+        )
+        self.assertEqual(
+            self.progress(self.current), (Decimal("120.00"), Decimal("40.00"))
+        )
+        self.assertEqual(
+            self.progress(self.others), (Decimal("300.00"), Decimal("25.00"))
+        )
+        self.assertIn("Recomputed 3 budgets", out.getvalue())
+
+    def test_user_and_since_filters(self):
+        call_command(
+            "recompute_budgets",
+            "--user",
+            str(self.user.id),
+            "--since",
+            "2023-06-01",
+            "--batch-size",
+            "1",
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(
+            self.progress(self.current), (Decimal("120.00"), Decimal("40.00"))
+        )
+        self.assertEqual(self.progress(self.old), (Decimal("0"), Decimal("0")))
+        self.assertEqual(self.progress(self.others), (Decimal("0"), Decimal("0")))
+
+    def test_drops_cached_dashboards_of_updated_users(self):
+        for user in (self.user, self.other_user):
+            cache.set(dashboard_cache_key(user.id), ("version", {}))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "recompute_budgets", "--user", str(self.user.id), stdout=StringIO()
+            )
+
+        self.assertIsNone(cache.get(dashboard_cache_key(self.user.id)))
+        self.assertIsNotNone(cache.get(dashboard_cache_key(self.other_user.id)))
+
+    def test_uses_one_read_query(self):
+        # One SELECT, one batched UPDATE and the data version bump, plus
+        # the transaction savepoint pair
+        with self.assertNumQueries(5):
+            call_command("recompute_budgets", stdout=StringIO())
+
+    def test_invalid_since(self):
+        with self.assertRaises(CommandError):
+            call_command("recompute_budgets", "--since", "last week")
+
+
+# ----------------------forecast_budgets Tests----------------------
+
+
+class ForecastBudgetsCommandTest(TestCase):
+    """
+    Test cases for the forecast_budgets command.
+    Tests the at-risk listing across users, the --user filter and bad
+    input.
+    """
+
+    def setUp(self):
+        """Set up one fast-burning and one slow-burning January budget."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="otherpass123"
+        )
+        for user, name, spent in (
+            (self.user, "Groceries", "60.00"),
+            (self.other_user, "Travel", "10.00"),
+        ):
+            category = Category.objects.create(
+                name=name, category_type=Category.CategoryType.EXPENSE
+            )
+            Expense.objects.create(
+                user=user,
+                category=category,
+                amount=Decimal(spent),
+                date=date(2024, 1, 3),
+            )
+            Budget.objects.create(
+                user=user,
+                category=category,
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 1, 31),
+                amount=Decimal("100.00"),
+            )
+
+    def forecast(self, *args):
+        out = StringIO()
+        call_command("forecast_budgets", "--date", "2024-01-10", *args, stdout=out)
+        return out.getvalue()
+
+    def test_lists_budgets_at_risk(self):
+        out = self.forecast()
+
+        self.assertIn(f"user {self.user.id}, budget", out)
+        self.assertIn("runs out 2024-01-17", out)
+        self.assertNotIn(f"user {self.other_user.id}, budget", out)
+        self.assertIn("Forecast 2 active budgets; 1 at risk.", out)
+
+    def test_user_filter(self):
+        out = self.forecast("--user", str(self.other_user.id))
+
+        self.assertIn("Forecast 1 active budgets; 0 at risk.", out)
+
+    def test_invalid_date(self):
+        with self.assertRaises(CommandError):
+            call_command("forecast_budgets", "--date", "tomorrow")
+
+
+# ----------------------materialize_recurring Tests----------------------
+
+
+class MaterializeRecurringCommandTest(TestCase):
+    """
+    Test cases for the materialize_recurring command.
+    Tests reruns, the --user filter and bad input.
+    """
+
+    def setUp(self):
+        """Set up a monthly rule for each of two users."""
+        category = Category.objects.create(
+            name="Software", category_type=Category.CategoryType.EXPENSE
+        )
+        self.users = [
+            User.objects.create_user(username=name, password="testpass123")
+            for name in ("testuser", "otheruser")
+        ]
+        for user in self.users:
+            RecurringRule.objects.create(
+                user=user,
+                kind=Category.CategoryType.EXPENSE,
+                category=category,
+                frequency=RecurringRule.Frequency.MONTHLY,
+                start_date=date(2024, 1, 15),
+                amount=Decimal("9.99"),
+            )
+
+    def materialize(self, *args):
+        out = StringIO()
+        call_command(
+            "materialize_recurring", "--date", "2024-03-20", *args, stdout=out
+        )
+        return out.getvalue()
+
+    def test_reruns_create_nothing(self):
+        self.assertIn("Created 6 recurring transactions.", self.materialize())
+        self.assertIn("Created 0 recurring transactions.", self.materialize())
+        self.assertEqual(Expense.objects.count(), 6)
+
+    def test_user_filter(self):
+        out = self.materialize("--user", str(self.users[1].id), "--batch-size", "1")
+
+        self.assertIn("Created 3 recurring transactions.", out)
+        self.assertEqual(
+            set(Expense.objects.values_list("user", flat=True)), {self.users[1].id}
+        )
+
+    def test_invalid_date(self):
+        with self.assertRaises(CommandError):
+            call_command("materialize_recurring", "--date", "someday")
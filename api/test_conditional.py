@@ -0,0 +1,198 @@
+"""Test cases for conditional GET (ETag / If-None-Match) responses."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .conditional import data_version
+from .models import Budget, Category, Client, DataVersion, Expense, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Conditional GET Tests----------------------
+
+
+class ConditionalGetTest(TestCase):
+    """
+    Test cases for ETags on list, detail and dashboard responses.
+    Tests 304 answers and that relevant writes change the tag.
+    """
+
+    def setUp(self):
+        """Set up a user with an expense nested in a project and client."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.venue = Client.objects.create(user=self.user, name="The Venue")
+        self.album = Project.objects.create(
+            user=self.user,
+            client=self.venue,
+            name="Debut Album",
+            date_created=date(2024, 1, 1),
+        )
+        self.expense = self.add_expense("40.00", project=self.album)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def add_expense(self, amount, user=None, **extra):
+        return Expense.objects.create(
+            user=user or self.user,
+            category=self.category,
+            amount=Decimal(amount),
+            date=date(2024, 1, 10),
+            **extra,
+        )
+
+    def etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+        return response["ETag"]
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_list_is_not_modified(self):
+        etag = self.etag("/expenses/")
+
+        with self.assertNumQueries(1):
+            response = self.revalidate("/expenses/", etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+
+    def test_stale_or_foreign_tag_gets_full_response(self):
+        etag = self.etag("/expenses/")
+
+        response = self.revalidate("/expenses/", '"stale", W/"other"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(self.etag("/expenses/?page_size=1"), etag)
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.revalidate("/expenses/", etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_writes_change_the_tag(self):
+        url = f"/expenses/{self.expense.id}/"
+        etag = self.etag(url)
+
+        self.client.patch(url, {"amount": "45.00"}, format="json")
+        self.assertEqual(self.revalidate(url, etag).status_code, status.HTTP_200_OK)
+
+        etag = self.etag("/expenses/")
+        self.add_expense("1.00").delete()
+        response = self.revalidate("/expenses/", etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_nested_and_global_changes_change_the_tag(self):
+        etag = self.etag("/expenses/")
+        self.venue.name = "The Old Venue"
+        self.venue.save()
+        response = self.revalidate("/expenses/", etag)
+        self.assertEqual(
+            response.data[0]["project"]["client"]["name"], "The Old Venue"
+        )
+
+        etag = self.etag("/categories/")
+        self.category.name = "Rehearsal Space"
+        self.category.save()
+        self.assertEqual(
+            self.revalidate("/categories/", etag).status_code, status.HTTP_200_OK
+        )
+
+    def test_insert_committed_with_an_older_stamp_changes_the_tag(self):
+        etag = self.etag("/expenses/")
+
+        # As if its transaction stamped the row before self.expense's, but
+        # only committed after the tag was issued
+        late = self.add_expense("5.00")
+        Expense.objects.filter(pk=late.pk).update(
+            updated_at=self.expense.updated_at
+        )
+
+        response = self.revalidate("/expenses/", etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_update_committed_with_an_older_stamp_changes_the_tag(self):
+        newer = self.add_expense("5.00")
+        etag = self.etag("/expenses/")
+
+        self.expense.amount = Decimal("45.00")
+        self.expense.save()
+        Expense.objects.filter(pk=self.expense.pk).update(
+            updated_at=newer.updated_at.replace(year=2000)
+        )
+
+        response = self.revalidate("/expenses/", etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_version_reads_counters_not_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            data_version(self.user, (Expense, Project, Client))
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("api_expense", queries[0]["sql"])
+        self.assertNotIn("api_tombstone", queries[0]["sql"])
+
+    def test_bump_creates_and_increments_counters(self):
+        DataVersion.objects.all().delete()
+
+        DataVersion.bump([(self.user.id, "goal"), (self.other_user.id, "goal")])
+        DataVersion.bump([(self.user.id, "goal")])
+
+        self.assertEqual(
+            dict(
+                DataVersion.objects.filter(model="goal").values_list(
+                    "user_id", "counter"
+                )
+            ),
+            {self.user.id: 2, self.other_user.id: 1},
+        )
+
+    def test_unrelated_writes_keep_the_tag(self):
+        etag = self.etag("/expenses/")
+
+        self.add_expense("5.00", user=self.other_user)
+        Budget.objects.create(
+            user=self.user,
+            category=self.category,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 1, 31),
+            amount=Decimal("100.00"),
+        )
+
+        response = self.revalidate("/expenses/", etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_dashboard(self):
+        etag = self.etag("/api/dashboard/")
+
+        with self.assertNumQueries(1):
+            response = self.revalidate("/api/dashboard/", etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.post(
+            "/expenses/batch/", {"delete": [self.expense.id]}, format="json"
+        )
+        response = self.revalidate("/api/dashboard/", etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["expense_total"], 0)
+
+    def test_missing_object_has_no_tag(self):
+        response = self.client.get("/expenses/9999/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header("ETag"))
@@ -0,0 +1,162 @@
+"""Test cases for the dashboard API view and its cache."""
+
+from decimal import Decimal
+from datetime import date
+from django.core.cache import cache
+from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Expense, Goal, Income
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Dashboard API Tests----------------------
+
+
+class DashboardAPITest(TestCase):
+    """
+    Test cases for the dashboard endpoint.
+    Tests totals, query counts and cache invalidation.
+    """
+
+    def setUp(self):
+        """Set up a user with one record of each kind."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="otherpass123"
+        )
+        self.expense_category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.income_category = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.expense = Expense.objects.create(
+            user=self.user,
+            category=self.expense_category,
+            amount=Decimal("40.00"),
+            date=date(2024, 1, 10),
+        )
+        Income.objects.create(
+            user=self.user,
+            category=self.income_category,
+            amount=Decimal("100.00"),
+            date=date(2024, 1, 12),
+        )
+        Income.objects.create(
+            user=self.other_user,
+            category=self.income_category,
+            amount=Decimal("999.00"),
+            date=date(2024, 1, 12),
+        )
+        Goal.objects.create(
+            user=self.user,
+            name="New guitar",
+            target=Decimal("1500.00"),
+            deadline=date(2024, 12, 1),
+            status="In Progress",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get_dashboard(self):
+        response = self.client.get("/api/dashboard/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_totals_and_counts(self):
+        data = self.get_dashboard()
+
+        self.assertEqual(data["income_total"], Decimal("100.00"))
+        self.assertEqual(data["expense_total"], Decimal("40.00"))
+        self.assertEqual(data["net_total"], Decimal("60.00"))
+        self.assertEqual(data["number_of_budgets"], 0)
+        self.assertEqual(data["number_of_goals"], 1)
+        self.assertEqual(len(data["recent_expenses"]), 1)
+
+    def test_empty_dashboard(self):
+        new_user = User.objects.create_user(
+            username="newuser", password="newpass123"
+        )
+        self.client.force_authenticate(user=new_user)
+
+        data = self.get_dashboard()
+
+        self.assertEqual(data["income_total"], 0)
+        self.assertEqual(data["net_total"], 0)
+        self.assertEqual(data["number_of_goals"], 0)
+
+    def test_cold_load_query_count(self):
+        # Version check, four recent lists and one query for every total
+        with self.assertNumQueries(6):
+            self.get_dashboard()
+
+    def test_repeat_load_is_served_from_cache(self):
+        self.get_dashboard()
+
+        # Only the conditional GET version check reaches the database
+        with self.assertNumQueries(1):
+            self.get_dashboard()
+
+    def test_expense_changes_invalidate_cache(self):
+        self.get_dashboard()
+
+        Expense.objects.create(
+            user=self.user,
+            category=self.expense_category,
+            amount=Decimal("10.00"),
+            date=date(2024, 1, 11),
+        )
+        self.assertEqual(self.get_dashboard()["expense_total"], Decimal("50.00"))
+
+        self.expense.delete()
+        self.assertEqual(self.get_dashboard()["expense_total"], Decimal("10.00"))
+
+    def test_budget_and_goal_changes_invalidate_cache(self):
+        self.get_dashboard()
+
+        Budget.objects.create(
+            user=self.user,
+            category=self.expense_category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("200.00"),
+        )
+        self.assertEqual(self.get_dashboard()["number_of_budgets"], 1)
+
+        Goal.objects.filter(user=self.user).get().delete()
+        self.assertEqual(self.get_dashboard()["number_of_goals"], 0)
+
+    def test_category_rename_is_not_served_stale(self):
+        etag = self.client.get("/api/dashboard/")["ETag"]
+
+        # Category writes do not invalidate the cache, but change the tag
+        self.expense_category.name = "Rehearsal Space"
+        self.expense_category.save()
+        response = self.client.get("/api/dashboard/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            response.data["recent_expenses"][0]["category"]["name"],
+            "Rehearsal Space",
+        )
+
+    def test_other_users_changes_keep_cache(self):
+        self.get_dashboard()
+
+        Income.objects.create(
+            user=self.other_user,
+            category=self.income_category,
+            amount=Decimal("5.00"),
+            date=date(2024, 1, 13),
+        )
+
+        # Only the conditional GET version check reaches the database
+        with self.assertNumQueries(1):
+            self.get_dashboard()
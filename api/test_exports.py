@@ -0,0 +1,132 @@
+"""Test cases for the streaming CSV/NDJSON export endpoints."""
+
+import csv
+import io
+import json
+from decimal import Decimal
+from datetime import date
+from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Client, Expense, Income, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Export Tests----------------------
+
+
+class TransactionExportTest(TestCase):
+    """
+    Test cases for the export endpoints.
+    Tests CSV and NDJSON output, filters, user isolation and the ledger.
+    """
+
+    def setUp(self):
+        """Set up linked expenses and income for two users."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", password="otherpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        venue = Client.objects.create(
+            user=self.user, name="Venue", email="venue@example.com"
+        )
+        album = Project.objects.create(
+            user=self.user, client=venue, name="Album", date_created=date(2024, 1, 1)
+        )
+        Expense.objects.create(
+            user=self.user,
+            category=self.studio,
+            project=album,
+            client=venue,
+            amount=Decimal("120.00"),
+            date=date(2024, 1, 10),
+            note='Tracking, day "one"',
+        )
+        Expense.objects.create(
+            user=self.user,
+            category=self.studio,
+            amount=Decimal("80.00"),
+            date=date(2024, 2, 10),
+        )
+        Expense.objects.create(
+            user=other_user,
+            category=self.studio,
+            amount=Decimal("999.00"),
+            date=date(2024, 1, 10),
+        )
+        Income.objects.create(
+            user=self.user,
+            category=self.gigs,
+            amount=Decimal("300.00"),
+            date=date(2024, 1, 20),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def download(self, url, params=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, b"".join(response.streaming_content).decode("utf-8")
+
+    def test_expense_csv_export(self):
+        response, body = self.download("/expenses/export/")
+
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertIn('filename="expenses.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual([row["amount"] for row in rows], ["80.00", "120.00"])
+        self.assertEqual(rows[1]["category"], "Studio Hire")
+        self.assertEqual(rows[1]["project"], "Album")
+        self.assertEqual(rows[1]["client"], "Venue")
+        self.assertEqual(rows[1]["note"], 'Tracking, day "one"')
+        self.assertEqual(rows[0]["project"], "")
+
+    def test_income_ndjson_export(self):
+        response, body = self.download("/income/export/", {"format": "ndjson"})
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["amount"], "300.00")
+        self.assertEqual(records[0]["date"], "2024-01-20")
+        self.assertEqual(records[0]["category"], "Gigs")
+
+    def test_export_honours_list_filters(self):
+        _, body = self.download(
+            "/expenses/export/",
+            {"format": "ndjson", "date_from": "2024-02-01"},
+        )
+
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r["amount"] for r in records], ["80.00"])
+
+    def test_invalid_filter_returns_400(self):
+        response = self.client.get("/expenses/export/", {"amount_min": "lots"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ledger_export_merges_kinds(self):
+        _, body = self.download("/ledger/export/", {"order": "asc"})
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(
+            [(row["kind"], row["amount"]) for row in rows],
+            [("EXPENSE", "120.00"), ("INCOME", "300.00"), ("EXPENSE", "80.00")],
+        )
+
+    def test_export_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get("/ledger/export/")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
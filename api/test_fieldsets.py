@@ -0,0 +1,135 @@
+"""Test cases for ?fields= / ?expand= flat and sparse responses."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Client, Expense, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Sparse Fieldset Tests----------------------
+
+
+class SparseFieldsetTest(TestCase):
+    """
+    Test cases for flat ids, expansion and field selection.
+    Tests expense, budget and project viewsets and their queries.
+    """
+
+    def setUp(self):
+        """Set up an expense linked to a category, project and client."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.venue = Client.objects.create(user=self.user, name="The Venue")
+        self.album = Project.objects.create(
+            user=self.user,
+            client=self.venue,
+            name="Debut Album",
+            date_created=date(2024, 1, 1),
+        )
+        self.expense = Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            project=self.album,
+            client=self.venue,
+            amount=Decimal("40.00"),
+            date=date(2024, 1, 10),
+        )
+        Budget.objects.create(
+            user=self.user,
+            category=self.category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("500.00"),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_default_stays_nested(self):
+        row = self.get("/expenses/")[0]
+
+        self.assertEqual(row["category"]["name"], "Studio Hire")
+        self.assertEqual(row["project"]["client"]["name"], "The Venue")
+        self.assertNotIn("category_id", row)
+
+    def test_empty_expand_gives_flat_ids(self):
+        row = self.get("/expenses/?expand=")[0]
+
+        self.assertEqual(row["category_id"], self.category.id)
+        self.assertEqual(row["project_id"], self.album.id)
+        self.assertEqual(row["client_id"], self.venue.id)
+        self.assertNotIn("category", row)
+        self.assertNotIn("project", row)
+
+    def test_expand_selected_relations(self):
+        row = self.get("/expenses/?expand=category,project")[0]
+        self.assertEqual(row["category"]["name"], "Studio Hire")
+        self.assertEqual(row["project"]["client_id"], self.venue.id)
+        self.assertEqual(row["client_id"], self.venue.id)
+
+        row = self.get(f"/expenses/{self.expense.id}/?expand=project.client")
+        self.assertEqual(row["project"]["client"]["name"], "The Venue")
+        self.assertEqual(row["category_id"], self.category.id)
+
+    def test_fields_limit_output(self):
+        row = self.get("/expenses/?fields=id,amount,category_id")[0]
+        self.assertEqual(
+            row,
+            {"id": self.expense.id, "amount": "40.00", "category_id": self.category.id},
+        )
+
+        row = self.get("/budgets/?fields=amount,category&expand=category")[0]
+        self.assertEqual(set(row), {"amount", "category"})
+
+        row = self.get("/projects/?fields=name,client_id")[0]
+        self.assertEqual(row, {"name": "Debut Album", "client_id": self.venue.id})
+
+    def test_flat_list_skips_joins(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get("/expenses/?expand=")
+        self.assertFalse(
+            any("JOIN" in query["sql"] for query in queries.captured_queries)
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get("/expenses/?expand=category")
+        joins = [q["sql"] for q in queries.captured_queries if "JOIN" in q["sql"]]
+        self.assertEqual(len(joins), 1)
+        self.assertIn('"api_category"', joins[0])
+        self.assertNotIn('"api_project"', joins[0])
+
+    def test_invalid_names_are_rejected(self):
+        for url in (
+            "/expenses/?expand=user",
+            "/expenses/?expand=category.client",
+            "/budgets/?expand=project",
+            "/expenses/?fields=amount,nope",
+            "/expenses/?fields=category",
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, url)
+
+    def test_writes_ignore_the_parameters(self):
+        response = self.client.post(
+            "/expenses/?fields=id",
+            {"category_id": self.category.id, "amount": "5.00", "date": "2024-01-11"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["category"]["name"], "Studio Hire")
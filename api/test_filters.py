@@ -0,0 +1,153 @@
+"""Test cases for server-side filtering and sorting of transactions."""
+
+from decimal import Decimal
+from datetime import date
+from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Expense, Income
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Transaction Filter Tests----------------------
+
+
+class ExpenseFilterTest(TestCase):
+    """
+    Test cases for the expense list query parameters.
+    Tests each filter, sorting, pagination and validation errors.
+    """
+
+    def setUp(self):
+        """Set up expenses across two categories."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.groceries = Category.objects.create(
+            name="Groceries", category_type=Category.CategoryType.EXPENSE
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.cheap = Expense.objects.create(
+            user=self.user,
+            category=self.groceries,
+            amount=Decimal("5.00"),
+            date=date(2024, 1, 10),
+            note="Milk and bread",
+        )
+        self.middle = Expense.objects.create(
+            user=self.user,
+            category=self.studio,
+            amount=Decimal("150.00"),
+            date=date(2024, 2, 10),
+            note="Rehearsal room",
+        )
+        self.dear = Expense.objects.create(
+            user=self.user,
+            category=self.studio,
+            amount=Decimal("900.00"),
+            date=date(2024, 3, 10),
+            note="Album tracking",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def ids(self, params):
+        response = self.client.get("/expenses/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["id"] for row in response.data]
+
+    def test_filter_by_category(self):
+        self.assertEqual(
+            self.ids({"category": self.studio.id}), [self.dear.id, self.middle.id]
+        )
+
+    def test_filter_by_date_range(self):
+        self.assertEqual(
+            self.ids({"date_from": "2024-02-01", "date_to": "2024-02-28"}),
+            [self.middle.id],
+        )
+
+    def test_filter_by_amount_range(self):
+        self.assertEqual(
+            self.ids({"amount_min": "100", "amount_max": "900"}),
+            [self.dear.id, self.middle.id],
+        )
+
+    def test_search_note_is_case_insensitive(self):
+        self.assertEqual(self.ids({"q": "ALBUM"}), [self.dear.id])
+
+    def test_sort_by_amount_ascending(self):
+        self.assertEqual(
+            self.ids({"sort": "amount", "order": "asc"}),
+            [self.cheap.id, self.middle.id, self.dear.id],
+        )
+
+    def test_filters_combine_with_pagination(self):
+        response = self.client.get(
+            "/expenses/",
+            {"category": self.studio.id, "sort": "amount", "page_size": 1},
+        )
+        self.assertEqual(response.data["results"][0]["id"], self.dear.id)
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], [self.middle.id]
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_parameters_return_400(self):
+        response = self.client.get(
+            "/expenses/",
+            {"date_from": "yesterday", "amount_min": "lots", "sort": "note"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("date_from", response.data)
+        self.assertIn("amount_min", response.data)
+        self.assertIn("sort", response.data)
+
+    def test_out_of_range_id_returns_400(self):
+        response = self.client.get(
+            "/expenses/", {"category": "99999999999999999999999"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["category"], "Enter a valid id.")
+
+
+class IncomeFilterTest(TestCase):
+    """Test cases for the income list query parameters."""
+
+    def setUp(self):
+        """Set up two income records."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.small = Income.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("80.00"),
+            date=date(2024, 5, 1),
+        )
+        self.large = Income.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("1200.00"),
+            date=date(2024, 4, 1),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_sort_by_amount_descending(self):
+        response = self.client.get("/income/", {"sort": "amount"})
+
+        self.assertEqual(
+            [row["id"] for row in response.data], [self.large.id, self.small.id]
+        )
@@ -0,0 +1,153 @@
+"""Test cases for the /budgets/forecast/ burn-rate forecast."""
+
+from decimal import Decimal
+from datetime import date
+from unittest import mock
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .forecasts import active_budgets, forecast
+from .models import Budget, Category, Expense
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Budget Forecast Tests----------------------
+
+
+class BudgetForecastTest(TestCase):
+    """
+    Test cases for the budget forecast.
+    Tests the projections against per-budget sums, run-out dates, the
+    at-risk filter, the query count and the date-dependent ETag.
+    """
+
+    def setUp(self):
+        """Set up fast-burning, steady, exhausted and inactive budgets."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.studio, self.travel, self.gear = (
+            Category.objects.create(
+                name=name, category_type=Category.CategoryType.EXPENSE
+            )
+            for name in ("Studio Hire", "Travel", "Gear")
+        )
+        for user, category, day, amount in (
+            (self.user, self.studio, date(2023, 12, 31), "500.00"),
+            (self.user, self.studio, date(2024, 1, 2), "100.00"),
+            (self.user, self.studio, date(2024, 1, 5), "50.00"),
+            (self.user, self.studio, date(2024, 1, 11), "900.00"),
+            (self.user, self.travel, date(2024, 1, 4), "91.00"),
+            (self.user, self.gear, date(2024, 1, 3), "30.00"),
+            (self.user, self.gear, date(2024, 1, 6), "30.00"),
+            (other_user, self.studio, date(2024, 1, 5), "999.00"),
+        ):
+            Expense.objects.create(
+                user=user, category=category, amount=Decimal(amount), date=day
+            )
+        self.monthly = self.budget(self.studio, date(2024, 1, 31), "300.00")
+        self.quarterly = self.budget(self.travel, date(2024, 3, 31), "1000.00")
+        self.spent = self.budget(self.gear, date(2024, 1, 15), "50.00")
+        Budget.objects.create(
+            user=self.user,
+            category=self.studio,
+            start_date=date(2024, 2, 1),
+            end_date=date(2024, 2, 29),
+            amount=Decimal("10.00"),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def budget(self, category, end, amount):
+        return Budget.objects.create(
+            user=self.user,
+            category=category,
+            start_date=date(2024, 1, 1),
+            end_date=end,
+            amount=Decimal(amount),
+        )
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_forecast_figures(self):
+        rows = self.get("/budgets/forecast/?as_of=2024-01-10")
+        rows = {row["id"]: row for row in rows}
+
+        self.assertEqual(set(rows), {self.monthly.id, self.quarterly.id, self.spent.id})
+        # 150 over 10 days: 15/day for 21 more days
+        self.assertEqual(rows[self.monthly.id]["spent"], "150.00")
+        self.assertEqual(rows[self.monthly.id]["daily_rate"], "15.00")
+        self.assertEqual(rows[self.monthly.id]["projected_spend"], "465.00")
+        self.assertEqual(rows[self.monthly.id]["projected_remaining"], "-165.00")
+        self.assertEqual(rows[self.monthly.id]["runs_out_on"], "2024-01-20")
+        self.assertTrue(rows[self.monthly.id]["at_risk"])
+        # 9.10/day for 81 more days stays within 1000
+        self.assertEqual(rows[self.quarterly.id]["projected_spend"], "828.10")
+        self.assertIsNone(rows[self.quarterly.id]["runs_out_on"])
+        self.assertFalse(rows[self.quarterly.id]["at_risk"])
+        # Already over: the day the amount was reached
+        self.assertEqual(rows[self.spent.id]["runs_out_on"], "2024-01-06")
+        self.assertTrue(rows[self.spent.id]["at_risk"])
+        self.assertEqual(rows[self.spent.id]["category"]["name"], "Gear")
+
+    def test_spent_matches_per_budget_sums(self):
+        as_of = date(2024, 1, 20)
+        for row in forecast(active_budgets(as_of), as_of):
+            budget = row["budget"]
+            expected = Expense.objects.filter(
+                user=budget.user,
+                category=budget.category,
+                date__range=(budget.start_date, as_of),
+            ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
+            self.assertEqual(row["spent"], expected)
+
+    def test_at_risk_filter(self):
+        rows = self.get("/budgets/forecast/?as_of=2024-01-10&at_risk=true")
+
+        self.assertEqual([row["id"] for row in rows], [self.spent.id, self.monthly.id])
+
+    def test_query_count_is_constant(self):
+        for month in range(2, 13):
+            self.budget(self.gear, date(2024, month, 28), "75.00")
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.get("/budgets/forecast/?as_of=2024-01-10")
+        # Version check, the budgets and one grouped daily-spend query
+        self.assertEqual(len(queries), 3)
+        self.assertEqual(len(rows), 14)
+
+    def test_etag_changes_with_the_date(self):
+        with mock.patch(
+            "api.forecasts.timezone.localdate", return_value=date(2024, 1, 10)
+        ):
+            response = self.client.get("/budgets/forecast/")
+            self.assertEqual(len(response.data), 3)
+            self.assertEqual(
+                self.client.get(
+                    "/budgets/forecast/", HTTP_IF_NONE_MATCH=response["ETag"]
+                ).status_code,
+                status.HTTP_304_NOT_MODIFIED,
+            )
+        with mock.patch(
+            "api.forecasts.timezone.localdate", return_value=date(2024, 1, 11)
+        ):
+            response = self.client.get(
+                "/budgets/forecast/", HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_parameters(self):
+        for query in ("as_of=soon", "at_risk=maybe"):
+            response = self.client.get(f"/budgets/forecast/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,185 @@
+"""Test cases for bulk CSV import of transactions."""
+
+import os
+import tempfile
+from decimal import Decimal
+from datetime import date
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Client, Expense, Income, MonthlyRollup, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------CSV Import Tests----------------------
+
+
+class TransactionImportTest(TestCase):
+    """
+    Test cases for the import endpoints and command.
+    Tests name resolution, all-or-nothing errors and derived totals.
+    """
+
+    def setUp(self):
+        """Set up a user with categories, a client and a project."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.venue = Client.objects.create(
+            user=self.user, name="The Venue", email="bookings@venue.example"
+        )
+        self.album = Project.objects.create(
+            user=self.user,
+            client=self.venue,
+            name="Debut Album",
+            date_created=date(2024, 1, 1),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def upload(self, url, text):
+        upload = SimpleUploadedFile(
+            "import.csv", text.encode("utf-8"), content_type="text/csv"
+        )
+        return self.client.post(url, {"file": upload}, format="multipart")
+
+    def test_import_expenses(self):
+        response = self.upload(
+            "/expenses/import/",
+            "Date,Amount,Category,Project,Client,Note\n"
+            '2024-01-05,120.00,studio hire,Debut Album,The Venue,"Day one, take 2"\n'
+            "2024-01-06,80.50,Studio Hire,,bookings@venue.example,\n",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        expenses = Expense.objects.filter(user=self.user).order_by("date")
+        self.assertEqual(expenses[0].project, self.album)
+        self.assertEqual(expenses[0].note, "Day one, take 2")
+        self.assertEqual(expenses[1].client, self.venue)
+        self.assertIsNone(expenses[1].project)
+        self.assertIsNone(expenses[1].note)
+
+    def test_import_updates_rollups_and_budgets(self):
+        budget = Budget.objects.create(
+            user=self.user,
+            category=self.studio,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("400.00"),
+        )
+
+        self.upload(
+            "/expenses/import/",
+            "date,amount,category\n2024-01-05,100.00,Studio Hire\n"
+            "2024-01-09,50.00,Studio Hire\n",
+        )
+
+        rollup = MonthlyRollup.objects.get(user=self.user, category=self.studio)
+        self.assertEqual((rollup.total, rollup.count), (Decimal("150.00"), 2))
+        budget.refresh_from_db()
+        self.assertEqual(budget.remaining_amount, Decimal("250.00"))
+
+    def test_errors_are_reported_per_row_and_nothing_is_saved(self):
+        response = self.upload(
+            "/income/import/",
+            "date,amount,category,project\n"
+            "2024-01-05,300.00,Gigs,\n"
+            "not-a-date,-5,Gigs,\n"
+            "2024-01-07,10.00,Studio Hire,Missing Project\n",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["created"], 0)
+        self.assertEqual(response.data["error_count"], 2)
+        first, second = response.data["errors"]
+        self.assertEqual(first["row"], 3)
+        self.assertIn("date", first["errors"])
+        self.assertIn("amount", first["errors"])
+        self.assertEqual(second["row"], 4)
+        self.assertIn("category", second["errors"])
+        self.assertIn("project", second["errors"])
+        self.assertFalse(Income.objects.exists())
+
+    def test_missing_columns(self):
+        response = self.upload("/expenses/import/", "date,amount\n2024-01-01,5\n")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["row"], 1)
+
+    def test_missing_file(self):
+        response = self.client.post("/expenses/import/", {}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("file", response.data)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        def queries_for(month, days):
+            rows = "".join(
+                f"2024-{month:02d}-{day:02d},10.00,Studio Hire,Debut Album,The Venue,\n"
+                for day in days
+            )
+            with CaptureQueriesContext(connection) as queries:
+                self.upload(
+                    "/expenses/import/",
+                    "date,amount,category,project,client,note\n" + rows,
+                )
+            return len(queries)
+
+        # The first import also creates the user's data version counter
+        queries_for(1, range(1, 2))
+        self.assertEqual(queries_for(2, range(1, 3)), queries_for(3, range(1, 29)))
+        self.assertEqual(Expense.objects.count(), 31)
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        ) as handle:
+            handle.write("date,amount,category\n2024-03-01,450.00,Gigs\n")
+        self.addCleanup(os.remove, handle.name)
+
+        out = StringIO()
+        call_command(
+            "import_transactions",
+            handle.name,
+            "--user",
+            "testuser",
+            "--kind",
+            "income",
+            stdout=out,
+        )
+
+        self.assertIn("Imported 1 income rows", out.getvalue())
+        self.assertEqual(Income.objects.get().amount, Decimal("450.00"))
+
+    def test_management_command_reports_errors(self):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        ) as handle:
+            handle.write("date,amount,category\n2024-03-01,oops,Gigs\n")
+        self.addCleanup(os.remove, handle.name)
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_transactions",
+                handle.name,
+                "--user",
+                "testuser",
+                "--kind",
+                "income",
+                stderr=StringIO(),
+            )
@@ -0,0 +1,158 @@
+"""EXPLAIN-based tests for the transaction composite indexes.
+
+The hot list, dashboard and budget queries are captured as executed and
+re-run under the backend's EXPLAIN prefix, then the plan is checked for
+the expected index. SQLite and PostgreSQL are both supported; on
+PostgreSQL sequential scans are disabled for the test so the tiny fixture
+tables do not make a table scan look cheaper than the index.
+"""
+
+from decimal import Decimal
+from datetime import date, timedelta
+from django.db import connection
+from django.db.models import Sum
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from .models import Budget, Category, Client, Expense, Income, Project
+from .views import ClientViewSet, ProjectViewSet
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Index Plan Tests----------------------
+
+
+def explain(sql):
+    """Return the query plan for ``sql`` as a single string."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+        rows = cursor.fetchall()
+    # SQLite rows are (id, parent, notused, detail); PostgreSQL rows are
+    # single text columns.
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+class TransactionIndexPlanTest(TestCase):
+    """
+    Test cases checking the planner uses the composite indexes.
+    Covers the transaction list, dashboard totals, budget progress,
+    client stats and project P&L.
+    """
+
+    def setUp(self):
+        """Set up enough rows for the planner to prefer the indexes."""
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.income_category = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        start = date(2024, 1, 1)
+        Expense.objects.bulk_create(
+            Expense(
+                user=self.user,
+                category=self.category,
+                amount=Decimal("10.00"),
+                date=start + timedelta(days=i),
+            )
+            for i in range(200)
+        )
+        Income.objects.bulk_create(
+            Income(
+                user=self.user,
+                category=self.income_category,
+                amount=Decimal("25.00"),
+                date=start + timedelta(days=i),
+            )
+            for i in range(200)
+        )
+
+    def plan_for(self, func):
+        """Run ``func`` and return the plan of the last query it issued."""
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        return explain(queries.captured_queries[-1]["sql"])
+
+    def test_list_uses_date_index_without_sort(self):
+        for model, index in (
+            (Expense, "expense_user_date_idx"),
+            (Income, "income_user_date_idx"),
+        ):
+            plan = self.plan_for(
+                lambda model=model: list(
+                    model.objects.filter(user=self.user)
+                    .select_related("category", "project__client", "client")
+                    .order_by("-date", "-id")[:50]
+                )
+            )
+            self.assertIn(index, plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+            self.assertNotIn("Sort", plan)
+
+    def test_per_user_totals_are_index_only(self):
+        for model, index in (
+            (Expense, "expense_user_cat_date_idx"),
+            (Income, "income_user_cat_date_idx"),
+        ):
+            plan = self.plan_for(
+                lambda model=model: model.objects.filter(
+                    user=self.user
+                ).aggregate(total=Sum("amount"))
+            )
+            self.assertIn(index, plan)
+            self.assert_index_only(plan)
+
+    def test_budget_progress_is_index_only(self):
+        budget = Budget(
+            user=self.user,
+            category=self.category,
+            start_date=date(2024, 2, 1),
+            end_date=date(2024, 2, 29),
+            amount=Decimal("500.00"),
+        )
+
+        plan = self.plan_for(budget.compute_remaining_and_percentage)
+
+        self.assertIn("expense_user_cat_date_idx", plan)
+        self.assert_index_only(plan)
+
+    def test_client_stats_are_index_only(self):
+        client = Client.objects.create(user=self.user, name="The Venue")
+        Expense.objects.filter(user=self.user).update(client=client)
+        Income.objects.filter(user=self.user).update(client=client)
+
+        plan = self.plan_for(
+            lambda: list(ClientViewSet.with_stats(Client.objects.filter(user=self.user)))
+        )
+
+        for index in ("expense_client_date_idx", "income_client_date_idx"):
+            self.assertIn(index, plan)
+        self.assert_index_only(plan)
+
+    def test_project_pnl_is_index_only(self):
+        project = Project.objects.create(
+            user=self.user, name="Tour", date_created=date(2024, 1, 1)
+        )
+        Expense.objects.filter(user=self.user).update(project=project)
+        Income.objects.filter(user=self.user).update(project=project)
+
+        plan = self.plan_for(
+            lambda: list(ProjectViewSet.with_pnl(Project.objects.filter(user=self.user)))
+        )
+
+        for index in ("expense_project_amount_idx", "income_project_amount_idx"):
+            self.assertIn(index, plan)
+        self.assert_index_only(plan)
+
+    def assert_index_only(self, plan):
+        if connection.vendor == "sqlite":
+            self.assertIn("COVERING INDEX", plan)
+        elif connection.vendor == "postgresql":
+            self.assertIn("Index Only Scan", plan)
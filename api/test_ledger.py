@@ -0,0 +1,246 @@
+"""Test cases for the merged /ledger/ endpoint."""
+
+from decimal import Decimal
+from datetime import date, timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Expense, Income
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Ledger Tests----------------------
+
+
+class LedgerTest(TestCase):
+    """
+    Test cases for GET /ledger/.
+    Tests merge order, keyset paging, filters and running balances.
+    """
+
+    def setUp(self):
+        """Set up three months of interleaved expenses and income."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.travel = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        start = date(2024, 1, 1)
+        for i in range(30):
+            day = start + timedelta(days=i * 3)
+            Expense.objects.create(
+                user=self.user,
+                category=self.studio if i % 2 else self.travel,
+                amount=Decimal(f"{10 + i}.25"),
+                date=day,
+                note=f"session {i}",
+            )
+            if i % 3 == 0:
+                # Same-day income exercises the kind tie-break
+                Income.objects.create(
+                    user=self.user,
+                    category=self.gigs,
+                    amount=Decimal(f"{100 + i}.00"),
+                    date=day,
+                    note=f"gig {i}",
+                )
+        Income.objects.create(
+            user=self.other_user,
+            category=self.gigs,
+            amount=Decimal("999.00"),
+            date=start,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def expected(self, keep=lambda kind, row: True):
+        """Brute-force ledger rows (oldest first) with running balances."""
+        rows = [
+            ("EXPENSE", row) for row in Expense.objects.filter(user=self.user)
+        ] + [("INCOME", row) for row in Income.objects.filter(user=self.user)]
+        rows = sorted(
+            (item for item in rows if keep(*item)),
+            key=lambda item: (item[1].date, item[0], item[1].id),
+        )
+        balance, result = Decimal("0"), []
+        for kind, row in rows:
+            balance += row.amount if kind == "INCOME" else -row.amount
+            result.append((kind, row.id, f"{balance:.2f}"))
+        return result
+
+    def walk(self, query):
+        """Follow ``next`` links and return every row as a tuple."""
+        url, rows, pages = f"/ledger/?{query}", [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            rows += [
+                (row["kind"], row["id"], row["balance"])
+                for row in response.data["results"]
+            ]
+            url, pages = response.data["next"], pages + 1
+        return rows, pages
+
+    def test_pages_merge_in_date_order_with_balances(self):
+        rows, pages = self.walk("page_size=7")
+
+        self.assertEqual(rows, self.expected()[::-1])
+        self.assertEqual(pages, 6)
+
+    def test_ascending_order(self):
+        rows, _ = self.walk("page_size=8&order=asc")
+
+        self.assertEqual(rows, self.expected())
+
+    def test_previous_link(self):
+        first = self.client.get("/ledger/?page_size=5").data
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+
+        self.assertEqual(back["results"], first["results"])
+
+    def test_filters(self):
+        rows, _ = self.walk("page_size=4&date_from=2024-01-20&date_to=2024-03-10")
+        self.assertEqual(
+            rows,
+            self.expected(
+                lambda kind, row: date(2024, 1, 20) <= row.date <= date(2024, 3, 10)
+            )[::-1],
+        )
+
+        rows, _ = self.walk(f"page_size=4&category={self.studio.id}")
+        self.assertEqual(
+            rows, self.expected(lambda kind, row: row.category == self.studio)[::-1]
+        )
+
+        rows, _ = self.walk("page_size=4&amount_min=20")
+        self.assertEqual(
+            rows, self.expected(lambda kind, row: row.amount >= 20)[::-1]
+        )
+
+    def test_row_shape(self):
+        row = self.client.get("/ledger/?page_size=1").data["results"][0]
+
+        self.assertEqual(
+            set(row),
+            {
+                "kind",
+                "id",
+                "date",
+                "amount",
+                "balance",
+                "note",
+                "category_id",
+                "category",
+                "project_id",
+                "client_id",
+            },
+        )
+        self.assertEqual(row["category"], "Studio Hire")
+
+    def test_deep_pages_cost_the_same(self):
+        def queries_for(url):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries), response.data["next"]
+
+        first, url = queries_for("/ledger/?page_size=3")
+        for _ in range(5):
+            deep, url = queries_for(url)
+        # Version check, the UNION ALL page and the opening balance
+        self.assertEqual((first, deep), (3, 3))
+
+    def test_invalid_parameters(self):
+        for query in ("sort=amount", "date_from=nope", "order=sideways"):
+            response = self.client.get(f"/ledger/?{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get("/ledger/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def balance_on(self, day):
+        """Brute-force balance at the end of ``day``."""
+        income = sum(
+            row.amount
+            for row in Income.objects.filter(user=self.user, date__lte=day)
+        )
+        expenses = sum(
+            row.amount
+            for row in Expense.objects.filter(user=self.user, date__lte=day)
+        )
+        return f"{income - expenses:.2f}"
+
+    def test_balance_series_for_a_window(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                "/ledger/balance/?date_from=2024-02-01&date_to=2024-02-29"
+            )
+        # Version check, the opening balance and the windowed series
+        self.assertEqual(len(queries), 3)
+
+        data = response.data
+        self.assertEqual(data["opening_balance"], self.balance_on(date(2024, 1, 31)))
+        days = [day["date"] for day in data["days"]]
+        self.assertEqual(
+            days,
+            sorted(
+                {
+                    row.date.isoformat()
+                    for row in Expense.objects.filter(
+                        user=self.user, date__month=2
+                    )
+                }
+            ),
+        )
+        for day in data["days"]:
+            self.assertEqual(
+                day["balance"], self.balance_on(date.fromisoformat(day["date"]))
+            )
+        self.assertEqual(data["closing_balance"], data["days"][-1]["balance"])
+
+    def test_balance_series_totals_per_day(self):
+        data = self.client.get("/ledger/balance/?date_to=2024-01-01").data
+
+        self.assertEqual(data["opening_balance"], "0.00")
+        self.assertEqual(
+            data["days"],
+            [
+                {
+                    "date": "2024-01-01",
+                    "income": "100.00",
+                    "expenses": "10.25",
+                    "balance": "89.75",
+                }
+            ],
+        )
+
+    def test_balance_series_rounds_sqlite_sums(self):
+        self.client.force_authenticate(user=self.other_user)
+        for amount in ("0.10", "0.20"):
+            Income.objects.create(
+                user=self.other_user,
+                category=self.gigs,
+                amount=Decimal(amount),
+                date=date(2024, 1, 2),
+            )
+
+        data = self.client.get("/ledger/balance/?date_from=2024-01-02").data
+
+        self.assertEqual(data["opening_balance"], "999.00")
+        self.assertEqual(data["days"][0]["income"], "0.30")
+        self.assertEqual(data["closing_balance"], "999.30")
@@ -0,0 +1,134 @@
+"""Test cases for keyset pagination on the transaction endpoints."""
+
+from decimal import Decimal
+from datetime import date, timedelta
+from django.test import TestCase
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Expense, Income
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Keyset Pagination Tests----------------------
+
+
+class ExpensePaginationTest(TestCase):
+    """
+    Test cases for cursor pagination of the expense list.
+    Tests opt-in behaviour, page traversal and invalid cursors.
+    """
+
+    def setUp(self):
+        """Set up a user with expenses sharing some dates."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Groceries", category_type=Category.CategoryType.EXPENSE
+        )
+        # Two expenses per day so that (date, id) tie-breaking is exercised
+        start = date(2024, 1, 1)
+        for day in range(5):
+            for _ in range(2):
+                Expense.objects.create(
+                    user=self.user,
+                    category=self.category,
+                    amount=Decimal("10.00"),
+                    date=start + timedelta(days=day),
+                )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def expected_ids(self):
+        return list(
+            Expense.objects.filter(user=self.user)
+            .order_by("-date", "-id")
+            .values_list("id", flat=True)
+        )
+
+    def test_list_is_unpaginated_by_default(self):
+        response = self.client.get("/expenses/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 10)
+
+    def test_first_page(self):
+        response = self.client.get("/expenses/", {"page_size": 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [row["id"] for row in response.data["results"]]
+        self.assertEqual(ids, self.expected_ids()[:3])
+        self.assertIsNotNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
+
+    def test_walk_all_pages_forward_and_back(self):
+        seen = []
+        pages = []
+        previous = None
+        url = "/expenses/?page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            page = [row["id"] for row in response.data["results"]]
+            pages.append(page)
+            seen.extend(page)
+            previous = response.data["previous"]
+            url = response.data["next"]
+
+        self.assertEqual(seen, self.expected_ids())
+        self.assertEqual(len(pages), 4)
+
+        # Step back from the last page to the one before it
+        response = self.client.get(previous)
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], pages[-2]
+        )
+        self.assertIsNotNone(response.data["next"])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get("/expenses/", {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_size_is_capped(self):
+        response = self.client.get("/expenses/", {"page_size": 10_000})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertIsNone(response.data["next"])
+
+
+class IncomePaginationTest(TestCase):
+    """Test cases for cursor pagination of the income list."""
+
+    def setUp(self):
+        """Set up a user with a handful of income records."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Salary", category_type=Category.CategoryType.INCOME
+        )
+        for day in range(1, 6):
+            Income.objects.create(
+                user=self.user,
+                category=self.category,
+                amount=Decimal("100.00"),
+                date=date(2024, 2, day),
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_pages_do_not_overlap(self):
+        first = self.client.get("/income/", {"page_size": 2})
+        second = self.client.get(first.data["next"])
+
+        first_ids = {row["id"] for row in first.data["results"]}
+        second_ids = {row["id"] for row in second.data["results"]}
+        self.assertEqual(len(first_ids), 2)
+        self.assertEqual(len(second_ids), 2)
+        self.assertFalse(first_ids & second_ids)
+        self.assertEqual(second.data["results"][0]["date"], "2024-02-03")
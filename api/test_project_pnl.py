@@ -0,0 +1,141 @@
+"""Test cases for the /projects/?pnl=true annotated P&L list."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Client, Expense, Income, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Project P&L Tests----------------------
+
+
+class ProjectPnLTest(TestCase):
+    """
+    Test cases for the project P&L mode.
+    Tests the annotated figures against the model methods, margin
+    filtering and ordering, and the query count.
+    """
+
+    def setUp(self):
+        """Set up a profitable, a loss-making and an income-less project."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.venue = Client.objects.create(
+            user=self.user, name="The Venue", email="venue@example.com"
+        )
+        self.tour = self.project("Tour", date(2024, 1, 1), self.venue)
+        self.album = self.project("Album", date(2024, 2, 1))
+        self.demo = self.project("Demo", date(2024, 3, 1))
+        # Tour: 750 in, 300 out -> 60% margin
+        self.add(Income, self.tour, "500.00", "250.00")
+        self.add(Expense, self.tour, "200.00", "100.00")
+        # Album: 400 in, 500 out -> -25% margin
+        self.add(Income, self.album, "400.00")
+        self.add(Expense, self.album, "500.00")
+        # Demo: costs only, so no margin
+        self.add(Expense, self.demo, "80.00")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def project(self, name, created, client=None):
+        return Project.objects.create(
+            user=self.user, client=client, name=name, date_created=created
+        )
+
+    def add(self, model, project, *amounts):
+        category = self.gigs if model is Income else self.studio
+        for amount in amounts:
+            model.objects.create(
+                user=self.user,
+                category=category,
+                project=project,
+                amount=Decimal(amount),
+                date=date(2024, 4, 1),
+            )
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_figures_match_the_model_methods(self):
+        rows = {row["id"]: row for row in self.get("/projects/?pnl=true")}
+
+        for project in (self.tour, self.album, self.demo):
+            row = rows[project.id]
+            self.assertEqual(
+                row["expense_total"], f"{project.total_expenses_amount():.2f}"
+            )
+            self.assertEqual(
+                row["income_total"], f"{project.total_income_amount():.2f}"
+            )
+            self.assertEqual(
+                row["expense_count"], project.number_of_expense_transactions()
+            )
+            self.assertEqual(
+                row["income_count"], project.number_of_income_transactions()
+            )
+        self.assertEqual(rows[self.tour.id]["net"], "450.00")
+        self.assertEqual(rows[self.tour.id]["margin"], "60.00")
+        self.assertEqual(rows[self.album.id]["margin"], "-25.00")
+        self.assertIsNone(rows[self.demo.id]["margin"])
+        self.assertEqual(rows[self.tour.id]["client"]["name"], "The Venue")
+
+    def test_margin_is_not_integer_division(self):
+        self.add(Income, self.demo, "3.00")
+
+        row = self.get(f"/projects/{self.demo.id}/?pnl=1")
+
+        self.assertEqual(row["margin"], "-2566.67")
+
+    def test_filtering_and_ordering_by_margin(self):
+        def names(query):
+            return [row["name"] for row in self.get(f"/projects/?pnl=true&{query}")]
+
+        self.assertEqual(names(""), ["Demo", "Album", "Tour"])
+        self.assertEqual(names("sort=margin&order=desc"), ["Tour", "Album", "Demo"])
+        self.assertEqual(names("sort=margin&order=asc"), ["Album", "Tour", "Demo"])
+        self.assertEqual(names("margin_min=0"), ["Tour"])
+        self.assertEqual(names("margin_max=59.99&sort=net"), ["Album"])
+
+    def test_list_query_count_is_capped(self):
+        for index in range(20):
+            project = self.project(f"Gig {index}", date(2024, 5, 1), self.venue)
+            self.add(Income, project, "100.00")
+            self.add(Expense, project, "40.00")
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = self.get("/projects/?pnl=true&sort=margin&order=desc")
+        # Version check and one annotated list joined to the clients
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(len(rows), 23)
+        self.assertEqual(rows[0]["margin"], "60.00")
+
+    def test_works_with_sparse_fields(self):
+        row = self.get(f"/projects/{self.tour.id}/?pnl=true&fields=name,margin")
+
+        self.assertEqual(row, {"name": "Tour", "margin": "60.00"})
+
+    def test_plain_list_is_unchanged(self):
+        row = self.get("/projects/")[0]
+
+        self.assertNotIn("margin", row)
+
+    def test_invalid_parameters(self):
+        for query in ("sort=client", "order=up", "margin_min=lots"):
+            response = self.client.get(f"/projects/?pnl=true&{query}")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
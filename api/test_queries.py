@@ -0,0 +1,126 @@
+"""Query-count regression tests for the nested list and detail endpoints.
+
+Each test renders an endpoint with a small and a larger data set and
+checks the number of queries stays the same, so nested serializers cannot
+quietly reintroduce N+1 lookups.
+"""
+
+from decimal import Decimal
+from datetime import date, timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Client, Expense, Income, Project
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Query Count Tests----------------------
+
+
+class NestedQueryCountTest(TestCase):
+    """
+    Test cases for constant query counts on nested endpoints.
+    Covers expenses, income, budgets and projects (list and detail).
+    """
+
+    def setUp(self):
+        """Set up a user with a client, project and categories."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.expense_category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.income_category = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        self.client_record = Client.objects.create(
+            user=self.user, name="Venue", email="venue@example.com"
+        )
+        self.project = Project.objects.create(
+            user=self.user,
+            client=self.client_record,
+            name="Album",
+            date_created=date(2024, 1, 1),
+        )
+        self.created = 0
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def add_rows(self, count):
+        """Create ``count`` more rows of every resource, fully linked."""
+        for _ in range(count):
+            self.created += 1
+            day = date(2024, 1, 1) + timedelta(days=self.created)
+            linked = {
+                "user": self.user,
+                "project": self.project,
+                "client": self.client_record,
+                "amount": Decimal("10.00"),
+                "date": day,
+            }
+            Expense.objects.create(category=self.expense_category, **linked)
+            Income.objects.create(category=self.income_category, **linked)
+            Budget.objects.create(
+                user=self.user,
+                category=self.expense_category,
+                start_date=day,
+                end_date=day + timedelta(days=30),
+                amount=Decimal("500.00"),
+            )
+            Project.objects.create(
+                user=self.user,
+                client=self.client_record,
+                name=f"Project {self.created}",
+                date_created=day,
+            )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def assert_constant(self, url, expected):
+        # ``expected`` includes the conditional GET version query
+        self.add_rows(2)
+        small = self.count_queries(url)
+        self.add_rows(10)
+        large = self.count_queries(url)
+        self.assertEqual(small, large)
+        self.assertEqual(large, expected)
+
+    def test_expense_list(self):
+        self.assert_constant("/expenses/", 2)
+
+    def test_expense_list_paginated(self):
+        self.assert_constant("/expenses/?page_size=5", 2)
+
+    def test_income_list(self):
+        self.assert_constant("/income/", 2)
+
+    def test_budget_list(self):
+        # Plus one prefetch of every listed budget's checkpoints
+        self.assert_constant("/budgets/", 3)
+
+    def test_project_list(self):
+        self.assert_constant("/projects/", 2)
+
+    def test_expense_detail(self):
+        self.add_rows(1)
+        expense = Expense.objects.filter(user=self.user).first()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/expenses/{expense.id}/")
+        self.assertEqual(response.data["project"]["client"]["name"], "Venue")
+
+    def test_income_detail(self):
+        self.add_rows(1)
+        income = Income.objects.filter(user=self.user).first()
+
+        with self.assertNumQueries(2):
+            self.client.get(f"/income/{income.id}/")
@@ -0,0 +1,287 @@
+"""Test cases for recurring rules and their materialization."""
+
+from decimal import Decimal
+from datetime import date
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import (
+    Budget,
+    Category,
+    Expense,
+    Income,
+    MonthlyRollup,
+    Project,
+    RecurringRule,
+    add_months,
+)
+from .recurring import materialize_recurring
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Recurring Schedule Tests----------------------
+
+
+class RecurringScheduleTest(SimpleTestCase):
+    """
+    Test cases for RecurringRule schedules.
+    Tests each frequency, month-end clamping and the COUNT/UNTIL bounds.
+    """
+
+    def dates(self, **fields):
+        rule = RecurringRule(**fields)
+        return [rule.occurrence_date(index) for index in range(4)]
+
+    def test_add_months(self):
+        self.assertEqual(add_months(date(2024, 1, 31), 1), date(2024, 2, 29))
+        self.assertEqual(add_months(date(2024, 11, 15), 3), date(2025, 2, 15))
+        self.assertEqual(add_months(date(2024, 3, 31), -1), date(2024, 2, 29))
+
+    def test_frequencies(self):
+        start = date(2024, 1, 31)
+        self.assertEqual(
+            self.dates(frequency="DAILY", interval=3, start_date=start)[:2],
+            [start, date(2024, 2, 3)],
+        )
+        self.assertEqual(
+            self.dates(frequency="WEEKLY", interval=2, start_date=start)[:2],
+            [start, date(2024, 2, 14)],
+        )
+        # Each date is counted from the start, so months do not drift
+        self.assertEqual(
+            self.dates(frequency="MONTHLY", interval=1, start_date=start),
+            [start, date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)],
+        )
+        self.assertEqual(
+            self.dates(frequency="YEARLY", interval=1, start_date=date(2024, 2, 29))[
+                :2
+            ],
+            [date(2024, 2, 29), date(2025, 2, 28)],
+        )
+
+    def test_count_and_end_date(self):
+        start = date(2024, 1, 1)
+        self.assertEqual(
+            self.dates(frequency="MONTHLY", interval=1, start_date=start, count=2),
+            [start, date(2024, 2, 1), None, None],
+        )
+        self.assertEqual(
+            self.dates(
+                frequency="MONTHLY",
+                interval=1,
+                start_date=start,
+                end_date=date(2024, 3, 1),
+            ),
+            [start, date(2024, 2, 1), date(2024, 3, 1), None],
+        )
+
+
+# ----------------------Materialization Tests----------------------
+
+
+class MaterializeRecurringTest(TestCase):
+    """
+    Test cases for materialize_recurring.
+    Tests the rows created for several users, rollups and budgets,
+    idempotent reruns and the batched query count.
+    """
+
+    def setUp(self):
+        """Set up a monthly subscription and a weekly teaching fee."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="otherpass123"
+        )
+        self.software = Category.objects.create(
+            name="Software", category_type=Category.CategoryType.EXPENSE
+        )
+        self.teaching = Category.objects.create(
+            name="Teaching", category_type=Category.CategoryType.INCOME
+        )
+        self.subscription = self.rule(
+            self.user, self.software, "MONTHLY", date(2024, 1, 31), "12.99"
+        )
+        self.lessons = self.rule(
+            self.other_user, self.teaching, "WEEKLY", date(2024, 1, 1), "40.00"
+        )
+
+    @staticmethod
+    def rule(user, category, frequency, start, amount, **fields):
+        return RecurringRule.objects.create(
+            user=user,
+            kind=category.category_type,
+            category=category,
+            frequency=frequency,
+            start_date=start,
+            amount=Decimal(amount),
+            note="Recurring",
+            **fields,
+        )
+
+    def test_creates_due_occurrences_for_all_users(self):
+        created = materialize_recurring(until=date(2024, 3, 15))
+
+        self.assertEqual(created, 13)
+        self.assertEqual(
+            list(Expense.objects.values_list("date", flat=True).order_by("date")),
+            [date(2024, 1, 31), date(2024, 2, 29)],
+        )
+        lessons = Income.objects.filter(user=self.other_user).order_by("date")
+        self.assertEqual(lessons.count(), 11)
+        self.assertEqual(lessons.last().date, date(2024, 3, 11))
+        self.assertEqual(lessons.first().recurring_rule, self.lessons)
+        self.assertEqual(lessons.first().note, "Recurring")
+
+        self.subscription.refresh_from_db()
+        self.assertEqual(self.subscription.next_index, 2)
+        self.assertEqual(self.subscription.next_date, date(2024, 3, 31))
+
+    def test_updates_rollups_and_budgets(self):
+        budget = Budget.objects.create(
+            user=self.user,
+            category=self.software,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            amount=Decimal("100.00"),
+        )
+
+        materialize_recurring(until=date(2024, 3, 15))
+
+        rollup = MonthlyRollup.objects.get(
+            user=self.user, category=self.software, month=date(2024, 2, 1)
+        )
+        self.assertEqual((rollup.total, rollup.count), (Decimal("12.99"), 1))
+        budget.refresh_from_db()
+        self.assertEqual(budget.remaining_amount, Decimal("74.02"))
+
+    def test_reruns_are_idempotent(self):
+        materialize_recurring(until=date(2024, 3, 15))
+
+        self.assertEqual(materialize_recurring(until=date(2024, 3, 15)), 0)
+        self.assertEqual(materialize_recurring(until=date(2024, 3, 31)), 3)
+        self.assertEqual(Expense.objects.count(), 3)
+
+        # Moving the start back re-schedules dates that already exist
+        self.subscription.refresh_from_db()
+        self.subscription.start_date = date(2023, 12, 31)
+        self.subscription.save()
+        self.assertEqual(
+            materialize_recurring(until=date(2024, 4, 30), user_ids=[self.user.id]),
+            1,
+        )
+        self.assertEqual(Expense.objects.count(), 4)
+
+    def test_bounded_rules_stop(self):
+        self.rule(
+            self.user, self.software, "DAILY", date(2024, 1, 1), "1.00", count=3
+        )
+
+        materialize_recurring(until=date(2024, 1, 31))
+
+        rule = RecurringRule.objects.get(count=3)
+        self.assertEqual(Expense.objects.filter(recurring_rule=rule).count(), 3)
+        self.assertIsNone(rule.next_date)
+
+    def test_query_count_does_not_grow_with_rules(self):
+        def count_queries(until):
+            with CaptureQueriesContext(connection) as queries:
+                materialize_recurring(until=until)
+            return len(queries)
+
+        few = count_queries(date(2024, 1, 31))
+        for day in range(1, 29):
+            self.rule(self.user, self.software, "MONTHLY", date(2024, 2, day), "5.00")
+        many = count_queries(date(2024, 2, 29))
+
+        self.assertEqual(Expense.objects.count(), 2 + 28)
+        self.assertLessEqual(many, few)
+
+
+# ----------------------Recurring Rule API Tests----------------------
+
+
+class RecurringRuleAPITest(TestCase):
+    """
+    Test cases for the /recurring/ endpoints.
+    Tests creation, validation, user scoping and what happens to
+    materialized rows when their rule is deleted.
+    """
+
+    def setUp(self):
+        """Set up a user, categories and another user's project."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", password="otherpass123"
+        )
+        self.software = Category.objects.create(
+            name="Software", category_type=Category.CategoryType.EXPENSE
+        )
+        self.teaching = Category.objects.create(
+            name="Teaching", category_type=Category.CategoryType.INCOME
+        )
+        self.foreign_project = Project.objects.create(
+            user=other_user, name="Not Mine", date_created=date(2024, 1, 1)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def payload(self, **changes):
+        data = {
+            "kind": "EXPENSE",
+            "category_id": self.software.id,
+            "amount": "12.99",
+            "frequency": "MONTHLY",
+            "start_date": "2024-01-31",
+        }
+        data.update(changes)
+        return data
+
+    def test_create_rule(self):
+        response = self.client.post("/recurring/", self.payload(), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["next_date"], "2024-01-31")
+        self.assertEqual(response.data["interval"], 1)
+        self.assertEqual(response.data["category"]["name"], "Software")
+        self.assertEqual(RecurringRule.objects.get().user, self.user)
+
+    def test_invalid_rules(self):
+        for changes in (
+            {"category_id": self.teaching.id},
+            {"end_date": "2024-01-30"},
+            {"interval": 0},
+            {"frequency": "HOURLY"},
+            {"project": self.foreign_project.id},
+        ):
+            response = self.client.post(
+                "/recurring/", self.payload(**changes), format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(RecurringRule.objects.exists())
+
+    def test_deleting_a_rule_keeps_its_rows(self):
+        rule_id = self.client.post(
+            "/recurring/", self.payload(), format="json"
+        ).data["id"]
+        materialize_recurring(until=date(2024, 2, 29))
+        expense = Expense.objects.get(date=date(2024, 2, 29))
+        data = self.client.get(f"/expenses/{expense.id}/").data
+        self.assertEqual(data["recurring_rule"], rule_id)
+        self.assertEqual(data["occurrence"], "2024-02-29")
+
+        response = self.client.delete(f"/recurring/{rule_id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Expense.objects.count(), 2)
+        changed = Expense.objects.get(pk=expense.pk)
+        self.assertIsNone(changed.recurring_rule)
+        # Bumped so cached and synced copies pick up the NULL link
+        self.assertGreater(changed.updated_at, expense.updated_at)
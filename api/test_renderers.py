@@ -0,0 +1,116 @@
+"""Test cases for the fast JSON renderer and response compression."""
+
+import gzip
+import json
+from decimal import Decimal
+from datetime import date, datetime, timezone as dt_timezone
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.utils.functional import lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Expense
+from .renderers import FastJSONRenderer
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Renderer Tests----------------------
+
+
+class FastJSONRendererTest(TestCase):
+    """
+    Test cases for FastJSONRenderer.
+    Tests that its output matches DRF's JSONRenderer byte for byte.
+    """
+
+    def test_matches_stock_renderer(self):
+        data = {
+            "amount": Decimal("12.50"),
+            "amount_text": "12.50",
+            "day": date(2024, 1, 10),
+            "at": datetime(2024, 1, 10, 9, 30, 15, 250, tzinfo=dt_timezone.utc),
+            "label": lazy(lambda: "Studio Hire", str)(),
+            "note": "line\u2028paragraph\u2029café",
+            7: [1, None, True, 2.5],
+        }
+
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+    def test_indent_and_empty_fall_back(self):
+        data = {"a": [1, 2]}
+        context = {"indent": 4}
+
+        self.assertEqual(
+            FastJSONRenderer().render(data, renderer_context=context),
+            JSONRenderer().render(data, renderer_context=context),
+        )
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_oversized_integer_falls_back(self):
+        data = {"big": 2**70}
+
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+
+# ----------------------Compression Tests----------------------
+
+
+@override_settings(RESPONSE_COMPRESSION_MIN_SIZE=1024)
+class ResponseCompressionTest(TestCase):
+    """
+    Test cases for CompressionMiddleware.
+    Tests the size threshold and revalidating a compressed response.
+    """
+
+    def setUp(self):
+        """Set up a user with enough expenses for a large list."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        Expense.objects.bulk_create(
+            Expense(
+                user=self.user,
+                category=self.category,
+                amount=Decimal("10.00"),
+                date=date(2024, 1, 1 + i % 28),
+                note=f"session {i}",
+            )
+            for i in range(30)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_large_response_is_gzipped(self):
+        response = self.client.get("/expenses/", HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))), 30)
+
+    def test_small_response_is_not_compressed(self):
+        response = self.client.get(
+            "/expenses/?page_size=1", HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_compressed_etag_still_revalidates(self):
+        response = self.client.get("/expenses/", HTTP_ACCEPT_ENCODING="gzip")
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        response = self.client.get(
+            "/expenses/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
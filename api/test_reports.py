@@ -0,0 +1,318 @@
+"""Test cases for the /reports/timeseries/ endpoint."""
+
+from decimal import Decimal
+from datetime import date, timedelta
+from unittest import mock
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Category, Expense, Income
+from .reports import bucket_start
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Time-Series Report Tests----------------------
+
+
+class TimeSeriesReportTest(TestCase):
+    """
+    Test cases for GET /reports/timeseries/.
+    Tests each period against row sums, zero-filled gaps and query counts.
+    """
+
+    def setUp(self):
+        """Set up transactions across 2024 with an empty March."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.travel = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        start = date(2024, 1, 1)
+        for i in range(60):
+            day = start + timedelta(days=i * 5)
+            if day.month == 3:
+                continue
+            Expense.objects.create(
+                user=self.user,
+                category=self.studio if i % 2 else self.travel,
+                amount=Decimal(f"{10 + i}.10"),
+                date=day,
+            )
+            if i % 4 == 0:
+                Income.objects.create(
+                    user=self.user,
+                    category=self.gigs,
+                    amount=Decimal(f"{200 + i}.20"),
+                    date=day,
+                )
+        Income.objects.create(
+            user=self.other_user,
+            category=self.gigs,
+            amount=Decimal("999.00"),
+            date=start,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def expected(self, period, date_from, date_to, keep=lambda row: True):
+        """Brute-force ``{period_start: (income, expenses)}`` of non-empty periods."""
+        totals = {}
+        for model, column in ((Income, 0), (Expense, 1)):
+            for row in model.objects.filter(
+                user=self.user, date__gte=date_from, date__lte=date_to
+            ):
+                if not keep(row):
+                    continue
+                start = bucket_start(row.date, period).isoformat()
+                values = totals.setdefault(start, [Decimal("0"), Decimal("0")])
+                values[column] += row.amount
+        return {
+            start: (f"{income:.2f}", f"{expenses:.2f}")
+            for start, (income, expenses) in totals.items()
+        }
+
+    def report(self, query):
+        response = self.client.get(f"/reports/timeseries/?{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def check(self, period, date_from, date_to, extra="", keep=lambda row: True):
+        data = self.report(
+            f"period={period}&date_from={date_from}&date_to={date_to}{extra}"
+        )
+        expected = self.expected(period, date_from, date_to, keep)
+        starts = [row["period_start"] for row in data["results"]]
+        self.assertEqual(starts, sorted(set(starts)))
+        self.assertEqual(starts[0], bucket_start(date_from, period).isoformat())
+        self.assertEqual(starts[-1], bucket_start(date_to, period).isoformat())
+        for row in data["results"]:
+            income, expenses = expected.get(row["period_start"], ("0.00", "0.00"))
+            self.assertEqual((row["income"], row["expenses"]), (income, expenses))
+            self.assertEqual(
+                Decimal(row["net"]), Decimal(income) - Decimal(expenses)
+            )
+        return data["results"]
+
+    def test_monthly_report_uses_rollups_for_whole_months(self):
+        rows = self.check("month", date(2024, 1, 1), date(2024, 12, 31))
+        self.assertEqual(len(rows), 12)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.report("period=month&date_from=2024-01-01&date_to=2024-12-31")
+        # Version check and one rollup query; no partial months to group
+        self.assertEqual(len(queries), 2)
+
+    def test_empty_periods_are_zero_filled(self):
+        rows = self.check("month", date(2024, 1, 1), date(2024, 4, 30))
+
+        self.assertEqual(
+            rows[2],
+            {
+                "period_start": "2024-03-01",
+                "income": "0.00",
+                "expenses": "0.00",
+                "net": "0.00",
+            },
+        )
+
+    def test_partial_months_are_grouped_from_rows(self):
+        self.check("month", date(2024, 1, 17), date(2024, 6, 10))
+        self.check("month", date(2024, 2, 3), date(2024, 2, 20))
+
+    def test_every_period(self):
+        for period in ("day", "week", "quarter", "year"):
+            self.check(period, date(2024, 1, 10), date(2024, 11, 20))
+
+    def test_daily_report_groups_rows_per_kind(self):
+        self.check("day", date(2024, 1, 1), date(2024, 2, 1))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.report("period=day&date_from=2024-01-01&date_to=2024-02-01")
+        # Version check and one grouped query per kind
+        self.assertEqual(len(queries), 3)
+
+    def test_category_filter(self):
+        self.check(
+            "quarter",
+            date(2024, 2, 15),
+            date(2024, 9, 30),
+            extra=f"&category={self.studio.id}",
+            keep=lambda row: row.category_id == self.studio.id,
+        )
+
+    def test_defaults_to_a_year_of_months(self):
+        data = self.report("")
+
+        self.assertEqual(data["period"], "month")
+        self.assertEqual(
+            date.fromisoformat(data["date_to"])
+            - date.fromisoformat(data["date_from"]),
+            timedelta(days=365),
+        )
+        self.assertEqual(len(data["results"]), 13)
+
+    def test_etag_changes_with_the_default_window(self):
+        with mock.patch(
+            "api.reports.timezone.localdate", return_value=date(2024, 6, 30)
+        ):
+            etag = self.client.get("/reports/timeseries/")["ETag"]
+            response = self.client.get(
+                "/reports/timeseries/", HTTP_IF_NONE_MATCH=etag
+            )
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        with mock.patch(
+            "api.reports.timezone.localdate", return_value=date(2024, 7, 1)
+        ):
+            response = self.client.get(
+                "/reports/timeseries/", HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["date_to"], "2024-07-01")
+
+    def test_invalid_parameters(self):
+        for query in (
+            "period=fortnight",
+            "date_from=nope",
+            "date_from=2024-02-01&date_to=2024-01-01",
+            "period=day&date_from=2000-01-01&date_to=2024-01-01",
+        ):
+            response = self.client.get(f"/reports/timeseries/?{query}")
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, query
+            )
+
+
+# ----------------------Pivot Report Tests----------------------
+
+
+class PivotReportTest(TestCase):
+    """
+    Test cases for GET /reports/pivot/.
+    Tests the dense category x period matrix, its CSV form and queries.
+    """
+
+    def setUp(self):
+        """Set up two expense categories, one income category and a gap."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.session = Category.objects.create(
+            name="Session Musicians", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+        for category, day, amount in (
+            (self.studio, date(2024, 1, 5), "100.00"),
+            (self.studio, date(2024, 1, 20), "50.50"),
+            (self.session, date(2024, 1, 9), "80.00"),
+            (self.studio, date(2024, 3, 2), "25.00"),
+            (self.session, date(2024, 3, 30), "40.00"),
+        ):
+            Expense.objects.create(
+                user=self.user, category=category, amount=Decimal(amount), date=day
+            )
+        Income.objects.create(
+            user=self.user,
+            category=self.gigs,
+            amount=Decimal("500.00"),
+            date=date(2024, 2, 14),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get(self, query):
+        response = self.client.get(f"/reports/pivot/?{query}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_dense_matrix(self):
+        data = self.get("date_from=2024-01-01&date_to=2024-03-31").data
+
+        self.assertEqual(data["periods"], ["2024-01-01", "2024-02-01", "2024-03-01"])
+        self.assertEqual(
+            data["categories"],
+            [
+                {
+                    "id": self.session.id,
+                    "name": "Session Musicians",
+                    "values": ["80.00", "0.00", "40.00"],
+                    "total": "120.00",
+                },
+                {
+                    "id": self.studio.id,
+                    "name": "Studio Hire",
+                    "values": ["150.50", "0.00", "25.00"],
+                    "total": "175.50",
+                },
+            ],
+        )
+        self.assertEqual(data["totals"], ["230.50", "0.00", "65.00"])
+        self.assertEqual(data["total"], "295.50")
+
+    def test_income_partial_months_and_periods(self):
+        data = self.get(
+            "kind=income&period=quarter&date_from=2024-02-10&date_to=2024-05-15"
+        ).data
+        self.assertEqual(data["periods"], ["2024-01-01", "2024-04-01"])
+        self.assertEqual(data["categories"][0]["values"], ["500.00", "0.00"])
+
+        data = self.get("period=week&date_from=2024-01-01&date_to=2024-01-14").data
+        self.assertEqual(data["totals"], ["100.00", "80.00"])
+
+    def test_whole_months_take_one_grouped_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get("date_from=2024-01-01&date_to=2024-12-31")
+        # Version check and one rollup GROUP BY joined to the category names
+        self.assertEqual(len(queries), 2)
+
+    def test_csv(self):
+        response = self.get("date_from=2024-01-01&date_to=2024-03-31&format=csv")
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn("pivot-expense.csv", response["Content-Disposition"])
+        self.assertEqual(
+            response.content.decode().splitlines(),
+            [
+                "category,2024-01-01,2024-02-01,2024-03-01,total",
+                "Session Musicians,80.00,0.00,40.00,120.00",
+                "Studio Hire,150.50,0.00,25.00,175.50",
+                "Total,230.50,0.00,65.00,295.50",
+            ],
+        )
+
+    def test_etag_changes_with_the_default_window(self):
+        with mock.patch(
+            "api.reports.timezone.localdate", return_value=date(2024, 3, 31)
+        ):
+            etag = self.get("")["ETag"]
+        with mock.patch(
+            "api.reports.timezone.localdate", return_value=date(2024, 4, 1)
+        ):
+            response = self.client.get("/reports/pivot/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["periods"][-1], "2024-04-01")
+
+    def test_invalid_parameters(self):
+        for query in ("kind=transfer", "period=fortnight", "format=csv&kind=nope"):
+            response = self.client.get(f"/reports/pivot/?{query}")
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST, query
+            )
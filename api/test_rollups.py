@@ -0,0 +1,199 @@
+"""Test cases for the incrementally maintained monthly rollups."""
+
+from decimal import Decimal
+from datetime import date
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.contrib.auth.models import User
+from .caching import dashboard_cache_key
+from .models import BULK_ROLLUP_THRESHOLD, Category, Expense, Income, MonthlyRollup
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Monthly Rollup Tests----------------------
+
+
+class MonthlyRollupTest(TestCase):
+    """
+    Test cases for rollup maintenance on Expense/Income writes.
+    Tests creates, moves between months/categories, deletes and rebuild.
+    """
+
+    def setUp(self):
+        """Set up a user and categories."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.studio = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.travel = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.gigs = Category.objects.create(
+            name="Gigs", category_type=Category.CategoryType.INCOME
+        )
+
+    def rollups(self):
+        """Return {(kind, category_id, month): (total, count)}."""
+        return {
+            (r.kind, r.category_id, r.month): (r.total, r.count)
+            for r in MonthlyRollup.objects.filter(user=self.user)
+            if r.count
+        }
+
+    def add_expense(self, amount, day, category=None):
+        return Expense.objects.create(
+            user=self.user,
+            category=category or self.studio,
+            amount=Decimal(amount),
+            date=day,
+        )
+
+    def test_create_accumulates_per_month(self):
+        self.add_expense("10.00", date(2024, 1, 5))
+        self.add_expense("15.50", date(2024, 1, 20))
+        self.add_expense("7.00", date(2024, 2, 1))
+        Income.objects.create(
+            user=self.user,
+            category=self.gigs,
+            amount=Decimal("300.00"),
+            date=date(2024, 1, 9),
+        )
+
+        self.assertEqual(
+            self.rollups(),
+            {
+                ("EXPENSE", self.studio.id, date(2024, 1, 1)): (Decimal("25.50"), 2),
+                ("EXPENSE", self.studio.id, date(2024, 2, 1)): (Decimal("7.00"), 1),
+                ("INCOME", self.gigs.id, date(2024, 1, 1)): (Decimal("300.00"), 1),
+            },
+        )
+
+    def test_update_amount(self):
+        expense = self.add_expense("10.00", date(2024, 1, 5))
+
+        expense.amount = Decimal("12.00")
+        expense.save()
+
+        self.assertEqual(
+            self.rollups(),
+            {("EXPENSE", self.studio.id, date(2024, 1, 1)): (Decimal("12.00"), 1)},
+        )
+
+    def test_update_moves_month_and_category(self):
+        expense = self.add_expense("10.00", date(2024, 1, 5))
+        self.add_expense("5.00", date(2024, 1, 6))
+
+        expense.date = date(2024, 3, 2)
+        expense.category = self.travel
+        expense.save()
+
+        self.assertEqual(
+            self.rollups(),
+            {
+                ("EXPENSE", self.studio.id, date(2024, 1, 1)): (Decimal("5.00"), 1),
+                ("EXPENSE", self.travel.id, date(2024, 3, 1)): (Decimal("10.00"), 1),
+            },
+        )
+
+    def test_string_values_are_normalised(self):
+        Expense.objects.create(
+            user=self.user, category=self.studio, amount="4.50", date="2024-05-31"
+        )
+
+        self.assertEqual(
+            self.rollups(),
+            {("EXPENSE", self.studio.id, date(2024, 5, 1)): (Decimal("4.50"), 1)},
+        )
+
+    def test_delete_and_queryset_delete(self):
+        first = self.add_expense("10.00", date(2024, 1, 5))
+        self.add_expense("20.00", date(2024, 1, 6))
+        self.add_expense("30.00", date(2024, 1, 7))
+
+        first.delete()
+        self.assertEqual(
+            self.rollups(),
+            {("EXPENSE", self.studio.id, date(2024, 1, 1)): (Decimal("50.00"), 2)},
+        )
+
+        Expense.objects.filter(user=self.user).delete()
+        self.assertEqual(self.rollups(), {})
+
+    def test_large_delta_sets_are_applied_set_wise(self):
+        self.add_expense("10.00", date(2020, 1, 5))
+        deltas = [
+            (self.user.id, category.id, date(2020 + i // 12, i % 12 + 1, 9), amount, 1)
+            for i in range(BULK_ROLLUP_THRESHOLD + 10)
+            for category, amount in ((self.studio, 1), (self.travel, 2))
+        ]
+
+        # One SELECT, one executemany UPDATE and one INSERT, plus savepoints
+        with self.assertNumQueries(7):
+            MonthlyRollup.apply_deltas("EXPENSE", deltas)
+
+        rollups = self.rollups()
+        self.assertEqual(len(rollups), 2 * (BULK_ROLLUP_THRESHOLD + 10))
+        self.assertEqual(
+            rollups[("EXPENSE", self.studio.id, date(2020, 1, 1))], (Decimal("11"), 2)
+        )
+        self.assertEqual(
+            rollups[("EXPENSE", self.travel.id, date(2021, 1, 1))], (Decimal("2"), 1)
+        )
+
+    def test_large_delta_sets_skip_unrelated_rollups(self):
+        # Same user, category and month as the deltas, but not together
+        self.add_expense("10.00", date(2024, 1, 5), category=self.travel)
+        deltas = [
+            (self.user.id, self.studio.id, date(2024, 1, 9), Decimal("1.00"), 1)
+        ] + [
+            (self.user.id, self.travel.id, date(2025 + i // 12, i % 12 + 1, 9), 2, 1)
+            for i in range(BULK_ROLLUP_THRESHOLD)
+        ]
+
+        MonthlyRollup.apply_deltas("EXPENSE", deltas)
+
+        rollups = self.rollups()
+        self.assertEqual(
+            rollups[("EXPENSE", self.travel.id, date(2024, 1, 1))],
+            (Decimal("10.00"), 1),
+        )
+        self.assertEqual(
+            rollups[("EXPENSE", self.studio.id, date(2024, 1, 1))],
+            (Decimal("1.00"), 1),
+        )
+
+    def test_rebuild_matches_incremental(self):
+        self.add_expense("10.00", date(2024, 1, 5))
+        moved = self.add_expense("20.00", date(2024, 2, 6))
+        moved.date = date(2024, 4, 1)
+        moved.save()
+        Income.objects.create(
+            user=self.user,
+            category=self.gigs,
+            amount=Decimal("80.00"),
+            date=date(2024, 4, 2),
+        )
+        incremental = self.rollups()
+
+        # Corrupt the table, then rebuild it from the transactions
+        MonthlyRollup.objects.update(total=0, count=99)
+        out = StringIO()
+        call_command("rebuild_rollups", stdout=out)
+
+        self.assertEqual(self.rollups(), incremental)
+        self.assertIn("Wrote 3 rollup rows", out.getvalue())
+
+    def test_rebuild_drops_cached_dashboards(self):
+        cache.set(dashboard_cache_key(self.user.id), ("version", {}))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "rebuild_rollups", "--user", str(self.user.id), stdout=StringIO()
+            )
+
+        self.assertIsNone(cache.get(dashboard_cache_key(self.user.id)))
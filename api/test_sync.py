@@ -0,0 +1,231 @@
+"""Test cases for delta sync (updated_at tracking, tombstones, /sync/)."""
+
+from decimal import Decimal
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from .models import Budget, Category, Client, Expense, Goal, Project, Tombstone
+from .sync import encode_sync_token
+
+# pylint: disable=no-member
+# pylint: disable=missing-function-docstring
+
+# ----------------------Delta Sync Tests----------------------
+
+
+class DeltaSyncTest(TestCase):
+    """
+    Test cases for the /sync/ endpoint.
+    Tests full and delta syncs, tombstones, nested touches and expiry.
+    """
+
+    def setUp(self):
+        """Set up a user with one row of each synced resource."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Studio Hire", category_type=Category.CategoryType.EXPENSE
+        )
+        self.venue = Client.objects.create(
+            user=self.user, name="The Venue", email="bookings@venue.example"
+        )
+        self.album = Project.objects.create(
+            user=self.user,
+            client=self.venue,
+            name="Debut Album",
+            date_created=date(2024, 1, 1),
+        )
+        self.expense = Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            project=self.album,
+            amount=Decimal("40.00"),
+            date=date(2024, 1, 10),
+        )
+        self.goal = Goal.objects.create(
+            user=self.user,
+            name="New Guitar",
+            target=Decimal("1500.00"),
+            deadline=date(2024, 12, 31),
+            status="IN_PROGRESS",
+        )
+        Expense.objects.create(
+            user=self.other_user,
+            category=self.category,
+            amount=Decimal("5.00"),
+            date=date(2024, 1, 10),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def sync(self, token=None):
+        url = "/sync/" if token is None else f"/sync/?since={token}"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def ids(self, data, resource):
+        return [row["id"] for row in data["changed"][resource]]
+
+    def later(self, minutes):
+        """Patch ``now`` forward; tokens are issued at +1 and changes made
+        at +2 so the set-up rows fall outside the sync overlap window."""
+        return mock.patch(
+            "django.utils.timezone.now",
+            return_value=timezone.now() + timedelta(minutes=minutes),
+        )
+
+    def issue_token(self):
+        with self.later(1):
+            return self.sync()["token"]
+
+    def test_full_sync_without_token(self):
+        data = self.sync()
+
+        self.assertTrue(data["full"])
+        self.assertEqual(self.ids(data, "expenses"), [self.expense.id])
+        self.assertEqual(self.ids(data, "projects"), [self.album.id])
+        self.assertEqual(self.ids(data, "clients"), [self.venue.id])
+        self.assertEqual(self.ids(data, "goals"), [self.goal.id])
+        self.assertIn("updated_at", data["changed"]["expenses"][0])
+
+    def test_delta_returns_only_changes(self):
+        token = self.issue_token()
+
+        with self.later(2):
+            self.goal.status = "COMPLETED"
+            self.goal.save()
+            data = self.sync(token)
+
+        self.assertFalse(data["full"])
+        self.assertEqual(self.ids(data, "goals"), [self.goal.id])
+        self.assertEqual(self.ids(data, "expenses"), [])
+        self.assertEqual(self.ids(data, "clients"), [])
+
+    def test_deletes_are_reported(self):
+        token = self.issue_token()
+
+        with self.later(2):
+            expense_id = self.expense.id
+            self.expense.delete()
+            data = self.sync(token)
+
+        self.assertEqual(data["deleted"]["expenses"], [expense_id])
+        self.assertEqual(self.ids(data, "expenses"), [])
+
+    def test_budget_progress_change_is_synced(self):
+        with self.later(-1):
+            budget = Budget.objects.create(
+                user=self.user,
+                category=self.category,
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 1, 31),
+                amount=Decimal("100.00"),
+            )
+        token = self.issue_token()
+
+        with self.later(2):
+            Expense.objects.create(
+                user=self.user,
+                category=self.category,
+                amount=Decimal("10.00"),
+                date=date(2024, 1, 12),
+            )
+            data = self.sync(token)
+
+        self.assertEqual(self.ids(data, "budgets"), [budget.id])
+        self.assertEqual(data["changed"]["budgets"][0]["remaining_amount"], "50.00")
+
+    def test_client_edit_touches_nesting_rows(self):
+        token = self.issue_token()
+
+        with self.later(2):
+            self.venue.name = "The Old Venue"
+            self.venue.save()
+            data = self.sync(token)
+
+        self.assertEqual(self.ids(data, "clients"), [self.venue.id])
+        self.assertEqual(self.ids(data, "projects"), [self.album.id])
+        self.assertEqual(self.ids(data, "expenses"), [self.expense.id])
+        self.assertEqual(
+            data["changed"]["expenses"][0]["project"]["client"]["name"],
+            "The Old Venue",
+        )
+
+    def test_project_delete_touches_and_tombstones(self):
+        token = self.issue_token()
+
+        with self.later(2):
+            album_id = self.album.id
+            self.album.delete()
+            data = self.sync(token)
+
+        self.assertEqual(data["deleted"]["projects"], [album_id])
+        self.assertIsNone(data["changed"]["expenses"][0]["project"])
+
+    def test_batch_delete_writes_tombstones_once(self):
+        extra = [
+            Expense.objects.create(
+                user=self.user,
+                category=self.category,
+                amount=Decimal("1.00"),
+                date=date(2024, 1, 11),
+            )
+            for _ in range(3)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                "/expenses/batch/",
+                {"delete": [row.id for row in extra]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "api_tombstone"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            sorted(
+                Tombstone.objects.filter(model="expense").values_list(
+                    "object_id", flat=True
+                )
+            ),
+            sorted(row.id for row in extra),
+        )
+
+    def test_invalid_and_expired_tokens(self):
+        response = self.client.get("/sync/?since=not-a-token")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        old = encode_sync_token(timezone.now() - timedelta(days=31))
+        response = self.client.get(f"/sync/?since={old}")
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_prune_tombstones(self):
+        self.goal.delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=40))
+        self.expense.delete()
+
+        out = StringIO()
+        call_command("prune_tombstones", stdout=out)
+
+        self.assertIn("Deleted 1 tombstones", out.getvalue())
+        self.assertEqual(
+            list(Tombstone.objects.values_list("model", flat=True)), ["expense"]
+        )
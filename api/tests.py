@@ -2,6 +2,8 @@
 
 from decimal import Decimal
 from datetime import date
+from importlib import import_module
+from django.apps import apps
 from django.test import TestCase
 from django.contrib.auth.models import User
 from .models import Category, Expense, Income, Budget, Goal
@@ -375,6 +377,155 @@ class BudgetModelTest(TestCase):
             Budget.objects.get(id=budget.id)
 
 
+# ----------------------Budget Progress Tests----------------------
+
+
+class BudgetProgressTest(TestCase):
+    """
+    Test that stored budget progress follows expense writes without the
+    budget being saved again.
+    """
+
+    def setUp(self):
+        """Set up overlapping budgets with no expenses yet."""
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.category = Category.objects.create(
+            name="Groceries", category_type=Category.CategoryType.EXPENSE
+        )
+        self.other_category = Category.objects.create(
+            name="Travel", category_type=Category.CategoryType.EXPENSE
+        )
+        self.january = Budget.objects.create(
+            user=self.user,
+            category=self.category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("200.00"),
+        )
+        self.quarter = Budget.objects.create(
+            user=self.user,
+            category=self.category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 3, 31),
+            amount=Decimal("400.00"),
+        )
+
+    def assertProgress(self, budget, remaining, percentage):
+        budget.refresh_from_db()
+        self.assertEqual(budget.remaining_amount, Decimal(remaining))
+        self.assertEqual(budget.percentage, Decimal(percentage))
+        # Stored values must agree with a fresh aggregate
+        self.assertEqual(
+            (budget.remaining_amount, budget.percentage),
+            tuple(
+                value.quantize(Decimal("0.01"))
+                for value in budget.compute_remaining_and_percentage()
+            ),
+        )
+
+    def test_create_updates_every_overlapping_budget(self):
+        Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("50.00"),
+            date=date(2024, 1, 15),
+        )
+
+        self.assertProgress(self.january, "150.00", "25.00")
+        self.assertProgress(self.quarter, "350.00", "12.50")
+
+    def test_update_moving_out_of_range(self):
+        expense = Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("50.00"),
+            date=date(2024, 1, 15),
+        )
+
+        expense.date = date(2024, 2, 10)
+        expense.amount = Decimal("80.00")
+        expense.save()
+
+        self.assertProgress(self.january, "200.00", "0.00")
+        self.assertProgress(self.quarter, "320.00", "20.00")
+
+    def test_update_changing_category(self):
+        expense = Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("50.00"),
+            date=date(2024, 1, 15),
+        )
+
+        expense.category = self.other_category
+        expense.save()
+
+        self.assertProgress(self.january, "200.00", "0.00")
+        self.assertProgress(self.quarter, "400.00", "0.00")
+
+    def test_delete_restores_budget(self):
+        expense = Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("100.00"),
+            date=date(2024, 1, 20),
+        )
+        self.assertProgress(self.january, "100.00", "50.00")
+
+        expense.delete()
+
+        self.assertProgress(self.january, "200.00", "0.00")
+
+    def test_income_does_not_affect_budgets(self):
+        Income.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("100.00"),
+            date=date(2024, 1, 20),
+        )
+
+        self.assertProgress(self.january, "200.00", "0.00")
+
+    def test_overspend_caps_percentage(self):
+        small = Budget.objects.create(
+            user=self.user,
+            category=self.other_category,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            amount=Decimal("10.00"),
+        )
+
+        Expense.objects.create(
+            user=self.user,
+            category=self.other_category,
+            amount=Decimal("200.00"),
+            date=date(2024, 1, 20),
+        )
+
+        self.assertProgress(small, "-190.00", "999.99")
+        small.save()
+        self.assertProgress(small, "-190.00", "999.99")
+
+
+    def test_upgrade_migration_recomputes_stale_progress(self):
+        Expense.objects.create(
+            user=self.user,
+            category=self.category,
+            amount=Decimal("50.00"),
+            date=date(2024, 1, 15),
+        )
+        # Stored before expense writes kept progress up to date
+        Budget.objects.update(remaining_amount=0, percentage=0)
+
+        migration = import_module("api.migrations.0015_recompute_budget_progress")
+        migration.recompute_budget_progress(apps, None)
+
+        self.assertProgress(self.january, "150.00", "25.00")
+        self.assertProgress(self.quarter, "350.00", "12.50")
+
+
 # ----------------------Goal Model Tests----------------------
 
 
@@ -2,11 +2,34 @@
 
 # pylint: disable=no-member
 
-from django.db.models import Sum
-from rest_framework import viewsets
+import codecs
+
+from django.contrib.auth.models import User
+from django.db.models import (
+    CharField,
+    Count,
+    DateField,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Max,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
 
 from api.data.categories import DEFAULT_EXPENSE_CATEGORIES, DEFAULT_INCOME_CATEGORIES
 from .serializers import (
@@ -14,40 +37,346 @@ from .serializers import (
     CategorySerializer,
     IncomeSerializer,
     BudgetSerializer,
+    BudgetCheckpointSpendSerializer,
+    BudgetForecastSerializer,
+    RecurringRuleSerializer,
     GoalSerializer,
     ProjectSerializer,
-    ClientSerializer
+    ProjectPnLSerializer,
+    ClientSerializer,
+    ClientStatsSerializer,
+    LedgerBalanceSerializer,
+    LedgerEntrySerializer,
+    PivotReportSerializer,
+    TimeSeriesReportSerializer,
+)
+from .models import (
+    Budget,
+    Category,
+    Client,
+    Expense,
+    Goal,
+    Income,
+    MonthlyRollup,
+    Project,
+    RecurringRule,
+    Tombstone,
+)
+from .caching import get_cached_dashboard, set_cached_dashboard
+from .conditional import ConditionalGetMixin, conditional_get, data_version
+from .exports import EXPORT_COLUMNS, EXPORT_RENDERERS, export_values, stream_export
+from .filters import (
+    BudgetFilterBackend,
+    TransactionFilterBackend,
+    apply_transaction_filters,
+    client_stats_ordering,
+    filter_project_pnl,
+    parse_transaction_filters,
+    transaction_ordering,
 )
-from .models import Budget, Category, Expense, Goal, Income, Project, Client
+from .batch import TransactionBatch
+from .forecasts import active_budgets, forecast, parse_forecast_params
+from .imports import TransactionImporter
+from .ledger import Ledger
+from .pagination import KeysetPagination, LedgerPagination
+from .renderers import PivotCSVRenderer
+from .reports import parse_pivot_params, parse_report_params, pivot, timeseries
+from .sync import (
+    SYNC_OVERLAP,
+    SyncTokenError,
+    decode_sync_token,
+    encode_sync_token,
+    is_expired,
+)
+
+# Relations rendered by the nested Expense/Income serializers; loading them
+# with the rows keeps list and detail responses at a constant query count.
+TRANSACTION_RELATED = ("category", "project__client", "client")
+# Output type of the annotated money totals
+MONEY_FIELD = DecimalField(max_digits=14, decimal_places=2)
+
+
+def related_aggregate(model, field, aggregate, output_field, default=None):
+    """``aggregate`` over the ``model`` rows whose ``field`` is the outer row.
+
+    A correlated subquery for ``annotate()``; ``default`` replaces NULL
+    when the outer row has no related rows.
+    """
+    value = Subquery(
+        model.objects.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(value=aggregate)
+        .values("value"),
+        output_field=output_field,
+    )
+    if default is None:
+        return value
+    return Coalesce(value, Value(default), output_field=output_field)
 
 
 # ----------------------API Views (DRF)----------------------
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class SparseFieldsetMixin:
+    """``?fields=`` and ``?expand=`` on list and detail GETs.
+
+    Either parameter switches the response to the flat shape of
+    ``SparseFieldsMixin``: relations are ids unless expanded, and only
+    the expanded relations are joined. Without them the usual nested
+    response is returned.
+    """
+
+    def sparse_options(self):
+        """Return ``(fields, expand)`` for this request, or None."""
+        params = self.request.query_params
+        if (
+            self.request.method != "GET"
+            or self.action not in ("list", "retrieve")
+            or ("fields" not in params and "expand" not in params)
+        ):
+            return None
+
+        def names(key):
+            return {name.strip() for name in params[key].split(",") if name.strip()}
+
+        fields = names("fields") if "fields" in params else None
+        expand = names("expand") if "expand" in params else set()
+        # Reject bad paths before they reach select_related()
+        self.get_serializer_class().split_expand(expand)
+        return fields, expand
+
+    def load_related(self, queryset, default):
+        """Join the ``default`` relations, or only the expanded ones."""
+        sparse = self.sparse_options()
+        if sparse is None:
+            return queryset.select_related(*default)
+        fields, expand = sparse
+        paths = [
+            path.replace(".", "__")
+            for path in expand
+            if fields is None or path.partition(".")[0] in fields
+        ]
+        # select_related() without arguments would follow every relation
+        return queryset.select_related(*paths) if paths else queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        sparse = self.sparse_options()
+        if sparse is not None:
+            context["sparse"] = sparse
+        return context
+
+
+class ProjectViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
+    """
+    Projects of the user. ``?pnl=true`` on list and detail GETs adds each
+    project's expense and income totals and counts, net and margin,
+    annotated in the same query as the projects and their clients; the
+    list can then be filtered by margin and sorted by any figure.
+    """
+
     queryset = Project.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = ProjectSerializer
+    version_models = (Project, Client)
+    pnl_version_models = (Project, Client, Expense, Income)
+
+    def pnl_requested(self):
+        """Whether this request asked for the P&L columns."""
+        return (
+            self.request.method == "GET"
+            and self.action in ("list", "retrieve")
+            and self.request.query_params.get("pnl") in ("1", "true")
+        )
+
+    def get_version_models(self):
+        if self.pnl_requested():
+            return self.pnl_version_models
+        return self.version_models
+
+    def get_serializer_class(self):
+        if self.pnl_requested():
+            return ProjectPnLSerializer
+        return self.serializer_class
 
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user).order_by("-date_created")
+        queryset = self.load_related(
+            Project.objects.filter(user=self.request.user), ["client"]
+        )
+        if not self.pnl_requested():
+            return queryset.order_by("-date_created")
+        return filter_project_pnl(
+            self.with_pnl(queryset), self.request.query_params
+        )
+
+    @staticmethod
+    def with_pnl(queryset):
+        """Annotate the P&L columns with one correlated subquery each.
+
+        ``margin`` is net as a percentage of income, NULL without income.
+        It is computed in floating point: SQLite divides integer-valued
+        decimals as integers.
+        """
+
+        def per_project(model, aggregate, output_field):
+            return related_aggregate(model, "project", aggregate, output_field, 0)
+
+        income = Cast(F("income_total"), FloatField())
+        return queryset.annotate(
+            expense_total=per_project(Expense, Sum("amount"), MONEY_FIELD),
+            income_total=per_project(Income, Sum("amount"), MONEY_FIELD),
+            expense_count=per_project(Expense, Count("id"), IntegerField()),
+            income_count=per_project(Income, Count("id"), IntegerField()),
+            net=ExpressionWrapper(
+                F("income_total") - F("expense_total"), output_field=MONEY_FIELD
+            ),
+            margin=ExpressionWrapper(
+                (income - Cast(F("expense_total"), FloatField()))
+                * Value(100.0)
+                / NullIf(income, Value(0.0)),
+                output_field=FloatField(),
+            ),
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    """
+    Clients of the user. ``?stats=true`` on list and detail GETs adds each
+    client's income and expense totals, net, project count and last
+    activity date, annotated in the same query; the list can then be
+    sorted by any of them with ``sort`` and ``order``.
+    """
+
     queryset = Client.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = ClientSerializer
+    version_models = (Client,)
+    stats_version_models = (Client, Project, Expense, Income)
+
+    def stats_requested(self):
+        """Whether this request asked for the stats columns."""
+        return (
+            self.request.method == "GET"
+            and self.action in ("list", "retrieve")
+            and self.request.query_params.get("stats") in ("1", "true")
+        )
+
+    def get_version_models(self):
+        if self.stats_requested():
+            return self.stats_version_models
+        return self.version_models
+
+    def get_serializer_class(self):
+        if self.stats_requested():
+            return ClientStatsSerializer
+        return self.serializer_class
 
     def get_queryset(self):
-        return Client.objects.filter(user=self.request.user).order_by("name")
+        queryset = Client.objects.filter(user=self.request.user)
+        if not self.stats_requested():
+            return queryset.order_by("name")
+        return self.with_stats(queryset).order_by(
+            *client_stats_ordering(self.request.query_params)
+        )
+
+    @staticmethod
+    def with_stats(queryset):
+        """Annotate the stats columns with one correlated subquery each."""
+
+        def per_client(model, aggregate, output_field, default=None):
+            return related_aggregate(
+                model, "client", aggregate, output_field, default
+            )
+
+        last_income = per_client(Income, Max("date"), DateField())
+        last_expense = per_client(Expense, Max("date"), DateField())
+        return queryset.annotate(
+            income_total=per_client(Income, Sum("amount"), MONEY_FIELD, 0),
+            expense_total=per_client(Expense, Sum("amount"), MONEY_FIELD, 0),
+            net=ExpressionWrapper(
+                F("income_total") - F("expense_total"), output_field=MONEY_FIELD
+            ),
+            project_count=per_client(Project, Count("id"), IntegerField(), 0),
+            # GREATEST() is NULL if either side is on SQLite, so fill each
+            # side with the other before comparing
+            last_activity=Greatest(
+                Coalesce(last_income, last_expense),
+                Coalesce(last_expense, last_income),
+            ),
+        )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class ExpenseViewSet(viewsets.ModelViewSet):
+class TransactionActionsMixin:
+    """Collection actions (export, import, batch) shared by the expense
+    and income viewsets."""
+
+    # Set by subclasses: import kind ("expense"/"income") and export filename
+    transaction_kind = None
+    export_filename = None
+
+    @action(detail=False, renderer_classes=EXPORT_RENDERERS)
+    def export(self, request):
+        """Stream the filtered transactions as CSV (default) or NDJSON."""
+        rows = export_values(self.filter_queryset(self.get_queryset()))
+        return stream_export(
+            rows, request.accepted_renderer.format, self.export_filename
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_csv(self, request):
+        """Import a CSV upload (``file`` field) in one all-or-nothing batch."""
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"file": ["Upload a CSV file in the 'file' field."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        importer = TransactionImporter(request.user, self.transaction_kind)
+        try:
+            result = importer.run(codecs.iterdecode(upload, "utf-8-sig"))
+        except UnicodeDecodeError:
+            return Response(
+                {"file": ["The file must be UTF-8 encoded CSV."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            result.as_dict(),
+            status=status.HTTP_201_CREATED
+            if result.ok
+            else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(detail=False, methods=["post"])
+    def batch(self, request):
+        """Apply create/update/delete operations atomically in one request."""
+        batch = TransactionBatch(
+            self.get_serializer_class(),
+            self.get_queryset(),
+            self.get_serializer_context(),
+        )
+        data, status_code = batch.run(request.data, request.user)
+        return Response(data, status=status_code)
+
+
+class ExpenseViewSet(
+    ConditionalGetMixin,
+    SparseFieldsetMixin,
+    TransactionActionsMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint that allows expenses to be viewed or edited.
     """
@@ -55,15 +384,27 @@ class ExpenseViewSet(viewsets.ModelViewSet):
     queryset = Expense.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = ExpenseSerializer
+    version_models = (Expense, Category, Project, Client)
+    pagination_class = KeysetPagination
+    transaction_kind = "expense"
+    export_filename = "expenses"
+    filter_backends = [TransactionFilterBackend]
 
     def get_queryset(self):
-        return Expense.objects.filter(user=self.request.user).order_by("-date")
+        return self.load_related(
+            Expense.objects.filter(user=self.request.user), TRANSACTION_RELATED
+        ).order_by("-date", "-id")
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class IncomeViewSet(viewsets.ModelViewSet):
+class IncomeViewSet(
+    ConditionalGetMixin,
+    SparseFieldsetMixin,
+    TransactionActionsMixin,
+    viewsets.ModelViewSet,
+):
     """
     API endpoint that allows income to be viewed or edited.
     """
@@ -71,15 +412,24 @@ class IncomeViewSet(viewsets.ModelViewSet):
     queryset = Income.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = IncomeSerializer
+    version_models = (Income, Category, Project, Client)
+    pagination_class = KeysetPagination
+    transaction_kind = "income"
+    export_filename = "income"
+    filter_backends = [TransactionFilterBackend]
 
     def get_queryset(self):
-        return Income.objects.filter(user=self.request.user).order_by("-date")
+        return self.load_related(
+            Income.objects.filter(user=self.request.user), TRANSACTION_RELATED
+        ).order_by("-date", "-id")
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class BudgetViewSet(viewsets.ModelViewSet):
+class BudgetViewSet(
+    ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """
     API endpoint that allows budgets to be viewed or edited.
     """
@@ -87,17 +437,80 @@ class BudgetViewSet(viewsets.ModelViewSet):
     queryset = Budget.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = BudgetSerializer
+    filter_backends = [BudgetFilterBackend]
+    version_models = (Budget, Category)
 
     def get_queryset(self):
-        return Budget.objects.filter(user=self.request.user).order_by(
-            "-start_date"
+        return (
+            self.load_related(
+                Budget.objects.filter(user=self.request.user), ["category"]
+            )
+            .prefetch_related("checkpoints")
+            .order_by("-start_date")
         )
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False)
+    def forecast(self, request):
+        """Project each active budget's spend to its end date and flag
+        the ones likely to overspend."""
+
+        cleaned = parse_forecast_params(request.query_params)
+        return conditional_get(
+            request,
+            (Budget, Expense, Category),
+            lambda: self.forecast_response(request, cleaned),
+            # Without ``as_of`` the forecast changes with the date
+            key=cleaned["as_of"].isoformat(),
+        )
 
-class GoalViewSet(viewsets.ModelViewSet):
+    @staticmethod
+    def forecast_response(request, cleaned):
+        """Build the forecast of the user's budgets active on ``as_of``."""
+
+        as_of = cleaned["as_of"]
+        budgets = (
+            active_budgets(as_of, request.user)
+            .select_related("category")
+            .order_by("end_date", "id")
+        )
+        rows = forecast(budgets, as_of)
+        if cleaned["at_risk"]:
+            rows = [row for row in rows if row["at_risk"]]
+        return Response(BudgetForecastSerializer(rows, many=True).data)
+
+    @action(detail=True)
+    def checkpoints(self, request, pk=None):
+        """Cumulative spend, remaining amount and percentage at each of
+        the budget's checkpoints."""
+
+        return conditional_get(
+            request,
+            (Budget, Expense),
+            lambda: self.checkpoints_response(self.get_object()),
+        )
+
+    @staticmethod
+    def checkpoints_response(budget):
+        """Build the checkpoint snapshots of ``budget``."""
+
+        snapshots = []
+        for day, spent in budget.checkpoint_spend():
+            remaining, percentage = budget.progress(spent)
+            snapshots.append(
+                {
+                    "date": day,
+                    "spent": spent,
+                    "remaining": remaining,
+                    "percentage": percentage,
+                }
+            )
+        return Response(BudgetCheckpointSpendSerializer(snapshots, many=True).data)
+
+
+class GoalViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     API endpoint that allows goals to be viewed or edited.
     """
@@ -105,6 +518,7 @@ class GoalViewSet(viewsets.ModelViewSet):
     queryset = Goal.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = GoalSerializer
+    version_models = (Goal,)
 
     def get_queryset(self):
         return Goal.objects.filter(user=self.request.user).order_by("deadline")
@@ -113,12 +527,36 @@ class GoalViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class RecurringRuleViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    """
+    API endpoint that allows recurring expense and income rules to be
+    viewed or edited. Their occurrences are created by the
+    ``materialize_recurring`` command.
+    """
+
+    queryset = RecurringRule.objects.all()
+    permission_classes = [IsAuthenticated]
+    serializer_class = RecurringRuleSerializer
+    version_models = (RecurringRule, Category, Project, Client)
+
+    def get_queryset(self):
+        return (
+            RecurringRule.objects.filter(user=self.request.user)
+            .select_related("category")
+            .order_by("start_date", "id")
+        )
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+class CategoryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """API endpoint that allows categories to be viewed or edited."""
 
     queryset = Category.objects.all()
     permission_classes = [IsAuthenticated]
     serializer_class = CategorySerializer
+    version_models = (Category,)
 
     def get_queryset(self):
         queryset = Category.objects.all()
@@ -131,6 +569,187 @@ class CategoryViewSet(viewsets.ModelViewSet):
         return queryset
 
 
+class LedgerAPIView(APIView):
+    """
+    API endpoint that returns expenses and income as one date-ordered,
+    keyset-paginated feed with a running balance.
+    """
+
+    permission_classes = [IsAuthenticated]
+    version_models = (Expense, Income, Category)
+
+    def get(self, request):
+        """Get one page of the ledger (or 304 when the client's is current)."""
+
+        return conditional_get(
+            request, self.version_models, lambda: self.page_response(request)
+        )
+
+    def page_response(self, request):
+        """Build the page named by the query string's filters and cursor."""
+
+        cleaned = parse_transaction_filters(request.query_params)
+        if cleaned["sort"] != "date":
+            raise ValidationError({"sort": "The ledger is always ordered by date."})
+        ledger = Ledger(request.user, cleaned)
+        paginator = LedgerPagination()
+        rows = ledger.add_balances(paginator.paginate_queryset(ledger, request, self))
+        return paginator.get_paginated_response(
+            LedgerEntrySerializer(rows, many=True).data
+        )
+
+
+class LedgerBalanceAPIView(APIView):
+    """
+    API endpoint that returns the closing balance of each day with
+    activity in a date window, seeded by the balance before the window.
+    """
+
+    permission_classes = [IsAuthenticated]
+    version_models = (Expense, Income)
+
+    def get(self, request):
+        """Get the balance series (or 304 when the client's is current)."""
+
+        return conditional_get(
+            request, self.version_models, lambda: self.series_response(request)
+        )
+
+    def series_response(self, request):
+        """Build the series for the query string's filters."""
+
+        cleaned = parse_transaction_filters(request.query_params)
+        opening, days = Ledger(request.user, cleaned).daily_balances()
+        data = {
+            "opening_balance": opening,
+            "closing_balance": days[-1]["balance"] if days else opening,
+            "days": days,
+        }
+        return Response(LedgerBalanceSerializer(data).data)
+
+
+class TimeSeriesReportAPIView(APIView):
+    """
+    API endpoint that returns income, expenses and net per day, week,
+    month, quarter or year over a date range, with empty periods as zeros.
+    """
+
+    permission_classes = [IsAuthenticated]
+    version_models = (Expense, Income)
+
+    def get(self, request):
+        """Get the report (or 304 when the client's copy is current)."""
+
+        cleaned = parse_report_params(request.query_params)
+        return conditional_get(
+            request,
+            self.version_models,
+            lambda: self.report_response(request, cleaned),
+            # Without explicit dates the window moves with the date
+            key=f"{cleaned['date_from']}:{cleaned['date_to']}",
+        )
+
+    @staticmethod
+    def report_response(request, cleaned):
+        """Build the report for the cleaned period and range."""
+
+        data = {
+            "period": cleaned["period"],
+            "date_from": cleaned["date_from"],
+            "date_to": cleaned["date_to"],
+            "results": timeseries(
+                request.user,
+                cleaned["period"],
+                cleaned["date_from"],
+                cleaned["date_to"],
+                category=cleaned["category"],
+            ),
+        }
+        return Response(TimeSeriesReportSerializer(data).data)
+
+
+class PivotReportAPIView(APIView):
+    """
+    API endpoint that returns expense or income totals per category and
+    period as a dense matrix, as JSON or (``?format=csv``) a CSV table.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, PivotCSVRenderer]
+    version_models = (Expense, Income, Category)
+
+    def get(self, request):
+        """Get the matrix (or 304 when the client's copy is current)."""
+
+        cleaned = parse_pivot_params(request.query_params)
+        return conditional_get(
+            request,
+            self.version_models,
+            lambda: self.report_response(request, cleaned),
+            # Without explicit dates the window moves with the date
+            key=f"{cleaned['date_from']}:{cleaned['date_to']}",
+        )
+
+    @staticmethod
+    def report_response(request, cleaned):
+        """Build the matrix for the cleaned kind, period and range."""
+
+        matrix = pivot(
+            request.user,
+            cleaned["kind"],
+            cleaned["period"],
+            cleaned["date_from"],
+            cleaned["date_to"],
+            category=cleaned["category"],
+        )
+        data = {
+            "kind": cleaned["kind"],
+            "period": cleaned["period"],
+            "date_from": cleaned["date_from"],
+            "date_to": cleaned["date_to"],
+            **matrix,
+        }
+        response = Response(PivotReportSerializer(data).data)
+        if request.accepted_renderer.format == PivotCSVRenderer.format:
+            response["Content-Disposition"] = (
+                f'attachment; filename="pivot-{cleaned["kind"]}.csv"'
+            )
+        return response
+
+
+class LedgerExportAPIView(APIView):
+    """
+    API endpoint that streams expenses and income together as one
+    date-ordered ledger, honouring the transaction list filters.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = EXPORT_RENDERERS
+
+    def get(self, request):
+        """Stream the combined ledger as CSV (default) or NDJSON."""
+
+        cleaned = parse_transaction_filters(request.query_params)
+        sides = [
+            export_values(
+                apply_transaction_filters(
+                    model.objects.filter(user=request.user), cleaned
+                )
+                .order_by()
+                .annotate(kind=Value(model.rollup_kind, output_field=CharField())),
+                extra=("kind",),
+            )
+            for model in (Expense, Income)
+        ]
+        rows = sides[0].union(sides[1], all=True).order_by(
+            *transaction_ordering(cleaned)
+        )
+        columns = (("kind", "kind"),) + EXPORT_COLUMNS
+        return stream_export(
+            rows, request.accepted_renderer.format, "ledger", columns=columns
+        )
+
+
 class DashboardAPIView(APIView):
     """
     API endpoint that returns dashboard summary data.
@@ -139,34 +758,103 @@ class DashboardAPIView(APIView):
 
     permission_classes = [IsAuthenticated]
 
+    # Models whose rows appear in (or are nested inside) the payload
+    version_models = (Expense, Income, Budget, Goal, Project, Client, Category)
+
     def get(self, request):
-        """Get dashboard summary data."""
+        """Get dashboard summary data, served from the per-user cache
+        (or answered with 304 when the client's copy is current)."""
+
+        # Read before the payload, so the body is never older than its tag
+        version = data_version(request.user, self.version_models)
+        return conditional_get(
+            request,
+            self.version_models,
+            lambda: self.cached_response(request, version),
+            version=version,
+        )
+
+    def cached_response(self, request, version):
+        """The full dashboard response, from the per-user cache if it was
+        built at ``version``."""
 
         user = request.user
+        data = get_cached_dashboard(user.pk, version)
+        if data is None:
+            data = self.build_dashboard(user)
+            set_cached_dashboard(user.pk, version, data)
+        return Response(data)
 
-        recent_expenses = Expense.objects.filter(user=user).order_by("-date")[
-            :3
-        ]
-        recent_income = Income.objects.filter(user=user).order_by("-date")[:3]
-        recent_budgets = Budget.objects.filter(user=user).order_by(
-            "-start_date"
-        )[:3]
-        recent_goals = Goal.objects.filter(user=user).order_by("deadline")[:3]
-        income_total = (
-            Income.objects.filter(user=user).aggregate(total=Sum("amount"))[
-                "total"
-            ]
-            or 0
-        )
-        expense_total = (
-            Expense.objects.filter(user=user).aggregate(total=Sum("amount"))[
-                "total"
-            ]
-            or 0
+    @staticmethod
+    def summary_totals(user):
+        """Totals and counts for ``user`` in a single query.
+
+        The money totals are read from the monthly rollups, so their cost
+        grows with months x categories rather than with transactions.
+        """
+
+        def per_user(queryset, aggregate, output_field):
+            return Coalesce(
+                Subquery(
+                    queryset.filter(user=OuterRef("pk"))
+                    .order_by()
+                    .values("user")
+                    .annotate(value=aggregate)
+                    .values("value")
+                ),
+                Value(0),
+                output_field=output_field,
+            )
+
+        money = DecimalField(max_digits=14, decimal_places=2)
+        rollups = MonthlyRollup.objects.all()
+        return (
+            User.objects.filter(pk=user.pk)
+            .values(
+                income_total=per_user(
+                    rollups.filter(kind=Category.CategoryType.INCOME),
+                    Sum("total"),
+                    money,
+                ),
+                expense_total=per_user(
+                    rollups.filter(kind=Category.CategoryType.EXPENSE),
+                    Sum("total"),
+                    money,
+                ),
+                number_of_budgets=per_user(
+                    Budget.objects.all(), Count("id"), IntegerField()
+                ),
+                number_of_goals=per_user(
+                    Goal.objects.all(), Count("id"), IntegerField()
+                ),
+            )
+            .get()
         )
+
+    def build_dashboard(self, user):
+        """Build the dashboard payload from the database."""
+
+        recent_expenses = (
+            Expense.objects.filter(user=user)
+            .select_related(*TRANSACTION_RELATED)
+            .order_by("-date")[:3]
+        )
+        recent_income = (
+            Income.objects.filter(user=user)
+            .select_related(*TRANSACTION_RELATED)
+            .order_by("-date")[:3]
+        )
+        recent_budgets = (
+            Budget.objects.filter(user=user)
+            .select_related("category")
+            .prefetch_related("checkpoints")
+            .order_by("-start_date")[:3]
+        )
+        recent_goals = Goal.objects.filter(user=user).order_by("deadline")[:3]
+        totals = self.summary_totals(user)
+        income_total = totals["income_total"]
+        expense_total = totals["expense_total"]
         net_total = income_total - expense_total
-        number_of_budgets = Budget.objects.filter(user=user).count()
-        number_of_goals = Goal.objects.filter(user=user).count()
 
         # Serialize the data
         recent_expenses_serializer = ExpenseSerializer(
@@ -177,7 +865,7 @@ class DashboardAPIView(APIView):
         recent_goals_serializer = GoalSerializer(recent_goals, many=True)
 
         # Numbers don't need serialization - use them directly
-        data = {
+        return {
             "recent_expenses": recent_expenses_serializer.data,
             "recent_income": recent_income_serializer.data,
             "recent_budgets": recent_budgets_serializer.data,
@@ -185,8 +873,83 @@ class DashboardAPIView(APIView):
             "income_total": income_total,
             "expense_total": expense_total,
             "net_total": net_total,
-            "number_of_budgets": number_of_budgets,
-            "number_of_goals": number_of_goals,
+            "number_of_budgets": totals["number_of_budgets"],
+            "number_of_goals": totals["number_of_goals"],
         }
 
-        return Response(data)
+
+# Delta sync resources: name -> (model, serializer, relations to join)
+SYNC_RESOURCES = {
+    "expenses": (Expense, ExpenseSerializer, TRANSACTION_RELATED),
+    "income": (Income, IncomeSerializer, TRANSACTION_RELATED),
+    "budgets": (Budget, BudgetSerializer, ("category",)),
+    "goals": (Goal, GoalSerializer, ()),
+    "projects": (Project, ProjectSerializer, ("client",)),
+    "clients": (Client, ClientSerializer, ()),
+    "recurring": (RecurringRule, RecurringRuleSerializer, ("category",)),
+}
+# Related sets the sync serializers read, per resource
+SYNC_PREFETCH = {"budgets": ("checkpoints",)}
+
+
+class SyncAPIView(APIView):
+    """
+    API endpoint that returns the user's rows changed or deleted since a
+    sync token, across every resource type.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Return changes since ``?since=<token>`` (everything without it)."""
+
+        now = timezone.now()
+        cutoff = None
+        token = request.query_params.get("since")
+        if token:
+            try:
+                since = decode_sync_token(token)
+            except SyncTokenError as exc:
+                raise ValidationError({"since": [str(exc)]}) from exc
+            if is_expired(since, now):
+                return Response(
+                    {"detail": "Sync token expired; sync again without since."},
+                    status=status.HTTP_410_GONE,
+                )
+            cutoff = since - SYNC_OVERLAP
+
+        changed = {}
+        for name, (model, serializer_class, related) in SYNC_RESOURCES.items():
+            queryset = (
+                model.objects.filter(user=request.user)
+                .select_related(*related)
+                .prefetch_related(*SYNC_PREFETCH.get(name, ()))
+                .order_by("updated_at", "pk")
+            )
+            if cutoff is not None:
+                queryset = queryset.filter(updated_at__gte=cutoff)
+            changed[name] = serializer_class(
+                queryset, many=True, context={"request": request}
+            ).data
+
+        deleted = {name: [] for name in SYNC_RESOURCES}
+        if cutoff is not None:
+            resources = {
+                model._meta.model_name: name
+                for name, (model, _, _) in SYNC_RESOURCES.items()
+            }
+            tombstones = Tombstone.objects.filter(
+                user=request.user, deleted_at__gte=cutoff
+            ).values_list("model", "object_id")
+            for model_name, object_id in tombstones:
+                if model_name in resources:
+                    deleted[resources[model_name]].append(object_id)
+
+        return Response(
+            {
+                "token": encode_sync_token(now),
+                "full": cutoff is None,
+                "changed": changed,
+                "deleted": deleted,
+            }
+        )
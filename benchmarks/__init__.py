@@ -0,0 +1,6 @@
+"""Standalone performance benchmarks for the api app.
+
+Run from the project root, e.g. ``python -m benchmarks.bench_pagination``.
+Each benchmark builds a throwaway test database so the development
+database is never touched.
+"""
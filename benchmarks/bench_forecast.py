@@ -0,0 +1,85 @@
+"""Time the all-users budget forecast against a per-budget loop.
+
+The forecast reads the daily spend of every active budget in one
+grouped query; the loop runs one aggregate per budget, as a naive
+nightly job would.
+"""
+
+# pylint: disable=no-member,import-outside-toplevel
+
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.common import (
+    bulk_transactions,
+    make_category,
+    make_user,
+    report,
+    test_database,
+)
+
+USERS = 200
+CATEGORIES = 20
+EXPENSES_PER_BUDGET = 100
+AS_OF = date(2015, 3, 10)
+
+
+def main():
+    from django.contrib.auth.models import User
+    from django.db.models import Sum
+
+    from api.forecasts import active_budgets, forecast
+    from api.models import Budget, Expense
+
+    with test_database():
+        categories = [make_category(f"Bench {i}") for i in range(CATEGORIES)]
+        for index in range(USERS):
+            user = make_user(f"bench{index}")
+            for category in categories:
+                bulk_transactions(Expense, user, category, EXPENSES_PER_BUDGET)
+        # Unique per category and period, so stagger the periods by user
+        Budget.objects.bulk_create(
+            (
+                Budget(
+                    user_id=user_id,
+                    category=category,
+                    start_date=date(2015, 1, 1) + timedelta(days=offset % 60),
+                    end_date=date(2015, 4, 30) + timedelta(days=offset),
+                    amount=Decimal(4_000 + 200 * index),
+                    remaining_amount=Decimal("0"),
+                    percentage=Decimal("0"),
+                )
+                for offset, user_id in enumerate(
+                    User.objects.values_list("pk", flat=True)
+                )
+                for index, category in enumerate(categories)
+            ),
+            batch_size=5000,
+        )
+        budgets = active_budgets(AS_OF)
+        count = budgets.count()
+
+        began = time.perf_counter()
+        for budget in budgets:
+            Expense.objects.filter(
+                user_id=budget.user_id,
+                category_id=budget.category_id,
+                date__range=(budget.start_date, AS_OF),
+            ).aggregate(total=Sum("amount"))
+        loop = time.perf_counter() - began
+
+        began = time.perf_counter()
+        at_risk = sum(row["at_risk"] for row in forecast(budgets, AS_OF))
+        batched = time.perf_counter() - began
+
+    report(
+        f"Budget forecast ({count:,} active budgets, {USERS} users)",
+        ("approach", "seconds"),
+        [("per-budget loop", loop), ("forecast", batched)],
+    )
+    print(f"  {at_risk:,} budgets at risk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time the CSV importer against posting the same rows one by one.
+
+The row-by-row cost is one ``POST /expenses/`` per row through the API
+(serializer validation, per-row lookups, save and totals upkeep),
+measured on a sample and extrapolated to the full file.
+"""
+
+# pylint: disable=no-member,import-outside-toplevel
+
+import io
+import time
+from datetime import date, timedelta
+
+from benchmarks.common import make_category, make_user, report, test_database
+
+ROWS = 50_000
+SAMPLE = 500
+CATEGORIES = 20
+
+
+def main():
+    from rest_framework.test import APIClient
+
+    from api.imports import TransactionImporter
+    from api.models import Expense
+
+    with test_database():
+        user = make_user()
+        categories = [make_category(f"Bench {i}") for i in range(CATEGORIES)]
+        start = date(2015, 1, 1)
+        rows = [
+            (start + timedelta(days=i % 3650), f"{(i % 500) + 1}.25", i % CATEGORIES)
+            for i in range(ROWS)
+        ]
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        began = time.perf_counter()
+        for day, amount, category in rows[:SAMPLE]:
+            client.post(
+                "/expenses/",
+                {
+                    "date": day.isoformat(),
+                    "amount": amount,
+                    "category_id": categories[category].pk,
+                },
+                format="json",
+            )
+        per_row = (time.perf_counter() - began) / SAMPLE
+        Expense.objects.all().delete()
+
+        text = "date,amount,category\n" + "".join(
+            f"{day.isoformat()},{amount},Bench {category}\n"
+            for day, amount, category in rows
+        )
+        began = time.perf_counter()
+        result = TransactionImporter(user, "expense").run(io.StringIO(text))
+        importer = time.perf_counter() - began
+
+    per_post = per_row * ROWS
+    report(
+        f"Expense import ({ROWS:,} rows)",
+        ("approach", "seconds", "speed-up"),
+        [
+            ("API POST loop*", per_post, 1.0),
+            ("importer", importer, per_post / importer),
+        ],
+    )
+    print(f"  * extrapolated from {SAMPLE:,} posts; importer created {result.created:,}")
+
+
+if __name__ == "__main__":
+    main()
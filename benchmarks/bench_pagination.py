@@ -0,0 +1,74 @@
+"""Compare keyset and OFFSET pagination latency as the table grows.
+
+Keyset pages should stay flat regardless of depth, while OFFSET pages get
+slower the deeper they are.
+"""
+
+# pylint: disable=no-member
+
+from benchmarks.common import (
+    bulk_transactions,
+    make_category,
+    make_user,
+    report,
+    test_database,
+    timed,
+)
+
+SIZES = (1_000, 10_000, 100_000)
+PAGE_SIZE = 50
+
+
+def main():
+    # pylint: disable=import-outside-toplevel,protected-access
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from api.models import Expense
+    from api.pagination import KeysetPagination
+
+    factory = APIRequestFactory()
+    rows = []
+    with test_database():
+        user = make_user()
+        category = make_category()
+        inserted = 0
+        for size in SIZES:
+            bulk_transactions(Expense, user, category, size - inserted)
+            inserted = size
+            queryset = Expense.objects.filter(user=user).order_by("-date", "-id")
+
+            paginator = KeysetPagination()
+            first = Request(factory.get("/expenses/", {"page_size": PAGE_SIZE}))
+            # Build a cursor pointing at the row just before the last page
+            boundary = queryset[size - PAGE_SIZE - 1]
+            paginator.ordering = paginator.get_ordering(queryset)
+            cursor = paginator.encode_cursor(
+                paginator._position(boundary), reverse=False
+            )
+            deep = Request(
+                factory.get("/expenses/", {"page_size": PAGE_SIZE, "cursor": cursor})
+            )
+
+            def keyset_first():
+                KeysetPagination().paginate_queryset(queryset, first)
+
+            def keyset_deep():
+                KeysetPagination().paginate_queryset(queryset, deep)
+
+            def offset_deep():
+                list(queryset[size - PAGE_SIZE : size])
+
+            rows.append(
+                (size, timed(keyset_first), timed(keyset_deep), timed(offset_deep))
+            )
+
+    report(
+        f"Pagination latency (ms, median, page_size={PAGE_SIZE})",
+        ("rows", "keyset first", "keyset last", "offset last"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
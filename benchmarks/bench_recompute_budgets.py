@@ -0,0 +1,76 @@
+"""Time ``recompute_budgets`` over 100k budgets against per-budget saves.
+
+Saving each budget runs one aggregate per budget; the command computes
+every budget's spend in a single query and writes in batches. The
+per-save cost is measured on a sample and extrapolated.
+"""
+
+# pylint: disable=no-member,import-outside-toplevel
+
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.common import (
+    bulk_transactions,
+    make_category,
+    make_user,
+    report,
+    test_database,
+)
+
+BUDGETS = 100_000
+CATEGORIES = 100
+EXPENSES = 200_000
+SAMPLE = 1_000
+
+
+def main():
+    from api.management.commands.recompute_budgets import recompute_budgets
+    from api.models import Budget, Expense
+
+    with test_database():
+        user = make_user()
+        categories = [make_category(f"Bench {i}") for i in range(CATEGORIES)]
+        for category in categories:
+            bulk_transactions(Expense, user, category, EXPENSES // CATEGORIES)
+        start = date(2015, 1, 1)
+        Budget.objects.bulk_create(
+            (
+                Budget(
+                    user=user,
+                    category=categories[i % CATEGORIES],
+                    start_date=start + timedelta(days=i // CATEGORIES),
+                    end_date=start + timedelta(days=i // CATEGORIES + 30),
+                    amount=Decimal("1000.00"),
+                    remaining_amount=Decimal("0"),
+                    percentage=Decimal("0"),
+                )
+                for i in range(BUDGETS)
+            ),
+            batch_size=5000,
+        )
+
+        sample = list(Budget.objects.order_by("pk")[:SAMPLE])
+        began = time.perf_counter()
+        for budget in sample:
+            budget.save()
+        per_save = (time.perf_counter() - began) / SAMPLE
+
+        began = time.perf_counter()
+        updated = recompute_budgets()
+        command = time.perf_counter() - began
+
+    report(
+        f"Budget recomputation ({BUDGETS:,} budgets, {EXPENSES:,} expenses)",
+        ("approach", "seconds"),
+        [
+            ("save() loop*", per_save * BUDGETS),
+            ("command", command),
+        ],
+    )
+    print(f"  * extrapolated from {SAMPLE:,} saves; command updated {updated:,}")
+
+
+if __name__ == "__main__":
+    main()
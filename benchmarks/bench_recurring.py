@@ -0,0 +1,80 @@
+"""Time ``materialize_recurring`` over 100k rules against per-row saves.
+
+Saving each occurrence updates its rollup and budgets row by row; the
+batched pass inserts every occurrence with ``bulk_create`` and applies
+the totals once per batch. The per-save cost is measured on a sample
+and extrapolated.
+"""
+
+# pylint: disable=no-member,import-outside-toplevel
+
+import time
+from datetime import date
+from decimal import Decimal
+
+from benchmarks.common import make_category, make_user, report, test_database
+
+USERS = 1_000
+RULES_PER_USER = 100
+CATEGORIES = 20
+SAMPLE = 1_000
+START = date(2024, 1, 1)
+
+
+def main():
+    from api.models import RecurringRule
+    from api.recurring import materialize_recurring
+
+    rules = USERS * RULES_PER_USER
+    with test_database():
+        categories = [make_category(f"Bench {i}") for i in range(CATEGORIES)]
+        users = [make_user(f"bench{i}") for i in range(USERS)]
+        # bulk_create skips save(), so next_date is set by hand
+        RecurringRule.objects.bulk_create(
+            (
+                RecurringRule(
+                    user=user,
+                    kind="EXPENSE",
+                    category=categories[i % CATEGORIES],
+                    amount=Decimal(f"{i % 50 + 1}.99"),
+                    frequency=RecurringRule.Frequency.MONTHLY,
+                    start_date=START.replace(day=i % 28 + 1),
+                    next_date=START.replace(day=i % 28 + 1),
+                )
+                for user in users
+                for i in range(RULES_PER_USER)
+            ),
+            batch_size=5000,
+        )
+
+        sample = list(RecurringRule.objects.order_by("pk")[:SAMPLE])
+        began = time.perf_counter()
+        for rule in sample:
+            rule.build_occurrence(rule.next_date).save()
+        per_save = (time.perf_counter() - began) / SAMPLE
+
+        began = time.perf_counter()
+        created = materialize_recurring(until=date(2024, 1, 31))
+        batched = time.perf_counter() - began
+
+        began = time.perf_counter()
+        rerun = materialize_recurring(until=date(2024, 1, 31))
+        repeat = time.perf_counter() - began
+
+    report(
+        f"Recurring materialization ({rules:,} rules, {USERS:,} users)",
+        ("approach", "seconds"),
+        [
+            ("save() loop*", per_save * rules),
+            ("batched", batched),
+            ("rerun", repeat),
+        ],
+    )
+    print(
+        f"  * extrapolated from {SAMPLE:,} saves; created {created:,}, "
+        f"rerun created {rerun:,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare JSON encode time and payload size for a 10k-row expense list.
+
+The list is serialized once with the nested ``ExpenseSerializer``; only
+rendering is timed, with DRF's ``JSONRenderer`` and ``FastJSONRenderer``.
+Payload sizes are reported raw and gzip-compressed the way
+``CompressionMiddleware`` sends them. A second table compares load and
+serialize time for the nested, flat (``?expand=``) and sparse
+(``?fields=``) shapes.
+"""
+
+# pylint: disable=no-member
+
+from benchmarks.common import (
+    bulk_transactions,
+    make_category,
+    make_user,
+    report,
+    test_database,
+    timed,
+)
+
+ROWS = 10_000
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    from django.utils.text import compress_string
+    from rest_framework.renderers import JSONRenderer
+
+    from api.models import Client, Expense, Project
+    from api.renderers import FastJSONRenderer, orjson
+    from api.serializers import ExpenseSerializer
+    from api.views import TRANSACTION_RELATED
+
+    with test_database():
+        user = make_user()
+        bulk_transactions(Expense, user, make_category(), ROWS)
+        client = Client.objects.create(
+            user=user, name="The Venue", email="bookings@venue.example"
+        )
+        project = Project.objects.create(
+            user=user, client=client, name="Debut Album", date_created="2015-01-01"
+        )
+        Expense.objects.filter(user=user).update(project=project, client=client)
+        queryset = Expense.objects.filter(user=user)
+        shapes = (
+            ("nested", queryset.select_related(*TRANSACTION_RELATED), None),
+            ("?expand=", queryset, (None, set())),
+            ("?fields=", queryset, ({"id", "amount", "date", "category_id"}, set())),
+        )
+        shape_rows = []
+        for name, rows_queryset, sparse in shapes:
+            context = {} if sparse is None else {"sparse": sparse}
+
+            def serialize(rows_queryset=rows_queryset, context=context):
+                return ExpenseSerializer(
+                    rows_queryset.all(), many=True, context=context
+                ).data
+
+            body = FastJSONRenderer().render(serialize())
+            shape_rows.append((name, timed(serialize, repeat=3), len(body) // 1024))
+        data = ExpenseSerializer(shapes[0][1].all(), many=True).data
+
+    rows = []
+    for name, renderer in (
+        ("JSONRenderer", JSONRenderer()),
+        ("FastJSON", FastJSONRenderer()),
+    ):
+        body = renderer.render(data)
+        rows.append(
+            (
+                name,
+                timed(lambda renderer=renderer: renderer.render(data)),
+                len(body) // 1024,
+                len(compress_string(body)) // 1024,
+            )
+        )
+
+    report(
+        f"Loading and serializing {ROWS} expenses by response shape",
+        ("shape", "serialize ms", "raw KiB"),
+        shape_rows,
+    )
+    report(
+        f"Rendering {ROWS} nested expenses (orjson installed: {orjson is not None})",
+        ("renderer", "encode ms", "raw KiB", "gzip KiB"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
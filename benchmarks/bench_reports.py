@@ -0,0 +1,89 @@
+"""Time the time-series report over 100k expenses and income.
+
+Ten years of rows are bulk-inserted and the rollups rebuilt. Each period
+is reported over the last year of data and over all ten years; monthly
+and longer periods read the rollups, daily and weekly ones sum rows.
+The category x period pivot is timed over the same ranges.
+"""
+
+# pylint: disable=no-member
+
+from datetime import date
+from io import StringIO
+
+from benchmarks.common import (
+    bulk_transactions,
+    make_category,
+    make_user,
+    report,
+    test_database,
+    timed,
+)
+
+ROWS = 50_000
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    from django.core.management import call_command
+
+    from api.models import Expense, Income
+    from api.reports import REPORT_PERIODS, count_buckets, pivot, timeseries
+
+    with test_database():
+        user = make_user()
+        for index in range(10):
+            bulk_transactions(
+                Expense, user, make_category(f"Bench {index}"), ROWS // 10
+            )
+        bulk_transactions(
+            Income, user, make_category("Bench Income", "INCOME"), ROWS
+        )
+        call_command("rebuild_rollups", stdout=StringIO())
+
+        rows, pivot_rows = [], []
+        for label, date_from, date_to in (
+            ("last year", date(2024, 1, 1), date(2024, 12, 28)),
+            ("ten years", date(2015, 1, 1), date(2024, 12, 28)),
+        ):
+            for period in REPORT_PERIODS:
+                if count_buckets(date_from, date_to, period) > 1000:
+                    continue
+                rows.append(
+                    (
+                        label,
+                        period,
+                        count_buckets(date_from, date_to, period),
+                        timed(
+                            lambda period=period, date_from=date_from, date_to=date_to: (
+                                timeseries(user, period, date_from, date_to)
+                            )
+                        ),
+                    )
+                )
+                pivot_rows.append(
+                    (
+                        label,
+                        period,
+                        timed(
+                            lambda period=period, date_from=date_from, date_to=date_to: (
+                                pivot(user, "expense", period, date_from, date_to)
+                            )
+                        ),
+                    )
+                )
+
+    report(
+        f"Time-series report over {2 * ROWS} expenses and income",
+        ("range", "period", "buckets", "ms"),
+        rows,
+    )
+    report(
+        "Category x period pivot of the expenses (10 categories)",
+        ("range", "period", "ms"),
+        pivot_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Shared helpers for the benchmark scripts."""
+
+# pylint: disable=no-member,import-outside-toplevel
+
+import os
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from statistics import median
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "expense_tracker.settings")
+django.setup()
+
+
+@contextmanager
+def test_database():
+    """Create a throwaway test database for the duration of the block."""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def timed(func, repeat=5):
+    """Return the median wall-clock time of ``func`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return median(samples)
+
+
+def make_user(username="bench"):
+    """Create a benchmark user without paying for password hashing."""
+    from django.contrib.auth.models import User
+
+    user = User(username=username)
+    user.set_unusable_password()
+    user.save()
+    return user
+
+
+def make_category(name="Bench", category_type="EXPENSE"):
+    """Return a category, creating it if needed."""
+    from api.models import Category
+
+    category, _ = Category.objects.get_or_create(
+        name=name, category_type=category_type
+    )
+    return category
+
+
+def bulk_transactions(model, user, category, count, start=date(2015, 1, 1)):
+    """Insert ``count`` rows of ``model`` spread over consecutive days."""
+    batch = [
+        model(
+            user=user,
+            category=category,
+            amount=Decimal(f"{(i % 500) + 1}.25"),
+            date=start + timedelta(days=i % 3650),
+            note=f"row {i}",
+        )
+        for i in range(count)
+    ]
+    model.objects.bulk_create(batch, batch_size=2000)
+
+
+def report(title, header, rows):
+    """Print a small fixed-width table."""
+    print(f"\n{title}")
+    print("  ".join(f"{h:>14}" for h in header))
+    for row in rows:
+        print(
+            "  ".join(
+                f"{v:>14.2f}" if isinstance(v, float) else f"{v:>14}" for v in row
+            )
+        )
@@ -29,9 +29,16 @@ from api.views import (
     BudgetViewSet,
     GoalViewSet,
     DashboardAPIView,
+    LedgerAPIView,
+    LedgerBalanceAPIView,
+    LedgerExportAPIView,
+    SyncAPIView,
+    PivotReportAPIView,
+    TimeSeriesReportAPIView,
     CategoryViewSet,
     ProjectViewSet,
     ClientViewSet,
+    RecurringRuleViewSet,
 )
 
 
@@ -43,6 +50,7 @@ router.register(r"goals", GoalViewSet)
 router.register(r"categories", CategoryViewSet)
 router.register(r"projects", ProjectViewSet)
 router.register(r"clients", ClientViewSet)
+router.register(r"recurring", RecurringRuleViewSet)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -50,5 +58,15 @@ urlpatterns = [
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("api/dashboard/", DashboardAPIView.as_view(), name="dashboard-api"),
+    path("ledger/", LedgerAPIView.as_view(), name="ledger"),
+    path("ledger/balance/", LedgerBalanceAPIView.as_view(), name="ledger-balance"),
+    path("ledger/export/", LedgerExportAPIView.as_view(), name="ledger-export"),
+    path(
+        "reports/timeseries/",
+        TimeSeriesReportAPIView.as_view(),
+        name="reports-timeseries",
+    ),
+    path("reports/pivot/", PivotReportAPIView.as_view(), name="reports-pivot"),
+    path("sync/", SyncAPIView.as_view(), name="sync"),
     path("", include(router.urls)),
 ]
@@ -1,12 +1,13 @@
 import { useEffect, useState } from 'react'
 import { Link } from 'react-router-dom'
-import { fetchExpenses, fetchCategories } from '../services/api'
+import { fetchExpenses, fetchCategories, cursorFromLink } from '../services/api'
 import FilterBar from '../components/FilterBar'
 import '../styles/Transactions.css'
 
+const PAGE_SIZE = 50
+
 function ExpenseList() {
 
-  // const [expenses, setExpenses] = useState([])
   const [categories, setCategories] = useState([])
 
   // Filter state
@@ -21,89 +22,51 @@ function ExpenseList() {
     sortOrder: 'desc'
   })
 
-  // Original data (from API)
-  const [allExpenses, setAllExpenses] = useState([])
+  // Rows loaded so far for the current filters (filtered and sorted by the API)
+  const [expenses, setExpenses] = useState([])
 
-  // Filtered/displayed data
-  const [filteredExpenses, setFilteredExpenses] = useState([])
+  // Cursor for the next page, or null when everything has been loaded
+  const [nextCursor, setNextCursor] = useState(null)
 
   useEffect(() => {
-    fetchExpenses()
-      .then(setAllExpenses)
-      .catch(console.error)
-
     fetchCategories('EXPENSE')
       .then(setCategories)
       .catch(console.error)
   }, [])
 
+  // Refetch the first page whenever the filters change. The short delay
+  // avoids a request per keystroke while typing in the search box.
   useEffect(() => {
-    applyFilters()
-  }, [allExpenses, filters])
+    let ignore = false
+
+    const timer = setTimeout(() => {
+      fetchExpenses(filters, null, PAGE_SIZE)
+        .then((page) => {
+          if (ignore) return
+          setExpenses(page.results)
+          setNextCursor(cursorFromLink(page.next))
+        })
+        .catch(console.error)
+    }, 250)
+
+    return () => {
+      ignore = true
+      clearTimeout(timer)
+    }
+  }, [filters])
 
   // Handler that updates filters state
   const handleFilterChange = (newFilters) => {
     setFilters(newFilters)
   }
 
-  const applyFilters = () => {
-    let filtered = [...allExpenses]
-
-    if (filters.category && filters.category !== 'all') {
-      filtered = filtered.filter((expense) => {
-        return expense.category.id === parseInt(filters.category)
-      })
-    }
-
-    if (filters.dateFrom) {
-      filtered = filtered.filter((expense) => {
-        return expense.date >= filters.dateFrom
-      })
-    }
-
-    if (filters.dateTo) {
-      filtered = filtered.filter((expense) => {
-        return expense.date <= filters.dateTo
-      })
-    }
-
-    if (filters.amountMin) {
-      filtered = filtered.filter((expense) => {
-        return parseFloat(expense.amount) >= parseFloat(filters.amountMin)
-      })
-    }
-
-    if (filters.amountMax) {
-      filtered = filtered.filter((expense) => {
-        return parseFloat(expense.amount) <= parseFloat(filters.amountMax)
-      })
-    }
-
-    if (filters.searchText) {
-      filtered = filtered.filter((expense) => {
-        return expense.note?.toLowerCase().includes(filters.searchText.toLowerCase())
-      })
-    }
-
-    if (filters.sortBy == 'date') {
-      filtered.sort((a, b) => {
-        const dateA = new Date(a.date)
-        const dateB = new Date(b.date)
-        const comparison = dateA - dateB
-        return filters.sortOrder === 'desc' ? -comparison : comparison
-      })
-    }
-
-    if (filters.sortBy == 'amount') {
-      filtered.sort((a, b) => {
-        const amountA = parseFloat(a.amount)
-        const amountB = parseFloat(b.amount)
-        const comparison = amountA - amountB
-        return filters.sortOrder === 'desc' ? -comparison : comparison
+  const loadMore = () => {
+    fetchExpenses(filters, nextCursor, PAGE_SIZE)
+      .then((page) => {
+        setExpenses((loaded) => [...loaded, ...page.results])
+        setNextCursor(cursorFromLink(page.next))
       })
-    }
-
-    setFilteredExpenses(filtered)
+      .catch(console.error)
   }
 
 
@@ -117,9 +80,9 @@ function ExpenseList() {
         categories={categories}
       />
 
-      {filteredExpenses.length > 0 ? (
+      {expenses.length > 0 ? (
         <ul>
-          {filteredExpenses.map((expense) => (
+          {expenses.map((expense) => (
             <li key={expense.id}>
               <Link to={`/expenses/${expense.id}`}>
                 <article className="expense-item">
@@ -136,9 +99,14 @@ function ExpenseList() {
       ) : (
         <p>No expenses yet.</p>
       )}
+
+      {nextCursor && (
+        <button type="button" className="load-more" onClick={loadMore}>
+          Load more
+        </button>
+      )}
     </section>
   )
 }
 
 export default ExpenseList;
-
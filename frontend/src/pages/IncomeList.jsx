@@ -1,11 +1,13 @@
 import { useEffect, useState } from 'react'
 import { Link } from 'react-router-dom'
-import { fetchIncomes, fetchCategories } from '../services/api'
+import { fetchIncomes, fetchCategories, cursorFromLink } from '../services/api'
 import FilterBar from '../components/FilterBar'
 import '../styles/Transactions.css'
 
+const PAGE_SIZE = 50
+
 function IncomeList() {
-  // const [incomes, setIncomes] = useState([])
+
   const [categories, setCategories] = useState([])
 
   // Filter state
@@ -20,123 +22,91 @@ function IncomeList() {
     sortOrder: 'desc'
   })
 
-  // Original data (from API)
-  const [allIncome, setAllIncome] = useState([])
+  // Rows loaded so far for the current filters (filtered and sorted by the API)
+  const [income, setIncome] = useState([])
 
-  // Filtered/displayed data
-  const [filteredIncome, setFilteredIncome] = useState([])
+  // Cursor for the next page, or null when everything has been loaded
+  const [nextCursor, setNextCursor] = useState(null)
 
   useEffect(() => {
-    fetchIncomes()
-      .then(setAllIncome)
-      .catch(console.error)
-
     fetchCategories('INCOME')
       .then(setCategories)
       .catch(console.error)
   }, [])
 
+  // Refetch the first page whenever the filters change. The short delay
+  // avoids a request per keystroke while typing in the search box.
   useEffect(() => {
-    applyFilters()
-  }, [allIncome, filters])
+    let ignore = false
+
+    const timer = setTimeout(() => {
+      fetchIncomes(filters, null, PAGE_SIZE)
+        .then((page) => {
+          if (ignore) return
+          setIncome(page.results)
+          setNextCursor(cursorFromLink(page.next))
+        })
+        .catch(console.error)
+    }, 250)
+
+    return () => {
+      ignore = true
+      clearTimeout(timer)
+    }
+  }, [filters])
 
   // Handler that updates filters state
   const handleFilterChange = (newFilters) => {
     setFilters(newFilters)
   }
 
-  const applyFilters = () => {
-    let filtered = [...allIncome]
-
-    if (filters.category && filters.category !== 'all') {
-      filtered = filtered.filter((income) => {
-        return income.category.id === parseInt(filters.category)
-      })
-    }
-
-    if (filters.dateFrom) {
-      filtered = filtered.filter((income) => {
-        return income.date >= filters.dateFrom
-      })
-    }
-
-    if (filters.dateTo) {
-      filtered = filtered.filter((income) => {
-        return income.date <= filters.dateTo
-      })
-    }
-
-    if (filters.amountMin) {
-      filtered = filtered.filter((income) => {
-        return parseFloat(income.amount) >= parseFloat(filters.amountMin)
-      })
-    }
-
-    if (filters.amountMax) {
-      filtered = filtered.filter((income) => {
-        return parseFloat(income.amount) <= parseFloat(filters.amountMax)
-      })
-    }
-
-    if (filters.searchText) {
-      filtered = filtered.filter((income) => {
-        return income.note?.toLowerCase().includes(filters.searchText.toLowerCase())
-      })
-    }
-
-    if (filters.sortBy == 'date') {
-      filtered.sort((a, b) => {
-        const dateA = new Date(a.date)
-        const dateB = new Date(b.date)
-        const comparison = dateA - dateB
-        return filters.sortOrder === 'desc' ? -comparison : comparison
+  const loadMore = () => {
+    fetchIncomes(filters, nextCursor, PAGE_SIZE)
+      .then((page) => {
+        setIncome((loaded) => [...loaded, ...page.results])
+        setNextCursor(cursorFromLink(page.next))
       })
-    }
-
-    if (filters.sortBy == 'amount') {
-      filtered.sort((a, b) => {
-        const amountA = parseFloat(a.amount)
-        const amountB = parseFloat(b.amount)
-        const comparison = amountA - amountB
-        return filters.sortOrder === 'desc' ? -comparison : comparison
-      })
-    }
-
-    setFilteredIncome(filtered)
-  }
-
-    return (
-      <section className="section-listing">
-        <h1>Income</h1>
-
-        <FilterBar
-          filters={filters}
-          onFilterChange={handleFilterChange}
-          categories={categories}
-        />
-
-        {filteredIncome.length > 0 ? (
-          <ul>
-            {filteredIncome.map((income) => (
-              <li key={income.id}>
-                <Link to={`/income/${income.id}`}>
-                  <article className="income-item">
-                    <h2>{income.category.name}</h2>
-                    <p className="meta">
-                      <strong>Date:</strong> {income.date} · <strong>Amount:</strong> ${income.amount}
-                    </p>
-                    <p>{income.note || 'No note provided.'}</p>
-                  </article>
-                </Link>
-              </li>
-            ))}
-          </ul>
-        ) : (
-          <p>No income yet.</p>
-        )}
-      </section>
-    )
+      .catch(console.error)
   }
 
-  export default IncomeList
 
+  return (
+    <section className="section-listing">
+      <h1>Income</h1>
+
+      <FilterBar
+        filters={filters}
+        onFilterChange={handleFilterChange}
+        categories={categories}
+      />
+
+      {income.length > 0 ? (
+        <ul>
+          {income.map((income) => (
+            <li key={income.id}>
+              <Link to={`/income/${income.id}`}>
+                <article className="income-item">
+                  <h2>{income.category.name}</h2>
+                  <p className="meta">
+                    <strong>Date:</strong> {income.date} · <strong>Amount:</strong> ${income.amount}
+                  </p>
+                  <p>{income.note || 'No note provided.'}</p>
+                </article>
+              </Link>
+            </li>
+          ))}
+        </ul>
+      ) : (
+        <p>No income yet.</p>
+      )}
+
+      {nextCursor && (
+        <button type="button" className="load-more" onClick={loadMore}>
+          Load more
+        </button>
+      )}
+    </section>
+  )
+}
+
+export default IncomeList;
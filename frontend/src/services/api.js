@@ -109,12 +109,43 @@ async function fetchDashboardData() {
   return await apiRequest("/api/dashboard/")
 }
 
-async function fetchExpenses() {
-  return await apiRequest("/expenses/")
+// Map FilterBar state onto the list endpoint query parameters
+function buildTransactionQuery(filters = {}, cursor = null, pageSize = null) {
+  const params = new URLSearchParams()
+
+  if (filters.category && filters.category !== 'all') params.set('category', filters.category)
+  if (filters.dateFrom) params.set('date_from', filters.dateFrom)
+  if (filters.dateTo) params.set('date_to', filters.dateTo)
+  if (filters.amountMin) params.set('amount_min', filters.amountMin)
+  if (filters.amountMax) params.set('amount_max', filters.amountMax)
+  if (filters.searchText) params.set('q', filters.searchText)
+  if (filters.sortBy) params.set('sort', filters.sortBy)
+  if (filters.sortOrder) params.set('order', filters.sortOrder)
+  if (pageSize) params.set('page_size', pageSize)
+  if (cursor) params.set('cursor', cursor)
+
+  const query = params.toString()
+  return query ? `?${query}` : ''
+}
+
+// Pull the opaque cursor out of a "next" link returned by the API
+function cursorFromLink(link) {
+  if (!link) return null
+  return new URL(link).searchParams.get('cursor')
+}
+
+async function fetchExpenses(filters = {}, cursor = null, pageSize = null) {
+  return await apiRequest(`/expenses/${buildTransactionQuery(filters, cursor, pageSize)}`)
+}
+
+async function fetchIncomes(filters = {}, cursor = null, pageSize = null) {
+  return await apiRequest(`/income/${buildTransactionQuery(filters, cursor, pageSize)}`)
 }
 
-async function fetchIncomes() {
-  return await apiRequest("/income/")
+// Pass the token from the previous response to receive only what changed
+async function fetchSync(since = null) {
+  const query = since ? `?since=${encodeURIComponent(since)}` : ''
+  return apiRequest(`/sync/${query}`)
 }
 
 async function fetchBudgets() {
@@ -334,6 +365,21 @@ async function deleteIncome(id) {
   });
 }
 
+// operations: { create: [...], update: [{ id, ...changes }], delete: [ids] }
+async function batchExpenses(operations) {
+  return apiRequest("/expenses/batch/", {
+    method: 'POST',
+    body: JSON.stringify(operations)
+  });
+}
+
+async function batchIncomes(operations) {
+  return apiRequest("/income/batch/", {
+    method: 'POST',
+    body: JSON.stringify(operations)
+  });
+}
+
 async function deleteBudget(id) {
   await apiRequest(`/budgets/${id}/`, {
     method: 'DELETE'
@@ -384,8 +430,10 @@ export {
   apiRequest,
   API_BASE_URL,
   fetchDashboardData,
+  cursorFromLink,
   fetchExpenses,
   fetchIncomes,
+  fetchSync,
   fetchBudgets,
   fetchGoals,
   fetchProjects,
@@ -413,6 +461,8 @@ export {
   createGoal,
   deleteExpense,
   deleteIncome,
+  batchExpenses,
+  batchIncomes,
   deleteBudget,
   deleteGoal,
   deleteProject,